@@ -0,0 +1,394 @@
+"""
+Actuation Module (Modul Aktuasi Mouse)
+
+Backend aktuasi yang bisa diganti dengan antarmuka yang sama (move, click, doubleClick, toggle,
+scroll, screenSize, sync, close):
+
+- "autopy"    : autopy untuk gerak/klik, pyautogui untuk scroll (perilaku lama, tanpa jeda pyautogui).
+- "pyautogui" : pyautogui saja, dengan PAUSE per panggilan dimatikan.
+- "xtest"     : X11 XTest langsung lewat python-xlib; satu flush ke server X per batch.
+- "uinput"    : perangkat virtual Linux lewat python-evdev; satu SYN_REPORT per batch.
+- "recording" : backend tiruan yang hanya mencatat panggilan, untuk pengujian tanpa desktop.
+
+CoalescingActuator membungkus backend: gerakan kursor dirapatkan menjadi posisi terakhir saja,
+delta scroll pecahan diakumulasi, dan backend dipanggil paling banyak sekali per refresh layar.
+
+    actuator = CoalescingActuator(createBackend("xtest"), rate=60)
+"""
+
+import threading  # Library untuk thread pengirim batch
+import time  # Library untuk mengakses waktu
+
+
+# Kelas dasar backend; sync() dipanggil sekali setelah setiap batch aksi.
+class Backend():
+    def screenSize(self):
+        raise NotImplementedError
+
+    def sync(self):
+        pass
+
+    def close(self):
+        pass
+
+
+# Backend autopy (gerak dan klik) dan pyautogui (scroll).
+class AutopyBackend(Backend):
+    def __init__(self):
+        import autopy  # Library untuk mengontrol mouse
+        import pyautogui  # Library untuk scroll
+        self.autopy = autopy
+        self.pyautogui = pyautogui
+
+    def screenSize(self):
+        return self.autopy.screen.size()
+
+    def move(self, x, y):
+        self.autopy.mouse.move(x, y)
+
+    def click(self, button="left"):
+        self.autopy.mouse.click(self._button(button))
+
+    def doubleClick(self, button="left"):
+        self.autopy.mouse.click(self._button(button))
+        self.autopy.mouse.click(self._button(button))
+
+    def toggle(self, button="left", down=True):
+        self.autopy.mouse.toggle(self._button(button), down=down)
+
+    def scroll(self, amount):
+        self.pyautogui.scroll(amount, _pause=False)  # Tanpa jeda bawaan pyautogui (0.1 detik per panggilan)
+
+    def _button(self, button):
+        return self.autopy.mouse.Button.RIGHT if button == "right" else self.autopy.mouse.Button.LEFT
+
+
+# Backend pyautogui saja.
+class PyAutoGuiBackend(Backend):
+    def __init__(self, failSafe=True):
+        """
+        :param failSafe: Jika True, kursor di pojok layar menghentikan program (fitur keamanan pyautogui).
+        """
+        import pyautogui  # Library untuk mengontrol mouse
+        self.pyautogui = pyautogui
+        pyautogui.FAILSAFE = failSafe
+
+    def screenSize(self):
+        return tuple(self.pyautogui.size())
+
+    def move(self, x, y):
+        self.pyautogui.moveTo(x, y, _pause=False)
+
+    def click(self, button="left"):
+        self.pyautogui.click(button=button, _pause=False)
+
+    def doubleClick(self, button="left"):
+        self.pyautogui.click(button=button, clicks=2, _pause=False)
+
+    def toggle(self, button="left", down=True):
+        if down:
+            self.pyautogui.mouseDown(button=button, _pause=False)
+        else:
+            self.pyautogui.mouseUp(button=button, _pause=False)
+
+    def scroll(self, amount):
+        self.pyautogui.scroll(amount, _pause=False)
+
+
+# Backend X11 XTest: event dikirim ke buffer Xlib dan dikirim sekaligus saat sync().
+class XTestBackend(Backend):
+    BUTTONS = {"left": 1, "right": 3}
+
+    def __init__(self, displayName=None):
+        from Xlib import X, display  # Library klien X11 (python-xlib)
+        from Xlib.ext import xtest
+        self.X = X
+        self.xtest = xtest
+        self.display = display.Display(displayName)
+
+    def screenSize(self):
+        screen = self.display.screen()
+        return screen.width_in_pixels, screen.height_in_pixels
+
+    def move(self, x, y):
+        self.xtest.fake_input(self.display, self.X.MotionNotify, x=int(x), y=int(y))
+
+    def click(self, button="left"):
+        self.toggle(button, True)
+        self.toggle(button, False)
+
+    def doubleClick(self, button="left"):
+        self.click(button)
+        self.click(button)
+
+    def toggle(self, button="left", down=True):
+        event = self.X.ButtonPress if down else self.X.ButtonRelease
+        self.xtest.fake_input(self.display, event, self.BUTTONS[button])
+
+    def scroll(self, amount):
+        # Tombol 4 = roda ke atas, 5 = ke bawah; satu klik roda per unit.
+        button = 4 if amount > 0 else 5
+        for _ in range(abs(int(amount))):
+            self.xtest.fake_input(self.display, self.X.ButtonPress, button)
+            self.xtest.fake_input(self.display, self.X.ButtonRelease, button)
+
+    def sync(self):
+        self.display.flush()
+
+    def close(self):
+        self.display.close()
+
+
+# Backend uinput: perangkat pointer absolut virtual di kernel Linux (butuh izin tulis /dev/uinput).
+class UinputBackend(Backend):
+    def __init__(self, screenSize=(1920, 1080), name="ai-virtual-mouse"):
+        """
+        :param screenSize: Ukuran layar; dipakai sebagai rentang sumbu absolut perangkat.
+        """
+        from evdev import AbsInfo, UInput, ecodes  # Library evdev/uinput (python-evdev)
+        self.e = ecodes
+        self.size = tuple(screenSize)
+        w, h = self.size
+        capabilities = {
+            ecodes.EV_KEY: [ecodes.BTN_LEFT, ecodes.BTN_RIGHT],
+            ecodes.EV_ABS: [(ecodes.ABS_X, AbsInfo(0, 0, w - 1, 0, 0, 0)),
+                            (ecodes.ABS_Y, AbsInfo(0, 0, h - 1, 0, 0, 0))],
+            ecodes.EV_REL: [ecodes.REL_WHEEL],
+        }
+        self.device = UInput(capabilities, name=name)
+        self.buttons = {"left": ecodes.BTN_LEFT, "right": ecodes.BTN_RIGHT}
+
+    def screenSize(self):
+        return self.size
+
+    def move(self, x, y):
+        self.device.write(self.e.EV_ABS, self.e.ABS_X, int(x))
+        self.device.write(self.e.EV_ABS, self.e.ABS_Y, int(y))
+
+    def click(self, button="left"):
+        # Tekan dan lepas harus berada di laporan SYN terpisah agar dikenali sebagai klik.
+        self.toggle(button, True)
+        self.device.syn()
+        self.toggle(button, False)
+
+    def doubleClick(self, button="left"):
+        self.click(button)
+        self.device.syn()
+        self.click(button)
+
+    def toggle(self, button="left", down=True):
+        self.device.write(self.e.EV_KEY, self.buttons[button], 1 if down else 0)
+
+    def scroll(self, amount):
+        self.device.write(self.e.EV_REL, self.e.REL_WHEEL, int(amount))
+
+    def sync(self):
+        self.device.syn()
+
+    def close(self):
+        self.device.close()
+
+
+# Backend tiruan yang hanya mencatat panggilan, untuk pengujian tanpa desktop.
+class RecordingBackend(Backend):
+    def __init__(self, clock=time.monotonic, screenSize=(1920, 1080)):
+        self.clock = clock
+        self.size = tuple(screenSize)
+        self.calls = []  # Daftar (waktu, nama_aksi, argumen)
+        self.syncs = 0  # Jumlah batch yang dikirim
+
+    def screenSize(self):
+        return self.size
+
+    def move(self, x, y):
+        self.calls.append((self.clock(), "move", (x, y)))
+
+    def click(self, button="left"):
+        self.calls.append((self.clock(), "click", (button,)))
+
+    def doubleClick(self, button="left"):
+        self.calls.append((self.clock(), "doubleClick", (button,)))
+
+    def toggle(self, button="left", down=True):
+        self.calls.append((self.clock(), "toggle", (button, down)))
+
+    def scroll(self, amount):
+        self.calls.append((self.clock(), "scroll", (amount,)))
+
+    def sync(self):
+        self.syncs += 1
+
+    def count(self, name):
+        return sum(1 for call in self.calls if call[1] == name)
+
+
+# Registri backend untuk pemilihan lewat konfigurasi.
+BACKENDS = {
+    "autopy": AutopyBackend,
+    "pyautogui": PyAutoGuiBackend,
+    "xtest": XTestBackend,
+    "uinput": UinputBackend,
+    "recording": RecordingBackend,
+}
+
+
+def createBackend(name, **params):
+    # Membuat backend berdasarkan nama (lihat BACKENDS). Konstruktor dipanggil di luar try agar KeyError
+    # di dalamnya tidak dilaporkan sebagai nama backend yang tidak dikenal.
+    try:
+        cls = BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Backend aktuasi tidak dikenal: {name!r} (pilihan: {', '.join(BACKENDS)})") from None
+    return cls(**params)
+
+
+# Kelas CoalescingActuator mengumpulkan aksi dan mengirimnya ke backend dalam batch per refresh layar.
+class CoalescingActuator():
+    fractionalScroll = True  # scroll() menerima nilai pecahan; sisa pecahan dibawa ke batch berikutnya
+
+    def __init__(self, backend, rate=60.0, threaded=True, profiler=None, clock=time.monotonic):
+        """
+        :param backend: Backend aktuasi (lihat BACKENDS).
+        :param rate: Batas batch per detik, biasanya refresh rate layar. Gerakan di antara dua batch dirapatkan.
+        :param threaded: Jika True, batch dikirim oleh thread latar belakang; jika False, dikirim langsung di
+                         thread pemanggil saat jadwalnya tiba (deterministik untuk replay dan pengujian).
+        :param profiler: StageProfiler opsional (ProfilerModule) untuk mengukur tahap "actuation" per batch.
+        :param clock: Fungsi waktu (detik); bisa diganti FakeClock untuk pengujian.
+        """
+        self.backend = backend
+        self.period = 1.0 / rate if rate else 0.0
+        self.profiler = profiler
+        self.clock = clock
+        self._cond = threading.Condition()
+        self._events = []  # Aksi diskret (klik, toggle) berurutan, dengan gerakan yang mendahuluinya
+        self._move = None  # Posisi kursor terakhir yang belum dikirim
+        self._scroll = 0.0  # Akumulasi scroll yang belum dikirim (termasuk pecahan)
+        self._lastFlush = float("-inf")
+        self._stopped = False
+        self.movesIn = 0  # Gerakan yang diterima dari controller
+        self.movesOut = 0  # Gerakan yang benar-benar dikirim ke backend
+        self.batches = 0
+        self.errors = 0
+        self._thread = None
+        if threaded:
+            self._thread = threading.Thread(target=self._run, name="actuation", daemon=True)
+            self._thread.start()
+
+    def screenSize(self):
+        return self.backend.screenSize()
+
+    def move(self, x, y):
+        with self._cond:
+            self._move = (x, y)
+            self.movesIn += 1
+            self._cond.notify()
+        self._poll()
+
+    def scroll(self, amount):
+        with self._cond:
+            self._scroll += amount
+            self._cond.notify()
+        self._poll()
+
+    def click(self, button="left"):
+        self._event("click", (button,))
+
+    def doubleClick(self, button="left"):
+        self._event("doubleClick", (button,))
+
+    def toggle(self, button="left", down=True):
+        self._event("toggle", (button, down))
+
+    def _event(self, name, args):
+        # Aksi diskret tidak pernah dirapatkan dan dikirim tanpa menunggu jadwal refresh,
+        # tetapi gerakan yang tertunda dikirim lebih dulu agar klik terjadi di posisi yang benar.
+        with self._cond:
+            if self._move is not None:
+                self._events.append(("move", self._move))
+                self._move = None
+            self._events.append((name, args))
+            self._cond.notify()
+        self._poll()
+
+    def _due(self, now):
+        # True jika ada yang harus dikirim sekarang (dipanggil dengan kunci dipegang).
+        if self._events:
+            return True
+        if self._move is None and abs(self._scroll) < 1:
+            return False
+        # Toleransi 1 µs agar galat pembulatan waktu frame tidak melewatkan satu jadwal refresh.
+        return now - self._lastFlush >= self.period - 1e-6
+
+    def _take(self, now):
+        batch, self._events = self._events, []
+        if self._move is not None:
+            batch.append(("move", self._move))
+            self._move = None
+        whole = int(self._scroll)  # Pembulatan ke arah nol; sisa pecahan tetap diakumulasi
+        if whole:
+            batch.append(("scroll", (whole,)))
+            self._scroll -= whole
+        self._lastFlush = now
+        return batch
+
+    def _send(self, batch):
+        start = time.perf_counter()
+        for name, args in batch:
+            try:
+                getattr(self.backend, name)(*args)
+                if name == "move":
+                    self.movesOut += 1
+            except Exception:
+                # Kegagalan aktuasi (misal layar terkunci) tidak boleh menghentikan pengiriman.
+                self.errors += 1
+        try:
+            self.backend.sync()
+        except Exception:
+            self.errors += 1
+        self.batches += 1
+        if self.profiler is not None:
+            self.profiler.record("actuation", time.perf_counter() - start)
+
+    def _poll(self):
+        # Mode tanpa thread: kirim batch di thread pemanggil jika jadwalnya sudah tiba.
+        if self._thread is not None:
+            return
+        with self._cond:
+            now = self.clock()
+            batch = self._take(now) if self._due(now) else None
+        if batch:
+            self._send(batch)
+
+    def flush(self):
+        # Mengirim semua aksi yang tertunda sekarang juga, tanpa menunggu jadwal refresh.
+        with self._cond:
+            batch = self._take(self.clock())
+        if batch:
+            self._send(batch)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                now = self.clock()
+                while not self._stopped and not self._due(now):
+                    if self._events or self._move is not None or abs(self._scroll) >= 1:
+                        # Hanya gerak/scroll yang tertunda: tunggu sampai jadwal refresh berikutnya.
+                        self._cond.wait(max(0.0, self._lastFlush + self.period - now))
+                    else:
+                        self._cond.wait()
+                    now = self.clock()
+                if self._stopped:
+                    break
+                batch = self._take(now)
+            self._send(batch)
+
+    def stop(self, timeout=1.0):
+        # Menghentikan thread, mengirim sisa aksi, lalu menutup backend.
+        if self._thread is not None:
+            with self._cond:
+                self._stopped = True
+                self._cond.notify()
+            self._thread.join(timeout)
+            self._thread = None
+        self.flush()
+        self.backend.close()
@@ -1,223 +1,180 @@
 # Mengimpor library yang diperlukan
-import cv2
-import numpy as np
-import HandTrackingModule as htm # Modul kustom untuk mendeteksi tangan
+# cv2, mediapipe, autopy dan pyautogui tidak diimpor di sini: mereka dimuat oleh main() (mediapipe dan
+# library mouse di latar belakang sambil kamera dibuka), sehingga mengimpor modul ini (misal untuk membaca
+# konfigurasi) tetap cepat.
 import time
-import autopy  # Library untuk mengontrol mouse
-import pyautogui  # Library untuk screenshot
+from concurrent.futures import ThreadPoolExecutor  # Menjalankan inisialisasi berat secara bersamaan
+
+import ActuationModule as am # Modul kustom untuk backend aktuasi mouse (gerak dirapatkan per refresh layar)
+import HandTrackingModule as htm # Modul kustom untuk mendeteksi tangan
+import LazyImportModule as lim # Modul kustom untuk memuat OpenCV saat pertama dipakai
+import PipelineModule as plm # Modul kustom untuk pipeline capture/inferensi bertahap
+import PredictionModule as pm # Modul kustom untuk deteksi adaptif dengan prediksi landmark
+import FilterModule as fm # Modul kustom untuk filter penghalus kursor
+import ClickSchedulerModule as csm # Modul kustom untuk cooldown klik dan eksekusi aksi mouse di latar belakang
+import GestureControlModule as gcm # Modul kustom untuk mesin state gestur (mode, gerak, scroll, klik)
+import TraceModule as tm # Modul kustom untuk merekam jejak landmark
+import ProfilerModule as prm # Modul kustom untuk pengukuran waktu per tahap dan latensi
+import QualityControllerModule as qcm # Modul kustom untuk pengendali kualitas berbasis anggaran latensi
 
 ##########################
 # Pengaturan Awal
 wCam, hCam = 640, 480  # Lebar dan tinggi jendela kamera
 frameR = 100  # Frame Reduction: Mengurangi area aktif untuk kontrol mouse agar lebih stabil
-smoothening = 7  # Faktor untuk memperhalus gerakan mouse
+CURSOR_FILTER = "oneeuro"  # Filter penghalus kursor: "oneeuro", "kalman", "expdeadzone", atau "divisor" (lama)
+CURSOR_FILTER_PARAMS = {}  # Parameter khusus filter, misal {"minCutoff": 1.0, "beta": 0.007} atau {"smoothening": 7}
 SCROLL_SENSITIVITY = 0.2 # Kontrol kecepatan scroll. Semakin KECIL, semakin SENSITIF.
+VIDEO_SOURCE = 0 # Indeks webcam, atau path file video untuk pengujian tanpa kamera
+TARGET_CPU = None # Porsi CPU untuk inferensi (misal 0.5). None = detektor dijalankan setiap frame
+QUALITY_TARGET_MS = None # Anggaran waktu proses per frame (misal 33). Resolusi, ukuran input, model dan
+                         # interval deteksi lalu diatur otomatis; None = pengaturan tetap seperti di atas
+CLICK_COOLDOWNS = {"right": 0.5} # Jendela refraktori (detik) klik kanan berulang, pengganti time.sleep()
+DEFER_DOUBLE_CLICK = False # True = double tap jempol dikirim sebagai satu doubleClick, klik tunggal tertunda 0.3 detik
+RECORD_TRACE = None # Path .npz untuk merekam jejak landmark sesi ini, None = tidak merekam
+PROFILE_HUD = False # Tampilkan p50/p95/p99 per tahap di layar (tekan 'h' untuk mengganti)
+PROFILE_EXPORT = None # Path .csv atau .json untuk menyimpan ringkasan profil saat keluar
+ACTUATION_BACKEND = "autopy" # Backend mouse: "autopy", "pyautogui", "xtest" (X11) atau "uinput" (Linux)
+ACTUATION_RATE = 60 # Batas kirim aksi per detik, samakan dengan refresh rate layar
+HEADLESS = False # Mode layanan: tanpa jendela pratinjau, tanpa gambar, tanpa cv2.flip (hentikan dengan Ctrl+C)
 #########################
- 
-# Variabel Waktu dan Posisi
-pTime = 0
-plocX, plocY = 0, 0
-clocX, clocY = 0, 0
-last_scroll_y = None # Untuk melacak posisi Y terakhir saat scrolling
- 
-# Inisialisasi Webcam
-cap = cv2.VideoCapture(0)  # Menggunakan webcam utama (indeks 0)
-cap.set(3, wCam)  # Mengatur lebar frame
-cap.set(4, hCam)  # Mengatur tinggi frame
- 
-# Inisialisasi Modul Deteksi Tangan
-detector = htm.HandDetector(maxHands=1, detectionCon=0.75, trackCon=0.75)
- 
-# Mendapatkan ukuran layar monitor
-wScr, hScr = autopy.screen.size()  # wScr: lebar layar, hScr: tinggi layar
- 
-# --- Manajemen Mode dan State ---
-class Mode:
-    IDLE = "IDLE"
-    TRACKING = "TRACKING"
- 
-current_mode = Mode.IDLE
-gesture_timer = None
-GESTURE_HOLD_TIME_SECS = 1.5  # Waktu (detik) untuk menahan gestur untuk screenshot
- 
-
-while True:
-    # 1. Menangkap frame dari webcam dan menemukan landmark tangan
-    success, img = cap.read()
-    img = cv2.flip(img, 1)  # Membalik frame secara horizontal (efek cermin) agar gerakan intuitif
-    img = detector.findHands(img)  # Mendeteksi tangan dan menggambar kerangkanya
-    lmList, bbox = detector.findPosition(img)  # Mendapatkan daftar posisi landmark tangan
-
-    # Menggambar area aktif
-    cv2.rectangle(img, (frameR, frameR), (wCam - frameR, hCam - frameR), (255, 0, 255), 2)
-
-    # 2. Jika tangan terdeteksi, proses gestur berdasarkan mode saat ini
-    if len(lmList) != 0:
-        fingers = detector.fingersUp(0) # Menggunakan handNo=0 karena maxHands=1
-
-        # GESTUR GLOBAL: Kembali ke mode IDLE jika semua jari terangkat.
-        # Berfungsi sebagai gestur "reset" atau "stop" universal.
-        # [jempol, telunjuk, tengah, manis, kelingking]
-
-        if fingers == [1, 1, 1, 1, 1] or fingers == [0,0,0,0,0]:
-            current_mode = Mode.IDLE
-
-        # ==================== KONDISI IDLE ====================
-        if current_mode == Mode.IDLE:
-            cv2.putText(img, "MODE: IDLE", (20, 80), cv2.FONT_HERSHEY_PLAIN, 2, (0, 255, 255), 3)
-            gesture_timer = None # Reset timer saat di IDLE
-
-            # TELUNJUK LURUS = MASUK MODE TRACKING
-            if fingers == [0, 1, 0, 0, 0]:
-                current_mode = Mode.TRACKING
-
-        # ==================== KONDISI TRACKING ====================
-        elif current_mode == Mode.TRACKING:
-            cv2.putText(img, "MODE: TRACKING", (20, 80), cv2.FONT_HERSHEY_PLAIN, 2, (0, 255, 0), 3)
-
-            # --- SUB-MODE: SCROLLING ---
-            # Prioritaskan gestur scroll (telunjuk + tengah berdempetan).
-            # Gestur ini aktif di seluruh area kamera, tidak dibatasi frameR.
-            if fingers == [0, 1, 1, 0, 0]:
-                length, img, lineInfo = detector.findDistance(8, 12, img)
-                if length < 40:
-                    cv2.putText(img, "SCROLLING", (wCam // 2 - 120, hCam // 2), cv2.FONT_HERSHEY_PLAIN, 3, (255, 0, 255), 3)
-                    cv2.circle(img, (lineInfo[4], lineInfo[5]), 15, (0, 255, 255), cv2.FILLED)
-
-                    current_y = lineInfo[5]
-
-                    # Inisialisasi posisi awal scroll jika ini frame pertama
-                    if last_scroll_y is None:
-                        last_scroll_y = current_y
-
-                    delta_y = current_y - last_scroll_y
-                    scroll_amount = int(delta_y / SCROLL_SENSITIVITY) # buat negatif jika ingin scroll mengikuti gerakan tangan
-
-                    if abs(scroll_amount) > 0:
-                        pyautogui.scroll(scroll_amount)
-
-                    last_scroll_y = current_y
-                else:
-                    # Jari merenggang, reset state scroll agar tidak ada lompatan saat gestur diaktifkan kembali
-                    last_scroll_y = None
-
-            # --- SUB-MODE: MOUSE MOVEMENT & CLICK ---
-            # Hanya aktif jika gestur adalah jari telunjuk saja.
-            # Kondisi: Telunjuk lurus, TAPI Jari Tengah & Manis ditekuk.
-            # Ini memungkinkan Jempol atau Kelingking untuk bebas bergerak untuk klik
-            # tanpa keluar dari mode TRACKING.
-            # Gestur yang valid: [0,1,0,0,0], [1,1,0,0,0], [0,1,0,0,1], dll.
-            elif fingers[1] == 1 and fingers[2] == 0 and fingers[3] == 0:
-                 # Reset state scroll saat beralih ke mode gerak mouse
-                last_scroll_y = None
-
-                x1, y1 = lmList[8][1:] # Ujung jari telunjuk
-
-                # Konversi koordinat dari area kamera ke area layar
-                x3 = np.interp(x1, (frameR, wCam - frameR), (0, wScr))
-                y3 = np.interp(y1, (frameR, hCam - frameR), (0, hScr))
-
-                # Haluskan nilai koordinat
-                clocX = plocX + (x3 - plocX) / smoothening
-                clocY = plocY + (y3 - plocY) / smoothening
-
-                # Gerakkan kursor mouse
-                autopy.mouse.move(clocX, clocY)
-                cv2.circle(img, (x1, y1), 15, (255, 0, 255), cv2.FILLED)
-                plocX, plocY = clocX, clocY
-
-                # Logika Klik Kiri (single, double, hold)
-                if not hasattr(detector, 'thumb_events'):
-                    detector.thumb_events = []
-                    detector.thumb_last_state = None
-                    detector.thumb_hold_triggered = False
-
-                thumb_folded = fingers[0] == 1
-                current_time = time.time()
-
-                # Catat perubahan status jempol
-                if detector.thumb_last_state != thumb_folded:
-                    detector.thumb_events.append((current_time, thumb_folded))
-                    # Hapus event lebih dari 1 detik yang lalu
-                    detector.thumb_events = [e for e in detector.thumb_events if current_time - e[0] <= 1.0]
-                    detector.thumb_last_state = thumb_folded
-                    detector.thumb_hold_triggered = False
-
-                # Deteksi double click: dua kali tutup-buka dalam 1 detik
-                thumb_closes = [e for e in detector.thumb_events if e[1]]
-                thumb_opens = [e for e in detector.thumb_events if not e[1]]
-                if len(thumb_closes) >= 2 and len(thumb_opens) >= 2:
-                    # Pastikan urutan: close, open, close, open
-                    idx = 0
-                    pattern = []
-                    for t, state in detector.thumb_events:
-                        pattern.append(state)
-                    if pattern[-4:] == [True, False, True, False]:
-                        autopy.mouse.click(autopy.mouse.Button.LEFT)
-                        autopy.mouse.click(autopy.mouse.Button.LEFT)
-                        text = "Double Klik"
-                        (text_width, text_height), _ = cv2.getTextSize(text, cv2.FONT_HERSHEY_PLAIN, 3, 3)
-                        x = max(0, (wCam - text_width) // 2)
-                        y = max(text_height + 10, (hCam // 2))
-                        cv2.putText(img, text, (x, y), cv2.FONT_HERSHEY_PLAIN, 3, (0, 255, 0), 3)
-                        detector.thumb_events = []
-                        time.sleep(0.3)
-                        text = "Klik Kiri"
-                        (text_width, text_height), _ = cv2.getTextSize(text, cv2.FONT_HERSHEY_PLAIN, 3, 3)
-                        x = max(0, (wCam - text_width) // 2)
-                        y = max(text_height + 10, (hCam // 2))
-                        cv2.putText(img, text, (x, y), cv2.FONT_HERSHEY_PLAIN, 3, (0, 255, 0), 3)
-                elif len(thumb_closes) >= 1 and len(thumb_opens) >= 1:
-                    if detector.thumb_events[-2:][0][1] and not detector.thumb_events[-2:][1][1]:
-                        autopy.mouse.click(autopy.mouse.Button.LEFT)
-                        cv2.putText(img, "Klik Kiri", (wCam // 2 - 120, hCam // 2), cv2.FONT_HERSHEY_PLAIN, 3, (0, 255, 0), 3)
-                        detector.thumb_events = []
-                        time.sleep(0.3)
-                # Deteksi hold: jempol tetap terangkat selama 1 detik
-                elif thumb_folded and not detector.thumb_hold_triggered:
-                    text = "Tahan Kiri"
-                    (text_width, text_height), _ = cv2.getTextSize(text, cv2.FONT_HERSHEY_PLAIN, 3, 3)
-                    x = max(0, (wCam - text_width) // 2)
-                    y = max(text_height + 10, (hCam // 2))
-                    cv2.putText(img, text, (x, y), cv2.FONT_HERSHEY_PLAIN, 3, (0, 255, 0), 3)
-                    for t, state in reversed(detector.thumb_events):
-                        if state:
-                            first_fold_time = t
-                        else:
-                            break
-                    if first_fold_time and (current_time - first_fold_time >= 1.0):
-                        autopy.mouse.toggle(autopy.mouse.Button.LEFT, down=True)
-                        cv2.putText(img, "Tahan Kiri", (wCam // 2 - 120, hCam // 2), cv2.FONT_HERSHEY_PLAIN, 3, (0, 255, 0), 3)
-                        detector.thumb_hold_triggered = True
-                elif not thumb_folded:
-                    autopy.mouse.toggle(autopy.mouse.Button.LEFT, down=False)
-
-                # Logika Klik Kanan
-                if fingers[4] == 1:
-                    autopy.mouse.click(autopy.mouse.Button.RIGHT)
-                    cv2.putText(img, "Klik Kanan", (wCam // 2 - 120, hCam // 2), cv2.FONT_HERSHEY_PLAIN, 3, (0, 255, 0), 3)
-                    time.sleep(0.5)
-
-            else:
-                # Jika gestur tidak valid untuk mode TRACKING (misal: jari telunjuk ditekuk), kembali ke IDLE
-                current_mode = Mode.IDLE
-                last_scroll_y = None # Reset state scroll saat keluar mode
-    else: # Jika tidak ada tangan terdeteksi, kembali ke mode IDLE
-        current_mode = Mode.IDLE
-
-    # Menghitung dan menampilkan Frame Rate (FPS)
-    cTime = time.time()
-    fps = 1 / (cTime - pTime)
-    pTime = cTime
-    cv2.putText(
-        img, str(int(fps)),  # Teks FPS
-        (20, 50),  # Posisi teks
-        cv2.FONT_HERSHEY_PLAIN,  # Font
-        3,
-        (255, 0, 255),
-        3
+
+
+def buildDetector(profiler=None):
+    # Inisialisasi Modul Deteksi Tangan
+    # Di mode headless koordinat landmark yang dicerminkan, bukan piksel frame (menghemat satu salinan frame penuh).
+    # Mode array hanya dipakai jika dibutuhkan (rekaman jejak, deteksi adaptif): untuk satu tangan per frame
+    # jalur daftar lebih cepat (lihat benchmarks/bench_suite.py).
+    arrayMode = bool(RECORD_TRACE) or TARGET_CPU is not None or QUALITY_TARGET_MS is not None
+    detector = htm.HandDetector(maxHands=1, detectionCon=0.75, trackCon=0.75, arrayMode=arrayMode, profiler=profiler,
+                                mirror=HEADLESS)
+    # Satu frame kosong melalui Hands.process memuat model sebelum frame kamera pertama.
+    detector.warmup((hCam, wCam, 3))
+    if TARGET_CPU is not None:
+        # Detektor hanya dijalankan setiap N frame; frame di antaranya diisi prediksi landmark.
+        detector = pm.AdaptiveHandTracker(detector, scheduler=pm.AdaptiveScheduler(targetCpu=TARGET_CPU))
+    elif QUALITY_TARGET_MS is not None:
+        # Interval deteksi hanya diatur QualityController (maxInterval=1 menonaktifkan penjarangan karena gerak).
+        detector = pm.AdaptiveHandTracker(detector, scheduler=pm.AdaptiveScheduler(targetCpu=None, maxInterval=1))
+    return detector
+
+
+def main():
+    startupStart = time.perf_counter()
+    # Pengukur waktu per tahap (startup, capture, convert, process, findPosition, gesture, actuation, render, latency)
+    profiler = prm.StageProfiler()
+    fpsCounter = prm.FpsCounter()
+    showHud = PROFILE_HUD
+    cv2 = lim.cv2()  # Dipakai kamera, jendela pratinjau dan teks FPS
+
+    # Graf MediaPipe (termasuk pemanasan) dan library mouse dimuat di latar belakang sementara webcam dibuka.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        detectorReady = executor.submit(buildDetector, profiler)
+        backendReady = executor.submit(am.createBackend, ACTUATION_BACKEND)
+        # Inisialisasi Webcam
+        source = plm.CameraSource(VIDEO_SOURCE, wCam, hCam)  # Menggunakan webcam utama (indeks 0)
+        detector = detectorReady.result()
+        backend = backendReady.result()
+
+    # Gerak kursor dirapatkan ke posisi terakhir dan scroll pecahan diakumulasi; backend dipanggil
+    # paling banyak ACTUATION_RATE kali per detik dari thread "actuation".
+    actuator = am.CoalescingActuator(backend, rate=ACTUATION_RATE, profiler=profiler)
+
+    # Capture dan deteksi tangan berjalan di thread terpisah; loop utama hanya menangani gestur, mouse dan tampilan.
+    pipeline = plm.HandPipeline(source, detector, flip=not HEADLESS, draw=not HEADLESS, profiler=profiler).start()
+
+    # Mendapatkan ukuran layar monitor
+    wScr, hScr = actuator.screenSize()  # wScr: lebar layar, hScr: tinggi layar
+
+    # Aksi mouse hanya disimpan ke CoalescingActuator (murah), jadi dispatcher tidak perlu thread sendiri;
+    # cooldown menahan klik berulang tanpa menghentikan loop.
+    dispatcher = csm.ActionDispatcher(threaded=False)
+    controller = gcm.VirtualMouseController(
+        actuator, (wScr, hScr), camSize=(wCam, hCam), frameR=frameR,
+        scrollSensitivity=SCROLL_SENSITIVITY,
+        cursorFilter=fm.createFilter(CURSOR_FILTER, **CURSOR_FILTER_PARAMS),
+        dispatcher=dispatcher, scheduler=csm.CooldownScheduler(CLICK_COOLDOWNS),
+        deferDoubleClick=DEFER_DOUBLE_CLICK,
     )
 
-    # 12. Menampilkan gambar ke jendela
-    cv2.imshow("Image", img)
-    cv2.waitKey(1)  # Menunggu 1ms, penting untuk menampilkan jendela GUI
\ No newline at end of file
+    # Pengendali kualitas: menyesuaikan pengaturan saat berjalan agar waktu proses per frame sesuai anggaran.
+    quality = None
+    if QUALITY_TARGET_MS is not None:
+        quality = qcm.QualityController(QUALITY_TARGET_MS, source=source, detector=detector,
+                                        onChange=lambda level, settings: print(f"Kualitas: tingkat {level} {settings}"))
+
+    # Perekam jejak landmark untuk diputar ulang tanpa kamera (lihat TraceModule.py)
+    recorder = tm.TraceRecorder(RECORD_TRACE, 1, (wCam, hCam)) if RECORD_TRACE else None
+
+    try:
+        while True:
+            # 1. Mengambil hasil terbaru dari pipeline (frame sudah di-flip atau landmark sudah dicerminkan)
+            result = pipeline.get()
+            if result is None:
+                break  # Sumber video habis atau kamera berhenti
+            if startupStart is not None:
+                # Waktu mulai dingin: dari main() sampai hasil frame pertama siap
+                profiler.record("startup", time.perf_counter() - startupStart)
+                startupStart = None
+            img = None if HEADLESS else result.img
+            if quality is not None:
+                quality.update(result.tInference - result.tCapture)
+                # Resolusi capture bisa berubah: sesuaikan pemetaan kamera -> layar dengan frame ini.
+                h, w = result.img.shape[:2]
+                if (w, h) != (controller.wCam, controller.hCam):
+                    controller.setCamSize((w, h))
+            if recorder is not None:
+                # Ukuran disimpan per frame: QualityController bisa mengganti resolusi capture di tengah sesi.
+                recorder.record(result.tCapture, result.lmArray, result.handedness, result.scores,
+                                result.img.shape[1::-1])
+
+            # 2. Proses gestur berdasarkan mode saat ini (IDLE/TRACKING) dan gerakkan mouse
+            gestureStart = time.perf_counter()
+            img = controller.process(img, result.lmList, result.fingers, result.tCapture)
+            renderStart = time.perf_counter()
+            profiler.record("gesture", renderStart - gestureStart)
+            # Latensi kaca-ke-kursor: dari frame diambil kamera sampai aksi mouse diserahkan ke dispatcher
+            profiler.record("latency", renderStart - result.tCapture)
+
+            if HEADLESS:
+                continue  # Tanpa FPS, HUD dan jendela: hanya aksi mouse yang dihasilkan
+
+            # Menghitung dan menampilkan Frame Rate (FPS)
+            fps = fpsCounter.tick(renderStart)
+            cv2.putText(
+                img, str(int(fps)),  # Teks FPS
+                (20, 50),  # Posisi teks
+                cv2.FONT_HERSHEY_PLAIN,  # Font
+                3,
+                (255, 0, 255),
+                3
+            )
+
+            if showHud:
+                profiler.drawHud(img)
+
+            # 12. Menampilkan gambar ke jendela
+            cv2.imshow("Image", img)
+            key = cv2.waitKey(1) & 0xFF  # Menunggu 1ms, penting untuk menampilkan jendela GUI
+            profiler.record("render", time.perf_counter() - renderStart)
+            if key == ord('q'):
+                break
+            if key == ord('h'):
+                showHud = not showHud
+    except KeyboardInterrupt:
+        pass  # Ctrl+C untuk berhenti, terutama di mode headless
+    finally:
+        # Juga dijalankan saat terjadi error, agar tombol dilepas dan rekaman jejak tetap tersimpan.
+        pipeline.stop()
+        dispatcher.stop()
+        actuator.stop()  # Mengirim aksi tersisa (misal melepas tombol) lalu menutup backend
+        if recorder is not None:
+            recorder.close()
+        if PROFILE_EXPORT:
+            profiler.export(PROFILE_EXPORT)
+        if not HEADLESS:
+            cv2.destroyAllWindows()
+
+
+# Blok ini memastikan bahwa fungsi main() hanya dipanggil saat skrip dijalankan langsung.
+if __name__ == "__main__":
+    main()
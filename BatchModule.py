@@ -0,0 +1,232 @@
+"""
+Batch Module (Modul Evaluasi Batch untuk Analitik Offline)
+
+Menjalankan HandDetector atas file video rekaman sesi (atau iterator frame apa pun) dan
+menghasilkan potongan (chunk) berisi landmark semua tangan untuk banyak frame sekaligus.
+Status jari, jarak antar landmark dan kotak pembatas dihitung secara vektor untuk seluruh
+chunk dengan fungsi yang sama seperti HandDetector mode array (fingersUpArray, distanceArray,
+bboxArray), jadi hasilnya identik dengan urutan findHands -> findPosition -> fingersUp per frame.
+
+Dekode video berjalan di thread terpisah sehingga waktu total mendekati waktu detektor saja.
+
+    for batch in iterBatches("sesi.mp4", chunkSize=256, maxHands=2):
+        batch.fingers            # (F, H, 5)
+        batch.distances[8, 12]   # (F, H), NaN jika tangan tidak ada
+
+    python BatchModule.py sesi.mp4 --out sesi.npz   # simpan sebagai jejak TraceModule
+"""
+
+import argparse  # Library untuk membaca argumen baris perintah
+import queue  # Antrean thread-safe untuk prefetch frame
+import threading  # Library untuk dekode video di latar belakang
+import time  # Library untuk mengakses waktu
+
+import numpy as np  # Library untuk operasi array multidimensi
+
+import HandTrackingModule as htm  # Modul kustom untuk mendeteksi tangan
+import LazyImportModule as lim  # Modul kustom untuk memuat OpenCV saat pertama dipakai
+import TraceModule as tm  # Modul kustom untuk format jejak landmark
+
+
+# Satu chunk hasil evaluasi: F frame, masing-masing hingga H tangan.
+class HandBatch():
+    __slots__ = ("frameIds", "t", "landmarks", "handedness", "scores", "frameSize",
+                 "present", "fingers", "bboxes", "distances")
+
+    def __init__(self, frameIds, t, landmarks, handedness, scores, frameSize, distancePairs=()):
+        """
+        :param frameIds: Indeks frame (F,) dalam sumber.
+        :param t: Waktu video (F,) dalam detik.
+        :param landmarks: Koordinat piksel (F, H, 21, 3) float32; nol untuk tangan yang tidak ada.
+        :param handedness: Kode (F, H) TraceModule.HAND_NONE/HAND_LEFT/HAND_RIGHT.
+        :param scores: Kepercayaan kiri/kanan (F, H).
+        :param frameSize: Ukuran frame (lebar, tinggi).
+        :param distancePairs: Pasangan landmark yang jaraknya dihitung, misal ((8, 12),).
+        """
+        self.frameIds = frameIds
+        self.t = t
+        self.landmarks = landmarks
+        self.handedness = handedness
+        self.scores = scores
+        self.frameSize = frameSize
+        self.present = handedness != tm.HAND_NONE  # (F, H)
+        # Pemotongan ke int sama seperti HandDetector.lmPixels, agar hasil identik dengan API per frame.
+        pixels = landmarks.astype(np.int32)
+        self.fingers = htm.fingersUpArray(pixels, handedness != tm.HAND_LEFT) * self.present[..., None]
+        self.bboxes = np.where(self.present[..., None], htm.bboxArray(pixels), -1)
+        self.distances = {(p1, p2): np.where(self.present, htm.distanceArray(pixels, p1, p2), np.nan)
+                          for p1, p2 in distancePairs}
+
+    def __len__(self):
+        return len(self.frameIds)
+
+    def toTrace(self):
+        return tm.Trace(self.t, self.landmarks, self.handedness, self.scores, self.frameSize)
+
+
+def videoFrames(path):
+    # Generator frame BGR dari file video, beserta FPS-nya (None jika tidak diketahui).
+    cv2 = lim.cv2()
+
+    cap = cv2.VideoCapture(path)
+    fps = cap.get(cv2.CAP_PROP_FPS) or None
+
+    def frames():
+        try:
+            while True:
+                success, img = cap.read()
+                if not success:
+                    break
+                yield img
+        finally:
+            cap.release()
+
+    return frames(), fps
+
+
+def _prefetch(frames, depth):
+    # Membaca frame di thread latar belakang agar dekode tumpang-tindih dengan inferensi.
+    items = queue.Queue(depth)
+    stop = threading.Event()
+    done = object()
+
+    def put(item):
+        # Menunggu tempat di antrean, tetapi menyerah jika pemanggil sudah berhenti membaca.
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def reader():
+        try:
+            for img in frames:
+                if not put(img):
+                    return
+            put(done)
+        except Exception as e:  # Kesalahan dekode diteruskan ke thread pemanggil
+            put(e)
+        finally:
+            # Menutup generator videoFrames di thread ini agar VideoCapture dilepas, juga saat berhenti lebih awal.
+            close = getattr(frames, "close", None)
+            if close is not None:
+                close()
+
+    thread = threading.Thread(target=reader, name="batch-reader", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = items.get()
+            if item is done:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+
+
+def iterBatches(source, chunkSize=256, maxHands=2, distancePairs=((4, 8), (8, 12)), fps=None,
+                mirror=False, prefetch=32, detector=None, **detectorKwargs):
+    """
+    Mengevaluasi semua frame sumber dan menghasilkan HandBatch per chunk.
+
+    :param source: Path file video atau iterable frame BGR.
+    :param chunkSize: Jumlah frame per HandBatch.
+    :param maxHands: Jumlah tangan maksimum per frame (H).
+    :param distancePairs: Pasangan landmark yang jaraknya dihitung untuk setiap tangan.
+    :param fps: FPS untuk stempel waktu; bawaan dari file video, atau 30 untuk iterable.
+    :param mirror: Jika True, landmark dicerminkan seperti frame di-flip (sama dengan koordinat aplikasi live).
+    :param prefetch: Jumlah frame yang didekode lebih dulu di thread latar belakang.
+    :param detector: Detektor dengan API HandDetector(arrayMode=True); bawaan dibuat dari detectorKwargs.
+    """
+    if isinstance(source, str):
+        frames, videoFps = videoFrames(source)
+        fps = fps or videoFps
+    else:
+        frames = iter(source)
+    fps = fps or 30.0
+    if detector is None:
+        detector = htm.HandDetector(maxHands=maxHands, arrayMode=True, mirror=mirror, **detectorKwargs)
+    H = detector.maxHands if hasattr(detector, "maxHands") else maxHands
+
+    def newChunk():
+        return (np.zeros((chunkSize, H, htm.NUM_LANDMARKS, 3), dtype=np.float32),
+                np.full((chunkSize, H), tm.HAND_NONE, dtype=np.int8),
+                np.zeros((chunkSize, H), dtype=np.float32))
+
+    landmarks, handedness, scores = newChunk()
+    frameSize = None
+    frameId = 0
+    k = 0  # Posisi frame di dalam chunk
+    for img in _prefetch(frames, prefetch):
+        if frameSize is None:
+            h, w = img.shape[:2]
+            frameSize = (w, h)
+        detector.findHands(img, draw=False)
+        detector.findPosition(img, draw=False)
+        n = detector.numHands
+        if n:
+            landmarks[k, :n] = detector.lmArray[:n]
+            handedness[k, :n] = np.where(detector.isRight[:n], tm.HAND_RIGHT, tm.HAND_LEFT)
+            scores[k, :n] = detector.handScores[:n]
+        frameId += 1
+        k += 1
+        if k == chunkSize:
+            yield _makeBatch(frameId, k, fps, landmarks, handedness, scores, frameSize, distancePairs)
+            landmarks, handedness, scores = newChunk()
+            k = 0
+    if k:
+        yield _makeBatch(frameId, k, fps, landmarks[:k], handedness[:k], scores[:k], frameSize, distancePairs)
+
+
+def _makeBatch(frameId, k, fps, landmarks, handedness, scores, frameSize, distancePairs):
+    frameIds = np.arange(frameId - k, frameId)
+    return HandBatch(frameIds, frameIds / fps, landmarks, handedness, scores, frameSize, distancePairs)
+
+
+def saveBatches(batches, path):
+    # Menggabungkan semua chunk dan menyimpannya dalam format jejak TraceModule (bisa diputar ulang).
+    batches = list(batches)
+    if not batches:
+        raise ValueError("Tidak ada frame untuk disimpan")
+    np.savez_compressed(
+        tm.npzPath(path),
+        t=np.concatenate([b.t for b in batches]).astype(np.float64),
+        landmarks=np.concatenate([b.landmarks for b in batches]),
+        handedness=np.concatenate([b.handedness for b in batches]),
+        scores=np.concatenate([b.scores for b in batches]),
+        frameSize=np.array(batches[0].frameSize, dtype=np.int32),
+    )
+    return sum(len(b) for b in batches)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("video", help="File video sesi")
+    parser.add_argument("--out", help="Simpan landmark sebagai jejak .npz TraceModule")
+    parser.add_argument("--chunk", type=int, default=256, help="Jumlah frame per chunk")
+    parser.add_argument("--max-hands", type=int, default=2, help="Jumlah tangan maksimum per frame")
+    parser.add_argument("--mirror", action="store_true", help="Cerminkan landmark seperti aplikasi live")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    batches = []
+    frames = withHands = 0
+    for batch in iterBatches(args.video, args.chunk, args.max_hands, mirror=args.mirror):
+        frames += len(batch)
+        withHands += int(batch.present.any(axis=1).sum())
+        if args.out:
+            batches.append(batch)
+    elapsed = time.perf_counter() - start
+    print(f"{frames} frame ({withHands} dengan tangan) dalam {elapsed:.1f} s ({frames / elapsed:.1f} frame/detik)")
+    if args.out:
+        saveBatches(batches, args.out)
+        print(f"Jejak disimpan ke {tm.npzPath(args.out)}")
+
+
+# Blok ini memastikan bahwa fungsi main() hanya dipanggil saat skrip dijalankan langsung.
+if __name__ == "__main__":
+    main()
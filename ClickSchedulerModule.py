@@ -0,0 +1,126 @@
+"""
+Click Scheduler Module (Modul Penjadwal Klik)
+
+Pengganti time.sleep() di dalam loop frame:
+- CooldownScheduler menahan aksi berulang berdasarkan stempel waktu (jendela refraktori per gestur),
+  sehingga loop tidak pernah berhenti menunggu.
+- ActionDispatcher menjalankan panggilan autopy/pyautogui di thread terpisah, di luar jalur panas.
+
+Jam (clock) bisa diganti, misalnya dengan FakeClock untuk pengujian.
+Backend aktuasi (autopy, pyautogui, XTest, uinput, rekaman) ada di ActuationModule, termasuk
+RecordingBackend sebagai aktuator tiruan untuk pengujian; tahap "actuation"
+profiler diukur per batch oleh CoalescingActuator, bukan di sini.
+"""
+
+import queue  # Antrean thread-safe untuk dispatcher
+import threading  # Library untuk menjalankan dispatcher di latar belakang
+import time  # Library untuk mengakses waktu
+
+
+# Kelas CooldownScheduler menyimpan waktu aksi terakhir per gestur.
+class CooldownScheduler():
+    def __init__(self, windows=None, clock=time.monotonic):
+        """
+        :param windows: Dict nama gestur -> jendela refraktori dalam detik, misal {"left": 0.3, "right": 0.5}.
+        :param clock: Fungsi tanpa argumen yang mengembalikan waktu dalam detik (bawaan: time.monotonic).
+        """
+        self.windows = dict(windows or {})
+        self.clock = clock
+        self._last = {}
+
+    def remaining(self, name, now=None):
+        # Sisa waktu (detik) sebelum gestur boleh dijalankan lagi; 0 jika sudah siap.
+        last = self._last.get(name)
+        if last is None:
+            return 0.0
+        now = self.clock() if now is None else now
+        return max(0.0, self.windows.get(name, 0.0) - (now - last))
+
+    def ready(self, name, now=None):
+        return self.remaining(name, now) == 0.0
+
+    def trigger(self, name, now=None):
+        # Menandai gestur dijalankan jika sudah siap. Mengembalikan True jika aksi boleh dieksekusi.
+        now = self.clock() if now is None else now
+        if self.remaining(name, now) > 0.0:
+            return False
+        self._last[name] = now
+        return True
+
+    def reset(self, name=None):
+        if name is None:
+            self._last.clear()
+        else:
+            self._last.pop(name, None)
+
+
+# Jam palsu yang hanya maju saat advance() dipanggil, untuk pengujian deterministik.
+class FakeClock():
+    def __init__(self, start=0.0):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+        return self.now
+
+
+# Kelas ActionDispatcher mengeksekusi aksi mouse di thread pekerja agar loop frame tidak terblokir.
+class ActionDispatcher():
+    def __init__(self, threaded=True, maxsize=64):
+        """
+        :param threaded: Jika False, aksi langsung dijalankan di thread pemanggil (berguna untuk pengujian).
+        :param maxsize: Batas antrean untuk submit(); aksi baru dibuang jika pekerja tertinggal sejauh ini.
+                        Aksi dari submitCritical() (klik, tekan/lepas tombol) tidak pernah dibuang.
+        """
+        self.threaded = threaded
+        self.maxsize = maxsize
+        self.dropped = 0
+        self.errors = 0
+        # Antrean tanpa batas agar aksi kritis selalu masuk; batas maxsize diterapkan di submit().
+        self._queue = queue.Queue()
+        self._thread = None
+        if threaded:
+            self._thread = threading.Thread(target=self._run, name="actuator", daemon=True)
+            self._thread.start()
+
+    def submit(self, fn, *args, **kwargs):
+        # Untuk aksi yang boleh hilang (gerak kursor, scroll): dibuang jika antrean sudah penuh.
+        if not self.threaded:
+            self._call(fn, args, kwargs)
+            return
+        if self._queue.qsize() >= self.maxsize:
+            self.dropped += 1
+            return
+        self._queue.put_nowait((fn, args, kwargs))
+
+    def submitCritical(self, fn, *args, **kwargs):
+        # Untuk klik dan tekan/lepas tombol: selalu diantrekan, meskipun di belakang gerakan yang menumpuk,
+        # agar klik tidak hilang dan tombol yang ditekan tidak tertahan.
+        if not self.threaded:
+            self._call(fn, args, kwargs)
+            return
+        self._queue.put_nowait((fn, args, kwargs))
+
+    def _call(self, fn, args, kwargs):
+        try:
+            fn(*args, **kwargs)
+        except Exception:
+            # Kegagalan aktuasi (misal layar terkunci) tidak boleh menghentikan loop.
+            self.errors += 1
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            self._call(*item)
+
+    def stop(self, timeout=1.0):
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout)
+            self._thread = None
+
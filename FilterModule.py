@@ -0,0 +1,208 @@
+"""
+Filter Module (Modul Filter Kursor)
+
+Filter penghalus posisi kursor yang bisa saling dipertukarkan. Semua filter bekerja pada
+koordinat layar hasil np.interp dan memakai antarmuka yang sama:
+
+    f = createFilter("oneeuro", minCutoff=1.0, beta=0.007)
+    x, y = f.filter(t, x3, y3)   # t dalam detik
+
+scoreFilter() menilai lag dan jitter sebuah filter pada jejak (t, x, y) hasil rekaman.
+"""
+
+import math  # Library untuk operasi matematika
+
+import numpy as np  # Library untuk operasi array multidimensi
+
+
+# Filter lama: plocX + (x3 - plocX) / smoothening. Lag tetap yang besar untuk jitter rendah.
+class DivisorFilter():
+    def __init__(self, smoothening=7):
+        self.smoothening = smoothening
+        self.reset()
+
+    def reset(self):
+        self.x = self.y = None
+
+    def filter(self, t, x, y):
+        if self.x is None:
+            # Mulai dari sampel pertama agar kursor tidak meluncur dari pojok layar.
+            self.x, self.y = x, y
+            return x, y
+        self.x += (x - self.x) / self.smoothening
+        self.y += (y - self.y) / self.smoothening
+        return self.x, self.y
+
+
+# Filter One Euro (Casiez dkk., 2012): cutoff naik bersama kecepatan, jadi halus saat diam dan cepat saat bergerak.
+class OneEuroFilter():
+    def __init__(self, minCutoff=1.0, beta=0.007, dCutoff=1.0):
+        """
+        :param minCutoff: Frekuensi cutoff minimum (Hz); kecil = lebih halus saat tangan diam.
+        :param beta: Kenaikan cutoff per satuan kecepatan; besar = lag lebih kecil saat bergerak cepat.
+        :param dCutoff: Frekuensi cutoff untuk turunan (kecepatan).
+        """
+        self.minCutoff = minCutoff
+        self.beta = beta
+        self.dCutoff = dCutoff
+        self.reset()
+
+    def reset(self):
+        self.t = None
+        self.value = None
+        self.deriv = (0.0, 0.0)
+
+    @staticmethod
+    def _alpha(cutoff, dt):
+        tau = 1.0 / (2 * math.pi * cutoff)
+        return 1.0 / (1.0 + tau / dt)
+
+    def filter(self, t, x, y):
+        if self.value is None or t <= self.t:
+            self.t = t
+            self.value = (x, y)
+            return x, y
+        dt = t - self.t
+        self.t = t
+        px, py = self.value
+        # Kecepatan dihaluskan terlebih dahulu, lalu dipakai untuk memilih cutoff posisi.
+        ad = self._alpha(self.dCutoff, dt)
+        dx = ad * (x - px) / dt + (1 - ad) * self.deriv[0]
+        dy = ad * (y - py) / dt + (1 - ad) * self.deriv[1]
+        self.deriv = (dx, dy)
+        cutoff = self.minCutoff + self.beta * math.hypot(dx, dy)
+        a = self._alpha(cutoff, dt)
+        self.value = (a * x + (1 - a) * px, a * y + (1 - a) * py)
+        return self.value
+
+
+# Filter Kalman 2D dengan model kecepatan konstan; prediksi kecepatan mengurangi lag saat bergerak.
+class KalmanFilter():
+    def __init__(self, processNoise=2e5, measurementNoise=40.0):
+        """
+        :param processNoise: Kerapatan derau akselerasi (piksel^2/detik^3).
+        :param measurementNoise: Varians derau posisi masukan (piksel^2).
+        """
+        self.q = processNoise
+        self.r = measurementNoise
+        self.reset()
+
+    def reset(self):
+        self.t = None
+        self.state = None  # [x, y, vx, vy]
+        self.P = None
+
+    def filter(self, t, x, y):
+        if self.state is None or t <= self.t:
+            self.t = t
+            self.state = np.array([x, y, 0.0, 0.0])
+            self.P = np.diag([self.r, self.r, 1e6, 1e6])
+            return x, y
+        dt = t - self.t
+        self.t = t
+        F = np.eye(4)
+        F[0, 2] = F[1, 3] = dt
+        q = self.q
+        Q1 = np.array([[dt ** 3 / 3, dt ** 2 / 2], [dt ** 2 / 2, dt]]) * q
+        Q = np.zeros((4, 4))
+        Q[np.ix_([0, 2], [0, 2])] = Q1
+        Q[np.ix_([1, 3], [1, 3])] = Q1
+        # Prediksi
+        self.state = F @ self.state
+        self.P = F @ self.P @ F.T + Q
+        # Koreksi dengan pengukuran posisi (H memilih x dan y).
+        S = self.P[:2, :2] + np.eye(2) * self.r
+        K = self.P[:, :2] @ np.linalg.inv(S)
+        self.state = self.state + K @ (np.array([x, y]) - self.state[:2])
+        self.P = self.P - K @ self.P[:2, :]
+        return float(self.state[0]), float(self.state[1])
+
+
+# Filter eksponensial dengan zona mati: gerakan kecil di bawah deadZone diabaikan (kursor diam total).
+class ExponentialDeadzoneFilter():
+    def __init__(self, alpha=0.5, deadZone=4.0):
+        """
+        :param alpha: Bobot masukan baru (0-1); besar = lag lebih kecil.
+        :param deadZone: Radius (piksel layar) di mana perubahan masukan diabaikan.
+        """
+        self.alpha = alpha
+        self.deadZone = deadZone
+        self.reset()
+
+    def reset(self):
+        self.x = self.y = None
+
+    def filter(self, t, x, y):
+        if self.x is None:
+            self.x, self.y = x, y
+            return x, y
+        dx, dy = x - self.x, y - self.y
+        dist = math.hypot(dx, dy)
+        if dist <= self.deadZone:
+            return self.x, self.y
+        # Hanya bagian gerakan di luar zona mati yang diteruskan, supaya tidak ada lompatan di tepi zona.
+        scale = self.alpha * (dist - self.deadZone) / dist
+        self.x += dx * scale
+        self.y += dy * scale
+        return self.x, self.y
+
+
+FILTERS = {
+    "divisor": DivisorFilter,
+    "oneeuro": OneEuroFilter,
+    "kalman": KalmanFilter,
+    "expdeadzone": ExponentialDeadzoneFilter,
+}
+
+
+def createFilter(name, **params):
+    # Membuat filter berdasarkan nama (lihat FILTERS) dengan parameter khusus filter tersebut.
+    try:
+        cls = FILTERS[name]
+    except KeyError:
+        raise ValueError(f"Filter tidak dikenal: {name!r}. Pilihan: {', '.join(FILTERS)}") from None
+    return cls(**params)
+
+
+def _centeredMean(values, window):
+    # Rata-rata bergerak simetris (tanpa lag) dengan tepi diperpanjang.
+    pad = window // 2
+    padded = np.pad(values, ((pad, pad), (0, 0)), mode="edge")
+    kernel = np.ones(window) / window
+    return np.stack([np.convolve(padded[:, i], kernel, mode="valid") for i in range(values.shape[1])], axis=1)
+
+
+def scoreFilter(filt, trace, window=5, maxLag=30, stillSpeed=100.0):
+    """
+    Menjalankan filter pada jejak rekaman dan menilai lag serta jitter-nya.
+
+    :param filt: Objek filter (akan di-reset terlebih dahulu).
+    :param trace: Array (N, 3) berisi kolom t (detik), x, y (piksel layar).
+    :param window: Lebar rata-rata bergerak simetris yang dipakai sebagai referensi tanpa lag.
+    :param maxLag: Pergeseran maksimum (frame) yang dicari saat mengestimasi lag.
+    :param stillSpeed: Kecepatan referensi (piksel/detik) di bawahnya tangan dianggap diam.
+    :return: Dict berisi lag_ms (saat bergerak), jitter_px (saat diam), dan error_px (rata-rata jarak ke referensi).
+    """
+    trace = np.asarray(trace, dtype=np.float64)
+    filt.reset()
+    out = np.array([filt.filter(t, x, y) for t, x, y in trace])
+    reference = _centeredMean(trace[:, 1:], window)
+    dt = np.median(np.diff(trace[:, 0])) if len(trace) > 1 else 0.0
+    speed = np.hypot(*np.gradient(reference, axis=0).T) / dt if dt else np.zeros(len(trace))
+    moving = speed >= stillSpeed
+
+    # Lag: pergeseran (frame) yang membuat keluaran paling mirip dengan referensi saat tangan bergerak.
+    best, bestShift = None, 0
+    for shift in range(0, min(maxLag, len(out) - 1) + 1):
+        mask = moving[:len(out) - shift]
+        if not mask.any():
+            break
+        err = np.mean(np.sum((out[shift:][mask] - reference[:len(out) - shift][mask]) ** 2, axis=1))
+        if best is None or err < best:
+            best, bestShift = err, shift
+
+    # Jitter: sisa frekuensi tinggi keluaran terhadap rata-rata bergeraknya sendiri, saat tangan diam.
+    residual = np.sum((out - _centeredMean(out, window)) ** 2, axis=1)[~moving]
+    jitter = np.sqrt(np.mean(residual)) if len(residual) else float("nan")
+    error = np.mean(np.hypot(*(out - reference).T))
+    return {"lag_ms": bestShift * dt * 1000, "jitter_px": float(jitter), "error_px": float(error)}
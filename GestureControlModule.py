@@ -0,0 +1,257 @@
+"""
+Gesture Control Module (Modul Kontrol Gestur)
+
+Mesin state gestur Virtual Mouse (mode IDLE/TRACKING, gerak kursor, scroll, klik kiri/kanan,
+double klik dan tahan) yang dipisahkan dari loop kamera AiVirtualMouse.py. Karena semua
+dependensi (aktuator, dispatcher, scheduler, filter) disuntikkan dan waktu diberikan per frame,
+logika ini bisa dijalankan ulang dari rekaman tanpa webcam maupun desktop (lihat TraceModule).
+
+Gestur dan aksinya didefinisikan secara deklaratif di GESTURES, FINGER_RULES dan ACTIONS
+(lihat GestureEngineModule); menambah gestur cukup menambah baris di tabel tersebut.
+"""
+
+import numpy as np  # Library untuk operasi array multidimensi
+
+import ClickSchedulerModule as csm  # Modul kustom untuk cooldown klik dan eksekusi aksi mouse
+import FilterModule as fm  # Modul kustom untuk filter penghalus kursor
+import GestureEngineModule as gem  # Modul kustom untuk pencarian gestur berbasis tabel
+import HandTrackingModule as htm  # Modul kustom untuk mendeteksi tangan
+import LazyImportModule as lim  # Modul kustom untuk memuat OpenCV saat pertama dipakai
+
+
+# --- Manajemen Mode dan State ---
+class Mode:
+    GLOBAL = "GLOBAL"  # Gestur yang diperiksa di semua mode sebelum tabel mode aktif
+    IDLE = "IDLE"
+    TRACKING = "TRACKING"
+
+
+# Pola jari [jempol, telunjuk, tengah, manis, kelingking] -> gestur, per mode. '?' = bebas.
+# Pola yang ditulis lebih dulu menang jika beberapa pola cocok.
+GESTURES = {
+    # Semua jari terangkat atau semua ditekuk: gestur "reset"/"stop" universal
+    Mode.GLOBAL: [("11111", "reset"), ("00000", "reset")],
+    # Telunjuk lurus = masuk mode TRACKING
+    Mode.IDLE: [("01000", "startTracking")],
+    Mode.TRACKING: [
+        # Telunjuk + tengah: scroll (diprioritaskan, aktif di seluruh area kamera)
+        ("01100", "scroll"),
+        # Telunjuk lurus, tengah & manis ditekuk: gerak kursor; jempol dan kelingking bebas untuk klik
+        ("?100?", "move"),
+    ],
+}
+
+# Aturan per jari yang dievaluasi selama gestur "move": indeks jari -> {event TapDetector: aksi}.
+# Tap jempol langsung diklik; tap kedua dari pasangan doubleTap mengirim klik kedua, yang digabung OS
+# menjadi double klik. Tidak ada tundaan pada klik tunggal.
+FINGER_RULES = {
+    0: {"tap": "leftClick", "doubleTap": "secondClick", "hold": "leftDown", "holdRelease": "leftUp"},  # Jempol
+    4: {"active": "rightClick"},  # Kelingking: diulang selama terangkat, dibatasi cooldown "right"
+}
+
+# Aturan untuk deferDoubleClick=True: tap ditahan sampai jelas bukan awal doubleTap, lalu pasangan tap
+# dikirim sebagai satu doubleClick. Klik tunggal tertunda sebesar doubleTapWindow.
+DEFERRED_FINGER_RULES = {finger: dict(rules, doubleTap="doubleClick") if "doubleTap" in rules else rules
+                         for finger, rules in FINGER_RULES.items()}
+
+# Parameter TapDetector bawaan. Dengan deferDoubleClick=True jendela ini juga tundaan klik tunggal.
+TAP_TIMING = {"doubleTapWindow": 0.3}
+
+# Aksi -> (metode aktuator, argumen, grup cooldown atau None, teks di layar atau None).
+# Klik kiri dari tap tidak memakai cooldown: setiap tap sudah satu siklus tekan-lepas penuh, dan cooldown
+# akan menelan klik kedua dari double klik.
+ACTIONS = {
+    "leftClick": ("click", ("left",), None, "Klik Kiri"),
+    "secondClick": ("click", ("left",), None, "Double Klik"),
+    "doubleClick": ("doubleClick", ("left",), None, "Double Klik"),
+    "leftDown": ("toggle", ("left", True), None, "Tahan Kiri"),
+    "leftUp": ("toggle", ("left", False), None, None),
+    "rightClick": ("click", ("right",), "right", "Klik Kanan"),
+}
+
+
+# Kelas VirtualMouseController memproses satu frame landmark menjadi aksi mouse.
+class VirtualMouseController():
+    def __init__(self, actuator, screenSize, camSize=(640, 480), frameR=100, scrollSensitivity=0.2,
+                 cursorFilter=None, dispatcher=None, scheduler=None,
+                 gestures=None, fingerRules=None, actions=None, tapTiming=None, deferDoubleClick=False):
+        """
+        :param actuator: Objek dengan metode move, click, doubleClick, toggle, scroll (backend ActuationModule
+                         atau CoalescingActuator).
+        :param screenSize: Ukuran layar (wScr, hScr).
+        :param camSize: Ukuran frame kamera (wCam, hCam).
+        :param frameR: Frame Reduction: margin area aktif untuk kontrol mouse.
+        :param scrollSensitivity: Kontrol kecepatan scroll. Semakin KECIL, semakin SENSITIF.
+        :param cursorFilter: Filter penghalus kursor dari FilterModule (bawaan: One Euro).
+        :param dispatcher: ActionDispatcher; bawaan: eksekusi langsung di thread pemanggil.
+        :param scheduler: CooldownScheduler untuk klik (bawaan: kanan 0.5 detik).
+        :param gestures: Pengganti GESTURES.
+        :param fingerRules: Pengganti FINGER_RULES (atau DEFERRED_FINGER_RULES jika deferDoubleClick=True).
+        :param actions: Pengganti ACTIONS.
+        :param tapTiming: Parameter TapDetector yang menimpa TAP_TIMING, misal {"holdTime": 0.8, "doubleTapWindow": 0.4}.
+        :param deferDoubleClick: Jika True, tap jari dengan aturan "doubleTap" ditahan (TapDetector deferTap) agar
+                                 double tap menjadi satu doubleClick; klik tunggal tertunda doubleTapWindow.
+        """
+        self.actuator = actuator
+        # Aktuator yang mengakumulasi scroll pecahan menerima delta mentah; yang lain menerima bilangan bulat.
+        self.fractionalScroll = getattr(actuator, "fractionalScroll", False)
+        self.wScr, self.hScr = screenSize
+        self.wCam, self.hCam = camSize
+        self.frameR = frameR
+        self._baseCam = (camSize, frameR)
+        self.pixelScale = 1.0  # Skala ukuran frame saat ini terhadap camSize awal (lihat setCamSize)
+        self.scrollSensitivity = scrollSensitivity
+        self.cursorFilter = cursorFilter or fm.createFilter("oneeuro")
+        self.dispatcher = dispatcher or csm.ActionDispatcher(threaded=False)
+        self.scheduler = scheduler or csm.CooldownScheduler({"right": 0.5})
+
+        self.table = gem.GestureTable(GESTURES if gestures is None else gestures)
+        if fingerRules is None:
+            fingerRules = DEFERRED_FINGER_RULES if deferDoubleClick else FINGER_RULES
+        self.fingerRules = fingerRules
+        self.actions = ACTIONS if actions is None else actions
+        timing = dict(TAP_TIMING, **(tapTiming or {}))
+        self.tapDetectors = {finger: gem.TapDetector(deferTap=deferDoubleClick and "doubleTap" in rules, **timing)
+                             for finger, rules in self.fingerRules.items()}
+
+        self.mode = Mode.IDLE
+        self.gesture = None  # Gestur aktif pada frame terakhir
+        self.clocX, self.clocY = 0, 0
+        self.last_scroll_y = None  # Untuk melacak posisi Y terakhir saat scrolling
+
+    def setCamSize(self, camSize):
+        # Dipanggil saat resolusi kamera berubah (misal oleh QualityController): area aktif dan ambang
+        # berbasis piksel diskalakan agar pemetaan ke layar dan rasa gestur tetap sama.
+        (baseW, baseH), baseFrameR = self._baseCam
+        self.wCam, self.hCam = camSize
+        self.pixelScale = self.wCam / baseW
+        self.frameR = int(round(baseFrameR * min(self.wCam / baseW, self.hCam / baseH)))
+
+    def _text(self, img, text, color=(0, 255, 0)):
+        # Menulis teks di tengah frame.
+        if img is None:
+            return
+        cv2 = lim.cv2()
+        (text_width, text_height), _ = cv2.getTextSize(text, cv2.FONT_HERSHEY_PLAIN, 3, 3)
+        x = max(0, (self.wCam - text_width) // 2)
+        y = max(text_height + 10, (self.hCam // 2))
+        cv2.putText(img, text, (x, y), cv2.FONT_HERSHEY_PLAIN, 3, color, 3)
+
+    def process(self, img, lmList, fingers, t):
+        """
+        :param img: Frame untuk digambari status (None = tanpa gambar, misal saat replay atau headless).
+        :param lmList: Daftar landmark [id, x, y] tangan pertama (kosong jika tidak ada tangan).
+        :param fingers: Status jari [jempol, telunjuk, tengah, manis, kelingking].
+        :param t: Waktu capture frame dalam detik (dipakai filter kursor dan timing klik).
+        :return: Frame yang sudah digambari.
+        """
+        wCam, hCam, frameR = self.wCam, self.hCam, self.frameR
+        draw = img is not None
+        cv2 = lim.cv2() if draw else None  # Tanpa gambar (replay/headless), OpenCV tidak dimuat
+
+        # Menggambar area aktif
+        if draw:
+            cv2.rectangle(img, (frameR, frameR), (wCam - frameR, hCam - frameR), (255, 0, 255), 2)
+
+        # Jika tidak ada tangan terdeteksi, kembali ke mode IDLE
+        if len(lmList) == 0:
+            self._setGesture(None, img, t)
+            self.mode = Mode.IDLE
+            return img
+
+        code = gem.fingerCode(fingers)
+        if self.table.lookup(Mode.GLOBAL, code) == "reset":
+            self.mode = Mode.IDLE
+
+        # ==================== KONDISI IDLE ====================
+        if self.mode == Mode.IDLE:
+            self._setGesture(None, img, t)
+            if draw:
+                cv2.putText(img, "MODE: IDLE", (20, 80), cv2.FONT_HERSHEY_PLAIN, 2, (0, 255, 255), 3)
+            if self.table.lookup(Mode.IDLE, code) == "startTracking":
+                self.mode = Mode.TRACKING
+
+        # ==================== KONDISI TRACKING ====================
+        elif self.mode == Mode.TRACKING:
+            if draw:
+                cv2.putText(img, "MODE: TRACKING", (20, 80), cv2.FONT_HERSHEY_PLAIN, 2, (0, 255, 0), 3)
+            gesture = self.table.lookup(Mode.TRACKING, code)
+            self._setGesture(gesture, img, t)
+
+            if gesture == "scroll":
+                self._scroll(img, lmList)
+            elif gesture == "move":
+                self._move(img, lmList, t)
+                for finger, detector in self.tapDetectors.items():
+                    self._runActions(finger, detector.update(t, fingers[finger] == 1), img, t)
+            else:
+                # Jika gestur tidak valid untuk mode TRACKING (misal: jari telunjuk ditekuk), kembali ke IDLE
+                self.mode = Mode.IDLE
+
+        return img
+
+    def _setGesture(self, gesture, img, t):
+        # Saat gestur berganti: reset state scroll, dan lepaskan tombol yang masih ditahan saat keluar dari "move".
+        if gesture == self.gesture:
+            return
+        self.last_scroll_y = None
+        if self.gesture == "move":
+            for finger, detector in self.tapDetectors.items():
+                self._runActions(finger, detector.reset(), img, t)
+        self.gesture = gesture
+
+    def _runActions(self, finger, events, img, t):
+        rules = self.fingerRules[finger]
+        for event in events:
+            action = rules.get(event)
+            if action is None:
+                continue
+            method, args, cooldown, label = self.actions[action]
+            if cooldown is not None and not self.scheduler.trigger(cooldown, t):
+                continue
+            self.dispatcher.submitCritical(getattr(self.actuator, method), *args)
+            if label:
+                self._text(img, label)
+
+    def _scroll(self, img, lmList):
+        length, img, lineInfo = htm.distanceInfo(lmList, 8, 12, img, draw=img is not None)
+        if length < 40 * self.pixelScale:
+            if img is not None:
+                cv2 = lim.cv2()
+                cv2.putText(img, "SCROLLING", (self.wCam // 2 - 120, self.hCam // 2), cv2.FONT_HERSHEY_PLAIN, 3, (255, 0, 255), 3)
+                cv2.circle(img, (lineInfo[4], lineInfo[5]), 15, (0, 255, 255), cv2.FILLED)
+
+            current_y = lineInfo[5]
+
+            # Inisialisasi posisi awal scroll jika ini frame pertama
+            if self.last_scroll_y is None:
+                self.last_scroll_y = current_y
+
+            delta_y = current_y - self.last_scroll_y
+            scroll_amount = delta_y / self.pixelScale / self.scrollSensitivity  # buat negatif jika ingin scroll mengikuti gerakan tangan
+            if not self.fractionalScroll:
+                scroll_amount = int(scroll_amount)
+
+            if scroll_amount != 0:
+                self.dispatcher.submit(self.actuator.scroll, scroll_amount)
+
+            self.last_scroll_y = current_y
+        else:
+            # Jari merenggang, reset state scroll agar tidak ada lompatan saat gestur diaktifkan kembali
+            self.last_scroll_y = None
+
+    def _move(self, img, lmList, t):
+        x1, y1 = lmList[8][1:]  # Ujung jari telunjuk
+
+        # Konversi koordinat dari area kamera ke area layar
+        x3 = np.interp(x1, (self.frameR, self.wCam - self.frameR), (0, self.wScr))
+        y3 = np.interp(y1, (self.frameR, self.hCam - self.frameR), (0, self.hScr))
+
+        # Haluskan nilai koordinat dengan waktu capture frame sebagai stempel waktu filter
+        self.clocX, self.clocY = self.cursorFilter.filter(t, x3, y3)
+
+        # Gerakkan kursor mouse
+        self.dispatcher.submit(self.actuator.move, self.clocX, self.clocY)
+        if img is not None:
+            cv2 = lim.cv2()
+            cv2.circle(img, (x1, y1), 15, (255, 0, 255), cv2.FILLED)
@@ -0,0 +1,191 @@
+"""
+Gesture Engine Module (Modul Mesin Gestur Berbasis Tabel)
+
+- Status 5 jari dikemas menjadi kode 5-bit (jempol = bit 0 ... kelingking = bit 4),
+  sehingga pencarian gestur cukup satu indeks tabel berukuran 32 per mode.
+- Pola gestur ditulis deklaratif sebagai string, misal "01100" (telunjuk + tengah) atau
+  "?100?" ('?' = bebas), lalu dikembangkan sekali ke semua kode yang cocok.
+- TapDetector mengubah status satu jari menjadi event tap / doubleTap / hold / release
+  dengan riwayat transisi di penyangga cincin berukuran tetap (biaya per frame konstan).
+  Dengan deferTap=True, tap ditahan sampai jelas bukan awal doubleTap, sehingga double tap
+  menghasilkan satu event doubleTap saja (bukan tap lalu doubleTap).
+"""
+
+
+def fingerCode(fingers):
+    # [jempol, telunjuk, tengah, manis, kelingking] -> bilangan 0..31.
+    code = 0
+    for i, up in enumerate(fingers):
+        if up:
+            code |= 1 << i
+    return code
+
+
+def patternCodes(pattern):
+    # Semua kode 5-bit yang cocok dengan pola, misal "?100?" -> 4 kode.
+    pattern = pattern.replace(" ", "")
+    if len(pattern) != 5 or set(pattern) - set("01?"):
+        raise ValueError(f"Pola jari harus 5 karakter dari '0', '1', '?': {pattern!r}")
+    codes = [0]
+    for i, ch in enumerate(pattern):
+        if ch == "1":
+            codes = [c | 1 << i for c in codes]
+        elif ch == "?":
+            codes = codes + [c | 1 << i for c in codes]
+    return codes
+
+
+# Kelas GestureTable memetakan (mode, kode jari) -> nama gestur dengan satu pencarian indeks.
+class GestureTable():
+    def __init__(self, gestures=None):
+        """
+        :param gestures: Dict mode -> daftar (pola, gestur). Pola yang ditulis lebih dulu menang
+                         jika beberapa pola cocok dengan kode yang sama.
+        """
+        self._tables = {}
+        for mode, entries in (gestures or {}).items():
+            for pattern, gesture in entries:
+                self.add(mode, pattern, gesture)
+
+    def add(self, mode, pattern, gesture):
+        table = self._tables.setdefault(mode, [None] * 32)
+        for code in patternCodes(pattern):
+            if table[code] is None:
+                table[code] = gesture
+
+    def lookup(self, mode, code):
+        table = self._tables.get(mode)
+        return table[code] if table is not None else None
+
+
+# Penyangga cincin berukuran tetap untuk riwayat transisi (waktu, status).
+class EventRing():
+    def __init__(self, size=8):
+        self.times = [0.0] * size
+        self.states = [False] * size
+        self.size = size
+        self.index = 0
+        self.count = 0
+
+    def push(self, t, state):
+        self.times[self.index] = t
+        self.states[self.index] = state
+        self.index = (self.index + 1) % self.size
+        self.count = min(self.count + 1, self.size)
+
+    def get(self, back):
+        # back=1 -> event terakhir, back=2 -> sebelumnya, dst. (harus <= count)
+        i = (self.index - back) % self.size
+        return self.times[i], self.states[i]
+
+    def endsWith(self, states):
+        # True jika status event terakhir sama dengan urutan states (yang paling lama di depan).
+        n = len(states)
+        if self.count < n:
+            return False
+        return all(self.states[(self.index - n + k) % self.size] == s for k, s in enumerate(states))
+
+    def clear(self):
+        self.count = 0
+
+
+# Kelas TapDetector mendeteksi tap, doubleTap, hold, dan pelepasannya untuk satu jari.
+class TapDetector():
+    def __init__(self, tapWindow=1.0, doubleTapWindow=1.0, holdTime=1.0, history=8, deferTap=False):
+        """
+        :param tapWindow: Durasi maksimum (detik) jari terangkat agar dihitung sebagai tap.
+        :param doubleTapWindow: Dua tap (tutup-buka-tutup-buka) dalam waktu ini dihitung doubleTap.
+                                Dengan deferTap=True: jeda maksimum dari akhir tap pertama ke awal tap kedua.
+        :param holdTime: Durasi (detik) jari terangkat terus-menerus sebelum event hold.
+        :param history: Ukuran penyangga cincin riwayat transisi.
+        :param deferTap: Jika True, event tap baru dikirim setelah doubleTapWindow lewat tanpa tap kedua;
+                         tap kedua di dalam jendela menghasilkan doubleTap saja. Klik tunggal tertunda
+                         sebesar doubleTapWindow, jadi pakai jendela pendek (misal 0.3 detik).
+        """
+        self.tapWindow = tapWindow
+        self.doubleTapWindow = doubleTapWindow
+        self.holdTime = holdTime
+        self.deferTap = deferTap
+        self.ring = EventRing(history)
+        self.state = None
+        self.pressTime = None
+        self.holding = False
+        self.pendingTap = None  # Waktu akhir tap yang ditahan (deferTap), None jika tidak ada
+        self._secondPress = False  # Tekanan saat ini dimulai di dalam jendela tap yang ditahan
+
+    def update(self, t, state):
+        """
+        :param t: Waktu frame (detik).
+        :param state: True jika jari sedang terangkat.
+        :return: Tuple nama event pada frame ini: "press", "active", "tap", "doubleTap", "hold",
+                 "holdRelease", "release".
+        """
+        events = ()
+        if self.pendingTap is not None and not self._secondPress and t - self.pendingTap > self.doubleTapWindow:
+            # Jendela doubleTap lewat tanpa tekanan kedua: tap yang ditahan dikirim sekarang.
+            self.pendingTap = None
+            events = ("tap",)
+        if state != self.state:
+            if self.state is not None:
+                self.ring.push(t, state)
+            self.state = state
+            if state:
+                self.pressTime = t
+                self._secondPress = self.pendingTap is not None
+                events += ("press",)
+            elif self.pressTime is not None:
+                events += self._released(t)
+        if state:
+            events += ("active",)
+            if not self.holding and t - self.pressTime >= self.holdTime:
+                self.holding = True
+                if self._secondPress:
+                    # Tap yang ditahan lalu diikuti hold: tap dikirim lebih dulu, sebelum tombol ditekan.
+                    self.pendingTap = None
+                    self._secondPress = False
+                    events += ("tap",)
+                events += ("hold",)
+        return events
+
+    def _released(self, t):
+        pressTime, self.pressTime = self.pressTime, None
+        if self.deferTap:
+            return self._releasedDeferred(t, pressTime)
+        if self.holding:
+            self.holding = False
+            return ("holdRelease", "release")
+        if t - pressTime > self.tapWindow:
+            return ("release",)
+        # Dua siklus tutup-buka lengkap di dalam jendela = doubleTap; riwayat dikosongkan agar tidak terhitung ulang.
+        if self.ring.endsWith((True, False, True, False)) and t - self.ring.get(4)[0] <= self.doubleTapWindow:
+            self.ring.clear()
+            return ("release", "doubleTap")
+        return ("release", "tap")
+
+    def _releasedDeferred(self, t, pressTime):
+        # Tap pertama ditahan; tekanan kedua yang terlalu lama bukan doubleTap, jadi tap pertama dikirim sendiri.
+        second, self._secondPress = self._secondPress, False
+        self.pendingTap = None
+        if self.holding:
+            self.holding = False
+            return ("holdRelease", "release")
+        if t - pressTime > self.tapWindow:
+            return (("tap",) if second else ()) + ("release",)
+        if second:
+            return ("release", "doubleTap")
+        self.pendingTap = t
+        return ("release",)
+
+    def reset(self):
+        # Melupakan status jari; mengembalikan "holdRelease" jika hold sedang aktif agar tombol dilepas,
+        # dan "tap" jika ada tap yang masih ditahan agar klik tidak hilang.
+        events = ("tap",) if self.pendingTap is not None else ()
+        if self.holding:
+            events += ("holdRelease",)
+        self.ring.clear()
+        self.state = None
+        self.pressTime = None
+        self.holding = False
+        self.pendingTap = None
+        self._secondPress = False
+        return events
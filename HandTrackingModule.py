@@ -5,66 +5,397 @@ Youtube: http://www.youtube.com/c/MurtazasWorkshopRoboticsandAI
 Website: https://www.computervision.zone/
 
 Dimodifikasi untuk menambahkan indikator tangan Kiri/Kanan.
+
+cv2 dan mediapipe baru diimpor saat benar-benar dipakai (membuat HandDetector, menggambar,
+konversi warna), sehingga alat lain yang hanya memakai fungsi array di sini tetap cepat dimuat.
 """
 
-import cv2  # Library untuk operasi pada gambar dan video
-import mediapipe as mp  # Library untuk deteksi dan pengolahan tangan
+import threading  # Kunci untuk perubahan pengaturan dari thread lain
 import time  # Library untuk mengakses waktu
 import math  # Library untuk operasi matematika
 import numpy as np  # Library untuk operasi array multidimensi
 
+import LazyImportModule as lim  # Modul kustom untuk memuat OpenCV saat pertama dipakai
+import ProfilerModule as prm  # Modul kustom untuk pengukuran waktu per tahap
+
+# ID landmark untuk ujung setiap jari (jempol, telunjuk, tengah, manis, kelingking).
+TIP_IDS = np.array([4, 8, 12, 16, 20])
+NUM_LANDMARKS = 21
+
+
+# Tampilan daftar lama [id, x, y] di atas array landmark piksel, tanpa membuat 21 list per frame.
+class LandmarkList():
+    __slots__ = ("array", "rows")
+
+    def __init__(self, array, rows=None):
+        self.array = array  # Array int32 berbentuk (21, 3): x, y, z dalam piksel
+        # Daftar [x, y] per titik (satu tolist() saat pertama dibaca): akses per titik tanpa skalar NumPy.
+        self.rows = rows
+
+    def __len__(self):
+        return len(self.array)
+
+    def __getitem__(self, id):
+        rows = self.rows
+        if rows is None:
+            rows = self.rows = self.array[:, :2].tolist()
+        if isinstance(id, slice):
+            return [self[i] for i in range(*id.indices(len(rows)))]
+        x, y = rows[id]
+        return [id if id >= 0 else id + len(rows), x, y]
+
+    def __iter__(self):
+        for id in range(len(self.array)):
+            yield self[id]
+
+    def copy(self):
+        # Salinan independen, aman dibawa ke thread lain setelah buffer ditimpa frame berikutnya.
+        return LandmarkList(self.array.copy(), self.rows)
+
+
+# Fungsi-fungsi vektor berikut bekerja pada array berbentuk (..., 21, >=2) sekaligus untuk banyak tangan/frame.
+def fingersUpArray(lmArray, isRight):
+    """
+    :param lmArray: Koordinat piksel landmark berbentuk (..., 21, >=2).
+    :param isRight: Array bool berbentuk (...) yang bernilai True untuk tangan kanan (logika cadangan juga kanan).
+    :return: Array int8 berbentuk (..., 5) berisi 1 untuk jari yang terangkat.
+    """
+    x = lmArray[..., 0]
+    y = lmArray[..., 1]
+    fingers = np.empty(lmArray.shape[:-2] + (5,), dtype=np.int8)
+    # Jempol: tangan kanan (di cermin) x_tip < x_joint, tangan kiri x_tip > x_joint.
+    fingers[..., 0] = np.where(isRight, x[..., 4] < x[..., 3], x[..., 4] > x[..., 3])
+    # Jari lain: ujung jari (y) berada di atas sendi dua tingkat di bawahnya.
+    fingers[..., 1:] = y[..., TIP_IDS[1:]] < y[..., TIP_IDS[1:] - 2]
+    return fingers
+
+
+def fingersUpRows(rows, isRight=True):
+    # Versi skalar fingersUpArray untuk satu tangan dari daftar [x, y] per landmark. Untuk satu tangan
+    # per frame ini lebih cepat daripada operasi NumPy (tanpa alokasi array kecil dan konversi skalar).
+    thumb = rows[4][0] < rows[3][0] if isRight else rows[4][0] > rows[3][0]
+    return [int(thumb)] + [int(rows[tip][1] < rows[tip - 2][1]) for tip in (8, 12, 16, 20)]
+
+
+def bboxRows(rows):
+    # Versi skalar bboxArray untuk satu tangan: (xmin, ymin, xmax, ymax) dari daftar [x, y].
+    xs, ys = zip(*rows)
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def distanceArray(lmArray, p1, p2):
+    # Jarak Euclidean antara landmark p1 dan p2 untuk setiap tangan/frame, berbentuk (...).
+    d = lmArray[..., p2, :2].astype(np.float32) - lmArray[..., p1, :2]
+    return np.hypot(d[..., 0], d[..., 1])
+
+
+def bboxArray(lmArray):
+    # Kotak pembatas (xmin, ymin, xmax, ymax) untuk setiap tangan/frame, berbentuk (..., 4).
+    xy = lmArray[..., :2]
+    return np.concatenate([xy.min(axis=-2), xy.max(axis=-2)], axis=-1)
+
+
+def toRgb(img, out=None):
+    """
+    Konversi BGR->RGB ke dalam buffer yang dipakai ulang (dialokasikan baru hanya jika ukurannya berbeda).
+
+    :return: (buffer RGB, tampilan baca-saja atas buffer). MediaPipe memakai tampilan baca-saja
+             secara langsung (by reference) tanpa menyalin frame lagi, jadi buffer hanya boleh ditimpa
+             setelah Hands.process untuk frame ini kembali. Dengan out=None selalu dibuat buffer baru.
+    """
+    cv2 = lim.cv2()
+
+    if out is None or out.shape != img.shape:
+        out = np.empty(img.shape, dtype=np.uint8)
+    cv2.cvtColor(img, cv2.COLOR_BGR2RGB, dst=out)
+    view = out.view()
+    view.flags.writeable = False
+    return out, view
+
 
 # Kelas HandDetector membungkus semua proses deteksi tangan.
 class HandDetector():
     # Metode inisialisasi saat objek HandDetector dibuat.
-    def __init__(self, mode=False, maxHands=1, detectionCon=0.5, trackCon=0.5):
+    def __init__(self, mode=False, maxHands=1, detectionCon=0.5, trackCon=0.5, arrayMode=False,
+                 roiMode=False, roiPad=0.35, roiSize=256, roiMinSize=160, profiler=None, mirror=False,
+                 modelComplexity=1, inputSize=None, hands=None):
         """
         :param mode: Jika True, mode gambar statis. Jika False, mode video (lebih baik untuk tracking).
         :param maxHands: Jumlah maksimal tangan yang akan dideteksi.
         :param detectionCon: Ambang batas kepercayaan deteksi (misal: 0.5 = 50%).
         :param trackCon: Ambang batas kepercayaan pelacakan (misal: 0.5 = 50%).
+        :param arrayMode: Jika True, findPosition mengisi array NumPy yang dialokasikan sekali
+                          (self.lmArray dan self.lmPixels) untuk semua tangan, dan self.lmList menjadi tampilan di atasnya.
+        :param roiMode: Jika True, setelah tangan ditemukan inferensi hanya dijalankan pada potongan (ROI)
+                        di sekitar posisi tangan yang diprediksi; kembali ke frame penuh jika tangan hilang.
+                        Potongan selalu diubah ke persegi roiSize x roiSize dan diproses satu graf mode video,
+                        sehingga pelacakan MediaPipe (tanpa deteksi telapak) tetap berjalan antar potongan.
+                        Deteksi ulang frame penuh memakai graf mode gambar statis. Hanya untuk satu tangan
+                        (maxHands=1).
+        :param roiPad: Margin ROI di setiap sisi, sebagai pecahan dari sisi terpanjang kotak tangan.
+        :param roiSize: Sisi potongan ROI (piksel) yang dimasukkan ke MediaPipe pada mode ROI.
+        :param roiMinSize: Ukuran sisi ROI minimum dalam piksel frame.
+        :param profiler: StageProfiler opsional (ProfilerModule) untuk mengukur tahap "convert" dan "process".
+        :param mirror: Jika True, koordinat landmark dan label kiri/kanan dicerminkan seolah frame sudah
+                       di-flip, sehingga cv2.flip tidak diperlukan. Dipakai di mode headless (draw=False).
+        :param modelComplexity: Kompleksitas model landmark MediaPipe: 0 = ringan/cepat, 1 = penuh/akurat.
+        :param inputSize: Jika diisi (misal 320), sisi terpanjang frame penuh diperkecil ke ukuran ini sebelum
+                          inferensi. Koordinat tetap dilaporkan dalam piksel frame asli.
+        :param hands: Objek pengganti graf MediaPipe dengan metode process(imgRGB), misal pemutar ulang hasil
+                      rekaman di benchmarks/bench_suite.py. MediaPipe tidak dimuat dan draw diabaikan.
         """
+        if roiMode and maxHands != 1:
+            raise ValueError("roiMode hanya mendukung satu tangan (maxHands=1)")
         self.mode = mode
         self.maxHands = maxHands
         self.detectionCon = detectionCon
         self.trackCon = trackCon
+        self.arrayMode = arrayMode
+        self.roiMode = roiMode
+        self.roiPad = roiPad
+        self.roiSize = roiSize
+        self.roiMinSize = roiMinSize
+        self.profiler = profiler
+        self.mirror = mirror
+        self.modelComplexity = modelComplexity
+        self.inputSize = inputSize
+        self._pending = None  # Perubahan dari configure() yang diterapkan di awal findHands berikutnya
+        self._pendingLock = threading.Lock()
 
-        # Menginisialisasi solusi 'hands' dari MediaPipe.
-        self.mpHands = mp.solutions.hands
-        self.hands = self.mpHands.Hands(
-            static_image_mode=self.mode, # Mode gambar statis atau video
-            max_num_hands=self.maxHands, # Jumlah tangan maks
-            min_detection_confidence=self.detectionCon, # Kepercayaan deteksi
-            min_tracking_confidence=self.trackCon # Kepercayaan pelacakan
-        )
-        # Utilitas untuk menggambar landmark dan koneksi tangan.
-        self.mpDraw = mp.solutions.drawing_utils
+        if hands is None:
+            # Menginisialisasi solusi 'hands' dari MediaPipe (impor paling lambat, jadi dilakukan di sini).
+            import mediapipe as mp  # Library untuk deteksi dan pengolahan tangan
+            self.mpHands = mp.solutions.hands
+            # Pada mode ROI graf frame penuh hanya dipakai untuk deteksi ulang setelah tangan hilang, yang jarang
+            # dan tidak berurutan; mode statis selalu menjalankan deteksi telapak tanpa state pelacakan yang usang.
+            self.hands = self._buildHands(staticMode=True if roiMode else None)
+            self.roiHands = None  # Graf mode video untuk potongan ROI, dibuat saat pertama dipakai
+            # Utilitas untuk menggambar landmark dan koneksi tangan.
+            self.mpDraw = mp.solutions.drawing_utils
+        else:
+            self.mpHands = self.mpDraw = None
+            self.hands = self.roiHands = hands
         # ID landmark untuk ujung setiap jari (jempol, telunjuk, tengah, manis, kelingking).
         self.tipIds = [4, 8, 12, 16, 20]
         # Daftar untuk menyimpan jenis tangan yang terdeteksi ('Left' atau 'Right')
         self.handedness = []
+        self.handScores = []
+        self.lmList = []
+
+        # Buffer mode array: koordinat piksel (x, y, z) untuk semua tangan, dialokasikan sekali saja.
+        self.lmArray = np.zeros((self.maxHands, NUM_LANDMARKS, 3), dtype=np.float32)
+        self.lmPixels = np.zeros((self.maxHands, NUM_LANDMARKS, 3), dtype=np.int32)
+        self.isRight = np.ones(self.maxHands, dtype=bool)
+        self.numHands = 0
+        self._rows = []  # Daftar [x, y] per landmark untuk setiap tangan pada frame ini
+        self._fingers = None  # Cache fingersUpAll() untuk frame ini
+
+        # State mode ROI: kotak prediksi berikutnya (x0, y0, x1, y1), pusat dan kecepatan tangan sebelumnya.
+        self.roi = None
+        self._roiFrame = None  # Ukuran frame (w, h) tempat ROI dihitung
+        self._roiCenter = None
+        self._roiVelocity = (0.0, 0.0)
+        self.roiHits = 0  # Frame yang cukup diproses pada ROI
+        self.roiMisses = 0  # Frame yang harus diulang pada frame penuh karena tangan hilang dari ROI
+
+        # Buffer RGB dan buffer frame yang diperkecil, dipakai ulang setiap frame (potongan ROI punya pasangannya sendiri).
+        self._rgb = None
+        self._small = None
+        self._roiRgb = None
+        self._roiCrop = None
+
+    def _buildHands(self, staticMode=None):
+        return self.mpHands.Hands(
+            static_image_mode=self.mode if staticMode is None else staticMode, # Mode gambar statis atau video
+            max_num_hands=self.maxHands, # Jumlah tangan maks
+            model_complexity=self.modelComplexity, # Kompleksitas model landmark
+            min_detection_confidence=self.detectionCon, # Kepercayaan deteksi
+            min_tracking_confidence=self.trackCon # Kepercayaan pelacakan
+        )
+
+    def configure(self, **settings):
+        """
+        Mengubah modelComplexity, inputSize, roiSize, detectionCon atau trackCon saat berjalan.
+        Perubahan diterapkan di awal findHands berikutnya, di thread yang menjalankan inferensi,
+        sehingga aman dipanggil dari thread lain (misal QualityController di thread utama).
+        """
+        unknown = set(settings) - {"modelComplexity", "inputSize", "roiSize", "detectionCon", "trackCon"}
+        if unknown:
+            raise ValueError(f"Pengaturan detektor tidak dikenal: {sorted(unknown)}")
+        with self._pendingLock:
+            self._pending = dict(self._pending or {}, **settings)
+
+    def _applyPending(self):
+        with self._pendingLock:
+            settings, self._pending = self._pending, None
+        rebuild = any(settings.get(k, getattr(self, k)) != getattr(self, k)
+                      for k in ("modelComplexity", "detectionCon", "trackCon"))
+        for key, value in settings.items():
+            setattr(self, key, value)
+        if rebuild and self.mpHands is not None:
+            # Parameter model hanya bisa diubah dengan membangun ulang graf MediaPipe.
+            self.hands.close()
+            self.hands = self._buildHands(staticMode=True if self.roiMode else None)
+            if self.roiHands is not None:
+                self.roiHands.close()
+                self.roiHands = None
+            self._resetRoi()
+
+    def warmup(self, shape=(480, 640, 3)):
+        # Menjalankan satu frame hitam melalui Hands.process agar model dimuat dan graf MediaPipe
+        # siap sebelum frame kamera pertama tiba. Frame tanpa tangan tidak meninggalkan state pelacakan.
+        self._rgb, imgRGB = toRgb(np.zeros(shape, dtype=np.uint8), self._rgb)
+        self.hands.process(imgRGB)
+        return self
 
     def findHands(self, img, draw=True):
-        # MediaPipe bekerja dengan gambar RGB, sedangkan OpenCV menggunakan BGR. Jadi, kita konversi.
-        imgRGB = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-        # Memproses gambar untuk menemukan tangan. Hasilnya disimpan di self.results.
-        self.results = self.hands.process(imgRGB)
+        if self._pending:
+            self._applyPending()
+        if self.roiMode:
+            self.results = self._processRoi(img)
+        else:
+            # Memproses gambar untuk menemukan tangan. Hasilnya disimpan di self.results.
+            self.results = self._inferFull(img)
 
         # Mengosongkan dan mengisi kembali daftar handedness setiap frame
         self.handedness = []
+        self.handScores = []  # Kepercayaan klasifikasi kiri/kanan untuk setiap tangan
         if self.results.multi_handedness:
             for hand_handedness in self.results.multi_handedness:
                 self.handedness.append(hand_handedness.classification[0].label)
+                self.handScores.append(hand_handedness.classification[0].score)
 
         # Jika landmark tangan terdeteksi (multi_hand_landmarks tidak kosong).
         if self.results.multi_hand_landmarks:
             for handLms in self.results.multi_hand_landmarks:
-                if draw: # Jika draw=True, gambar kerangka tangan pada gambar asli.
+                if draw and self.mpDraw is not None: # Jika draw=True, gambar kerangka tangan pada gambar asli.
                     self.mpDraw.draw_landmarks(img, handLms, self.mpHands.HAND_CONNECTIONS)
+                if self.mirror:
+                    # Cermin pada koordinat (21 titik), bukan pada piksel (seluruh frame).
+                    for lm in handLms.landmark:
+                        lm.x = 1.0 - lm.x
+            if self.mirror:
+                # Membalik frame juga menukar tangan kiri dan kanan yang dilaporkan MediaPipe.
+                self.handedness = ["Left" if label == "Right" else "Right" for label in self.handedness]
 
         return img
 
+    def _infer(self, img, roi=False):
+        # MediaPipe bekerja dengan gambar RGB, sedangkan OpenCV menggunakan BGR. Jadi, kita konversi.
+        # Buffer RGB dipakai ulang: Hands.process sinkron (menunggu graf selesai sebelum kembali), jadi buffer
+        # tidak dipakai lagi oleh MediaPipe saat ditimpa frame berikutnya. Detektor tidak boleh dipakai
+        # bersamaan dari beberapa thread. Potongan ROI memakai buffer sendiri agar self._rgb frame penuh
+        # tidak ikut dialokasikan ulang.
+        hands = self.roiHands if roi else self.hands
+        if self.profiler is None:
+            return hands.process(self._toRgb(img, roi))
+        t0 = time.perf_counter()
+        imgRGB = self._toRgb(img, roi)
+        t1 = time.perf_counter()
+        results = hands.process(imgRGB)
+        self.profiler.record("convert", t1 - t0)
+        self.profiler.record("process", time.perf_counter() - t1)
+        return results
+
+    def _toRgb(self, img, roi):
+        if roi:
+            self._roiRgb, imgRGB = toRgb(img, self._roiRgb)
+        else:
+            self._rgb, imgRGB = toRgb(img, self._rgb)
+        return imgRGB
+
+    def _inferFull(self, img):
+        # Inferensi frame penuh, diperkecil dulu jika inputSize diisi. Landmark MediaPipe ternormalisasi (0-1),
+        # jadi hasilnya tetap berlaku untuk frame asli tanpa pemetaan ulang.
+        h, w = img.shape[:2]
+        if self.inputSize and max(w, h) > self.inputSize:
+            cv2 = lim.cv2()
+            scale = self.inputSize / max(w, h)
+            size = (max(1, round(w * scale)), max(1, round(h * scale)))
+            if self._small is None or self._small.shape[1::-1] != size:
+                self._small = np.empty((size[1], size[0], 3), dtype=np.uint8)
+            img = cv2.resize(img, size, dst=self._small, interpolation=cv2.INTER_AREA)
+        return self._infer(img)
+
+    def _resetRoi(self):
+        self.roi = None
+        self._roiCenter = None
+        self._roiVelocity = (0.0, 0.0)
+
+    def _processRoi(self, img):
+        # Inferensi pada ROI hasil prediksi; landmark dipetakan kembali ke koordinat frame penuh.
+        h, w, c = img.shape
+        if self.roi is not None and self._roiFrame != (w, h):
+            # Resolusi berubah (misal QualityController): ROI dalam piksel frame lama tidak berlaku lagi.
+            self._resetRoi()
+        if self.roi is not None:
+            x0, y0, x1, y1 = self.roi
+            # Dijepit ke frame saat ini; potongan kosong atau terlalu kecil diganti deteksi frame penuh.
+            x0, y0, x1, y1 = max(x0, 0), max(y0, 0), min(x1, w), min(y1, h)
+            if x1 - x0 < 2 or y1 - y0 < 2:
+                self._resetRoi()
+        if self.roi is not None:
+            cv2 = lim.cv2()
+            # Ukuran potongan tetap (roiSize persegi) dan tangan selalu di tengahnya, sehingga state pelacakan
+            # graf mode video (dalam koordinat potongan) tetap berlaku dari frame ke frame.
+            size = (self.roiSize, self.roiSize)
+            if self._roiCrop is None or self._roiCrop.shape[:2] != size:
+                self._roiCrop = np.empty(size + (3,), dtype=np.uint8)
+            interpolation = cv2.INTER_AREA if x1 - x0 > self.roiSize else cv2.INTER_LINEAR
+            crop = cv2.resize(img[y0:y1, x0:x1], size, dst=self._roiCrop, interpolation=interpolation)
+            if self.roiHands is None:
+                self.roiHands = self._buildHands(staticMode=False)
+            results = self._infer(crop, roi=True)
+            if results.multi_hand_landmarks:
+                self.roiHits += 1
+                cw, ch = x1 - x0, y1 - y0
+                for handLms in results.multi_hand_landmarks:
+                    for lm in handLms.landmark:
+                        # Koordinat ternormalisasi terhadap potongan -> ternormalisasi terhadap frame penuh.
+                        lm.x = (lm.x * cw + x0) / w
+                        lm.y = (lm.y * ch + y0) / h
+                        lm.z = lm.z * cw / w
+                self._updateRoi(results, w, h)
+                return results
+            # Tangan keluar dari potongan: frame ini dideteksi ulang di frame penuh (dua inferensi).
+            self.roiMisses += 1
+
+        # Belum ada ROI atau tangan hilang: deteksi ulang pada frame penuh.
+        results = self._inferFull(img)
+        self._updateRoi(results, w, h)
+        return results
+
+    def _updateRoi(self, results, w, h):
+        # Memprediksi ROI frame berikutnya dari kotak tangan saat ini dan kecepatan pusatnya.
+        if not results.multi_hand_landmarks:
+            self._resetRoi()
+            return
+        xs = [lm.x for handLms in results.multi_hand_landmarks for lm in handLms.landmark]
+        ys = [lm.y for handLms in results.multi_hand_landmarks for lm in handLms.landmark]
+        xmin, xmax = min(xs) * w, max(xs) * w
+        ymin, ymax = min(ys) * h, max(ys) * h
+        cx, cy = (xmin + xmax) / 2, (ymin + ymax) / 2
+        if self._roiCenter is not None:
+            # Kecepatan dihaluskan agar ROI tidak melompat karena derau landmark.
+            vx = 0.5 * self._roiVelocity[0] + 0.5 * (cx - self._roiCenter[0])
+            vy = 0.5 * self._roiVelocity[1] + 0.5 * (cy - self._roiCenter[1])
+            self._roiVelocity = (vx, vy)
+        self._roiCenter = (cx, cy)
+
+        # ROI persegi dengan margin, digeser ke posisi prediksi dan dijepit ke batas frame.
+        side = max(xmax - xmin, ymax - ymin) * (1 + 2 * self.roiPad)
+        side = min(max(side, self.roiMinSize), w, h)
+        px, py = cx + self._roiVelocity[0], cy + self._roiVelocity[1]
+        x0 = int(min(max(px - side / 2, 0), w - side))
+        y0 = int(min(max(py - side / 2, 0), h - side))
+        self.roi = (x0, y0, x0 + int(side), y0 + int(side))
+        self._roiFrame = (w, h)
+
     def findPosition(self, img, handNo=0, draw=True):
+        if self.arrayMode:
+            return self._findPositionArray(img, handNo, draw)
+        cv2 = lim.cv2()
+
         # Inisialisasi daftar untuk menyimpan koordinat x, y, dan bounding box.
         xList = []
         yList = []
@@ -95,8 +426,61 @@ class HandDetector():
 
         return self.lmList, bbox
 
+    def _findPositionArray(self, img, handNo=0, draw=True):
+        # Versi mode array: buffer diisi per sumbu untuk semua tangan, lalu skala piksel in-place.
+        self.numHands = 0
+        self.lmList = []
+        self._rows = []
+        self._fingers = None
+        bbox = []
+        if self.results.multi_hand_landmarks:
+            h, w, c = img.shape
+            hands = self.results.multi_hand_landmarks[:self.maxHands]
+            lmArray = self.lmArray
+            for i, handLms in enumerate(hands):
+                # Satu list per sumbu (sudah dalam piksel) langsung ke kolom buffer, tanpa 21 tuple per tangan.
+                landmarks = handLms.landmark
+                lmArray[i, :, 0] = [lm.x * w for lm in landmarks]
+                lmArray[i, :, 1] = [lm.y * h for lm in landmarks]
+                lmArray[i, :, 2] = [lm.z * w for lm in landmarks]  # z memakai skala lebar, sesuai konvensi MediaPipe
+                self.isRight[i] = i >= len(self.handedness) or self.handedness[i] == "Right"
+            self.numHands = n = len(hands)
+            self.lmPixels[:n] = lmArray[:n]  # Pemotongan ke int sama dengan int(lm.x * w)
+            # Satu tolist() untuk semua tangan: fingersUp, bbox dan lmList[id] memakai int Python setelahnya.
+            self._rows = self.lmPixels[:n, :, :2].tolist()
+
+            if handNo < n:
+                rows = self._rows[handNo]
+                self.lmList = LandmarkList(self.lmPixels[handNo], rows)
+                xmin, ymin, xmax, ymax = bbox = bboxRows(rows)
+                if draw:
+                    cv2 = lim.cv2()
+                    for cx, cy, cz in self.lmPixels[handNo].tolist():
+                        cv2.circle(img, (cx, cy), 5, (255, 0, 255), cv2.FILLED)
+                    cv2.rectangle(img, (xmin - 20, ymin - 20), (xmax + 20, ymax + 20),
+                                  (0, 255, 0), 2)
+
+        return self.lmList, bbox
+
+    def fingersUpAll(self):
+        # Status jari untuk semua tangan sekaligus (mode array), berbentuk (numHands, 5); dihitung sekali per frame.
+        if self._fingers is None:
+            n = self.numHands
+            self._fingers = fingersUpArray(self.lmPixels[:n], self.isRight[:n])
+        return self._fingers
+
+    def findDistances(self, p1, p2):
+        # Jarak p1-p2 untuk semua tangan sekaligus (mode array), berbentuk (numHands,).
+        return distanceArray(self.lmPixels[:self.numHands], p1, p2)
+
+    def findBoxes(self):
+        # Kotak pembatas untuk semua tangan sekaligus (mode array), berbentuk (numHands, 4).
+        return bboxArray(self.lmPixels[:self.numHands])
+
     def fingersUp(self, handNo=0):
         # Fungsi untuk mendeteksi jari mana yang terangkat.
+        if self.arrayMode:
+            return fingersUpRows(self._rows[handNo], self.isRight[handNo]) if handNo < self.numHands else []
         fingers = []
         # --- Logika untuk Jempol (Dinamis berdasarkan Tangan Kiri/Kanan) ---
         # Logika ini bekerja pada gambar yang sudah di-flip (efek cermin)
@@ -133,40 +517,58 @@ class HandDetector():
 
         return fingers
 
-    def findDistance(self, p1, p2, img, draw=True, r=15, t=3):
-        # Mendapatkan koordinat piksel untuk dua titik landmark (p1 dan p2).
-        x1, y1 = self.lmList[p1][1:]
-        x2, y2 = self.lmList[p2][1:]
-        # Menghitung titik tengah antara p1 dan p2.
-        cx, cy = (x1 + x2) // 2, (y1 + y2) // 2
+    def findDistance(self, p1, p2, img, draw=True, r=15, t=3, lmList=None):
+        # lmList opsional: dipakai saat landmark berasal dari thread lain (lihat PipelineModule).
+        if lmList is None:
+            lmList = self.lmList
+        return distanceInfo(lmList, p1, p2, img, draw, r, t)
 
-        if draw:  # Jika draw=True, gambar garis dan lingkaran untuk visualisasi.
-            cv2.line(img, (x1, y1), (x2, y2), (255, 0, 255), t)
-            cv2.circle(img, (x1, y1), r, (255, 0, 255), cv2.FILLED)
-            cv2.circle(img, (x2, y2), r, (255, 0, 255), cv2.FILLED)
-            cv2.circle(img, (cx, cy), r, (0, 0, 255), cv2.FILLED)
-        # Menghitung jarak Euclidean antara dua titik.
-        length = math.hypot(x2 - x1, y2 - y1)
 
-        # Mengembalikan jarak, gambar yang sudah dimodifikasi, dan info koordinat.
-        return length, img, [x1, y1, x2, y2, cx, cy]
+def distanceInfo(lmList, p1, p2, img, draw=True, r=15, t=3):
+    # Versi findDistance tanpa detektor, untuk landmark dari pipeline atau rekaman.
+    # Mendapatkan koordinat piksel untuk dua titik landmark (p1 dan p2).
+    x1, y1 = lmList[p1][1:]
+    x2, y2 = lmList[p2][1:]
+    # Menghitung titik tengah antara p1 dan p2.
+    cx, cy = (x1 + x2) // 2, (y1 + y2) // 2
+
+    if draw:  # Jika draw=True, gambar garis dan lingkaran untuk visualisasi.
+        cv2 = lim.cv2()
+        cv2.line(img, (x1, y1), (x2, y2), (255, 0, 255), t)
+        cv2.circle(img, (x1, y1), r, (255, 0, 255), cv2.FILLED)
+        cv2.circle(img, (x2, y2), r, (255, 0, 255), cv2.FILLED)
+        cv2.circle(img, (cx, cy), r, (0, 0, 255), cv2.FILLED)
+    # Menghitung jarak Euclidean antara dua titik.
+    length = math.hypot(x2 - x1, y2 - y1)
+
+    # Mengembalikan jarak, gambar yang sudah dimodifikasi, dan info koordinat.
+    return length, img, [x1, y1, x2, y2, cx, cy]
 
 
 def main():
     # Fungsi utama untuk pengujian mandiri modul ini.
     # Kode di sini hanya akan berjalan jika file ini dieksekusi secara langsung.
-    pTime = 0
-    cTime = 0
+    cv2 = lim.cv2()
+
+    fpsCounter = prm.FpsCounter()
+    profiler = prm.StageProfiler()
+    showHud = False  # Tekan 'h' untuk menampilkan/menyembunyikan waktu per tahap
     cap = cv2.VideoCapture(0)  # Menggunakan webcam utama.
-    detector = HandDetector(maxHands=1) # Batasi deteksi hanya untuk satu tangan
+    detector = HandDetector(maxHands=1, profiler=profiler) # Batasi deteksi hanya untuk satu tangan
+    raw, img = None, None  # Buffer frame yang dipakai ulang setiap iterasi
     while True:
-        success, img = cap.read()
+        with profiler.stage("capture"):
+            success, raw = cap.read(raw)
+        if not success:
+            break
         # Flip gambar secara horizontal agar seperti cermin
-        img = cv2.flip(img, 1)
+        img = cv2.flip(raw, 1, dst=img if img is not None and img.shape == raw.shape else None)
         # Temukan tangan dan gambar kerangkanya
         img = detector.findHands(img)
         # Dapatkan posisi landmark dan kotak pembatas
-        lmList, bbox = detector.findPosition(img)
+        with profiler.stage("findPosition"):
+            lmList, bbox = detector.findPosition(img)
+        renderStart = time.perf_counter()
 
         if len(lmList) != 0:  # Jika tangan terdeteksi...
             # Periksa apakah informasi tangan (kiri/kanan) tersedia
@@ -199,16 +601,21 @@ def main():
 
 
         # Menghitung dan menampilkan FPS.
-        cTime = time.time()
-        fps = 1 / (cTime - pTime)
-        pTime = cTime
+        fps = fpsCounter.tick()
+        h, w, c = img.shape
         cv2.putText(img, f'FPS: {int(fps)}', (10, h - 20), cv2.FONT_HERSHEY_PLAIN, 2, (255, 0, 255), 3)
+        if showHud:
+            profiler.drawHud(img)
 
         # Menampilkan gambar.
         cv2.imshow("Image", img)
+        key = cv2.waitKey(1) & 0xFF
+        profiler.record("render", time.perf_counter() - renderStart)
         # Hentikan loop jika tombol 'q' ditekan
-        if cv2.waitKey(1) & 0xFF == ord('q'):
+        if key == ord('q'):
             break
+        if key == ord('h'):
+            showHud = not showHud
 
     # Melepaskan webcam dan menutup semua jendela OpenCV
     cap.release()
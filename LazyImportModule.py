@@ -0,0 +1,24 @@
+"""
+Lazy Import Module (Modul Impor Tertunda)
+
+Satu titik akses untuk OpenCV: cv2 baru dimuat saat pertama kali dipakai (menggambar, membuka
+kamera/video, jendela pratinjau), lalu disimpan. Mengimpor modul proyek mana pun tidak memuat cv2,
+sehingga mode headless, replay jejak, dan pengujian tetap ringan.
+
+Modul ini sengaja tanpa dependensi proyek, agar bisa dipakai semua modul lain (termasuk
+ProfilerModule yang diimpor oleh HandTrackingModule) tanpa impor melingkar.
+
+Pemakaian di dalam fungsi:
+    cv2 = lim.cv2()
+"""
+
+_cv2Module = None
+
+
+def cv2():
+    # OpenCV dimuat saat pertama dipakai lalu disimpan; dipanggil di setiap fungsi yang membutuhkan cv2.
+    global _cv2Module
+    if _cv2Module is None:
+        import cv2 as module  # Library untuk operasi pada gambar dan video
+        _cv2Module = module
+    return _cv2Module
@@ -0,0 +1,387 @@
+"""
+Pipeline Module (Modul Pipeline Bertahap)
+
+Memisahkan capture kamera, inferensi MediaPipe, dan aktuasi/UI menjadi tahap-tahap
+yang berjalan bersamaan. Tahap-tahap dihubungkan oleh antrean berukuran tetap yang
+membuang frame basi, sehingga latensi kursor tidak pernah menumpuk.
+
+    [Capture thread] --slot frame terbaru--> [Inference thread] --antrean--> [Thread utama: gestur, mouse, imshow]
+
+Buffer frame diambil dari FramePool dan dikembalikan saat frame dibuang atau sudah dipakai,
+sehingga capture dan flip tidak mengalokasikan array baru di setiap frame.
+"""
+
+import threading  # Library untuk menjalankan tahap pipeline secara paralel
+import time  # Library untuk mengakses waktu
+from collections import deque  # Antrean dua arah untuk antrean berukuran tetap
+
+import numpy as np  # Library untuk operasi array multidimensi
+
+import LazyImportModule as lim  # Modul kustom untuk memuat OpenCV saat pertama dipakai
+
+
+# Kumpulan buffer frame yang dipakai ulang. Buffer dipinjam dengan acquire() dan dikembalikan dengan
+# release(); jika semua sedang dipakai, buffer baru dibuat (tidak pernah menunggu, tidak pernah menimpa).
+class FramePool():
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._free = []
+        self.shape = None
+        self.allocated = 0  # Total buffer yang pernah dibuat (stabil setelah beberapa frame pertama)
+
+    def acquire(self, shape=None):
+        # None jika ukuran frame belum diketahui (frame pertama dibaca tanpa buffer tujuan).
+        shape = self.shape if shape is None else tuple(shape)
+        if shape is None:
+            return None
+        with self._lock:
+            self._setShape(shape)
+            if self._free:
+                return self._free.pop()
+            self.allocated += 1
+        return np.empty(shape, dtype=np.uint8)
+
+    def setShape(self, shape):
+        # Menyesuaikan ukuran buffer dengan frame yang dibaca sumber (misal setelah requestResolution).
+        with self._lock:
+            self._setShape(tuple(shape))
+
+    def _setShape(self, shape):
+        if shape != self.shape:
+            # Ukuran frame berubah: buffer lama tidak bisa dipakai lagi.
+            self._free = []
+            self.shape = shape
+
+    def release(self, buffer):
+        if buffer is None:
+            return
+        with self._lock:
+            if buffer.shape == self.shape:
+                self._free.append(buffer)
+
+
+# Slot satu elemen: frame terbaru selalu menimpa frame lama yang belum diambil.
+class LatestFrameSlot():
+    def __init__(self, onDrop=None):
+        """
+        :param onDrop: Fungsi opsional yang dipanggil dengan elemen yang ditimpa (misal untuk mengembalikan buffer).
+        """
+        self._cond = threading.Condition()
+        self._item = None
+        self._closed = False
+        self.onDrop = onDrop
+        self.dropped = 0  # Jumlah frame yang ditimpa sebelum sempat diproses
+
+    def put(self, item):
+        with self._cond:
+            old = self._item
+            if old is not None:
+                self.dropped += 1
+            self._item = item
+            self._cond.notify()
+        if old is not None and self.onDrop is not None:
+            self.onDrop(old)
+
+    def get(self, timeout=None):
+        # Mengembalikan None jika slot sudah ditutup dan kosong, atau waktu tunggu habis.
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._item is not None or self._closed, timeout):
+                return None
+            item, self._item = self._item, None
+            return item
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+# Antrean berukuran tetap yang membuang elemen tertua saat penuh (tidak pernah memblokir produsen).
+class DropOldestQueue():
+    def __init__(self, maxsize=2, onDrop=None):
+        self._cond = threading.Condition()
+        self._items = deque()
+        self.maxsize = maxsize
+        self._closed = False
+        self.onDrop = onDrop
+        self.dropped = 0
+
+    def put(self, item):
+        old = None
+        with self._cond:
+            if len(self._items) >= self.maxsize:
+                old = self._items.popleft()
+                self.dropped += 1
+            self._items.append(item)
+            self._cond.notify()
+        if old is not None and self.onDrop is not None:
+            self.onDrop(old)
+
+    def get(self, timeout=None):
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._items or self._closed, timeout):
+                return None
+            if self._items:
+                return self._items.popleft()
+            return None
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    @property
+    def closed(self):
+        return self._closed
+
+
+# Sumber frame dari webcam (indeks int) atau file video (path).
+class CameraSource():
+    def __init__(self, src=0, width=None, height=None, realtime=None):
+        """
+        :param src: Indeks webcam atau path file video.
+        :param width: Lebar frame yang diminta ke kamera (None = bawaan).
+        :param height: Tinggi frame yang diminta ke kamera (None = bawaan).
+        :param realtime: Jika True, file video diputar sesuai FPS aslinya agar meniru kamera.
+                         Bawaan: True untuk file video, diabaikan untuk webcam.
+        """
+        cv2 = lim.cv2()
+        self.cap = cv2.VideoCapture(src)
+        if width:
+            self.cap.set(3, width)
+        if height:
+            self.cap.set(4, height)
+        self.isFile = isinstance(src, str)
+        self.realtime = self.isFile if realtime is None else realtime
+        fps = self.cap.get(cv2.CAP_PROP_FPS) if self.isFile else 0
+        self.period = 1.0 / fps if fps and fps > 0 else 0
+        self._next = None
+        self._resolution = None  # Resolusi yang diminta requestResolution(), diterapkan di read() berikutnya
+
+    def requestResolution(self, width, height):
+        # Aman dipanggil dari thread lain: kamera hanya diubah oleh thread yang membaca frame.
+        self._resolution = (width, height)
+
+    def read(self, out=None):
+        # out: buffer tujuan opsional; OpenCV menulis langsung ke dalamnya jika ukurannya cocok.
+        if self._resolution is not None and not self.isFile:
+            width, height = self._resolution
+            self._resolution = None
+            self.cap.set(3, width)
+            self.cap.set(4, height)
+        if self.realtime and self.isFile and self.period:
+            # Menahan pembacaan agar ritme frame sama dengan kamera sungguhan.
+            now = time.perf_counter()
+            if self._next is None:
+                self._next = now
+            if self._next > now:
+                time.sleep(self._next - now)
+            self._next += self.period
+        return self.cap.read(out)
+
+    def release(self):
+        self.cap.release()
+
+
+# Sumber frame sintetis (tanpa kamera) untuk benchmark headless.
+class SyntheticSource():
+    def __init__(self, width=640, height=480, frames=300, fps=30, realtime=True, seed=0):
+        """
+        :param frames: Jumlah frame yang dihasilkan sebelum sumber habis (None = tak terbatas).
+        :param fps: Laju frame yang ditiru jika realtime=True.
+        :param realtime: Jika True, frame dihasilkan sesuai ritme kamera; jika False, secepat mungkin.
+        """
+        self.width, self.height = width, height
+        self.frames = frames
+        self.period = 1.0 / fps if fps else 0
+        self.realtime = realtime
+        self.count = 0
+        self.rng = np.random.default_rng(seed)
+        # Latar belakang berderau statis, dibuat sekali saja.
+        self.background = self.rng.integers(0, 60, (height, width, 3), dtype=np.uint8)
+        self._next = None
+        self._resolution = None
+
+    def requestResolution(self, width, height):
+        self._resolution = (width, height)
+
+    def read(self, out=None):
+        if self.frames is not None and self.count >= self.frames:
+            return False, None
+        if self._resolution is not None:
+            # Meniru kamera yang berganti resolusi: latar belakang dibuat ulang dengan ukuran baru.
+            self.width, self.height = self._resolution
+            self._resolution = None
+            self.background = self.rng.integers(0, 60, (self.height, self.width, 3), dtype=np.uint8)
+        if self.realtime and self.period:
+            now = time.perf_counter()
+            if self._next is None:
+                self._next = now
+            if self._next > now:
+                time.sleep(self._next - now)
+            self._next += self.period
+        if out is not None and out.shape == self.background.shape:
+            img = out
+            np.copyto(img, self.background)
+        else:
+            img = self.background.copy()
+        # Lingkaran berwarna kulit yang bergerak melingkar, meniru gerakan tangan.
+        cv2 = lim.cv2()
+        phase = self.count * 0.05
+        cx = int(self.width / 2 + self.width / 4 * np.cos(phase))
+        cy = int(self.height / 2 + self.height / 4 * np.sin(phase))
+        cv2.circle(img, (cx, cy), 60, (140, 170, 220), cv2.FILLED)
+        self.count += 1
+        return True, img
+
+    def release(self):
+        pass
+
+
+# Hasil satu frame yang sudah melewati tahap inferensi.
+class FrameResult():
+    __slots__ = ("frameId", "tCapture", "tInference", "img", "lmList", "bbox", "fingers", "handedness",
+                 "lmArray", "scores")
+
+    def __init__(self, frameId, tCapture, tInference, img, lmList, bbox, fingers, handedness,
+                 lmArray=None, scores=None):
+        self.frameId = frameId
+        self.tCapture = tCapture  # Waktu (perf_counter) frame diambil dari kamera
+        self.tInference = tInference  # Waktu (perf_counter) inferensi selesai
+        self.img = img
+        self.lmList = lmList
+        self.bbox = bbox
+        self.fingers = fingers
+        self.handedness = handedness
+        self.lmArray = lmArray  # Salinan (n_tangan, 21, 3) float32 piksel jika detektor dalam mode array
+        self.scores = scores  # Kepercayaan kiri/kanan per tangan
+
+
+# Kelas HandPipeline menjalankan capture dan inferensi di thread terpisah.
+class HandPipeline():
+    def __init__(self, source, detector, flip=True, draw=True, resultQueueSize=2, profiler=None, reuseBuffers=True):
+        """
+        :param source: Objek dengan metode read(out=None) -> (success, img), misal CameraSource atau SyntheticSource.
+        :param detector: Objek HandDetector yang dipakai eksklusif oleh thread inferensi.
+        :param flip: Jika True, frame dibalik horizontal (efek cermin) di thread capture.
+        :param draw: Jika True, kerangka tangan digambar pada frame hasil.
+        :param resultQueueSize: Ukuran antrean hasil; hasil tertua dibuang saat penuh.
+        :param profiler: StageProfiler opsional (ProfilerModule) untuk tahap "capture", "flip" dan "findPosition".
+        :param reuseBuffers: Jika True, frame dibaca dan di-flip ke buffer dari FramePool. FrameResult.img
+                             hanya valid sampai get() berikutnya; salin jika perlu disimpan lebih lama.
+        """
+        self.source = source
+        self.detector = detector
+        self.flip = flip
+        self.draw = draw
+        self.profiler = profiler
+        self.pool = FramePool() if reuseBuffers else None
+        self.frameSlot = LatestFrameSlot(onDrop=self._releaseFrame)
+        self.results = DropOldestQueue(resultQueueSize, onDrop=self._releaseResult)
+        self._current = None  # Hasil terakhir yang diberikan get(); buffernya dikembalikan pada get() berikutnya
+        self._stop = threading.Event()
+        self._threads = []
+        self.captured = 0
+        self.processed = 0
+
+    def start(self):
+        self._threads = [
+            threading.Thread(target=self._captureLoop, name="capture", daemon=True),
+            threading.Thread(target=self._inferenceLoop, name="inference", daemon=True),
+        ]
+        for t in self._threads:
+            t.start()
+        return self
+
+    def _releaseFrame(self, item):
+        if self.pool is not None:
+            self.pool.release(item[2])
+
+    def _releaseResult(self, result):
+        if self.pool is not None:
+            self.pool.release(result.img)
+
+    def _captureLoop(self):
+        frameId = 0
+        profiler = self.profiler
+        pool = self.pool
+        raw = None  # Buffer baca sebelum flip; langsung disalin ke buffer pool, jadi cukup satu
+        cv2 = lim.cv2() if self.flip else None  # Tanpa flip (headless), OpenCV tidak dimuat di sini
+        while not self._stop.is_set():
+            start = time.perf_counter()
+            if pool is None:
+                success, img = self.source.read()
+            elif self.flip:
+                success, raw = self.source.read(raw)
+            else:
+                buffer = pool.acquire()
+                success, img = self.source.read(buffer)
+                if img is not buffer:
+                    # Baca gagal, atau sumber membuat array baru (ukuran berubah): buffer pinjaman dikembalikan.
+                    pool.release(buffer)
+            if not success:
+                break  # Sumber habis (akhir file video) atau kamera gagal
+            tCapture = time.perf_counter()
+            if self.flip:
+                if pool is None:
+                    img = cv2.flip(img, 1)
+                else:
+                    img = cv2.flip(raw, 1, dst=pool.acquire(raw.shape))
+            elif pool is not None and img.shape != pool.shape:
+                # Frame pertama, atau resolusi berubah: buffer berikutnya mengikuti ukuran frame ini.
+                pool.setShape(img.shape)
+            if profiler is not None:
+                profiler.record("capture", tCapture - start)
+                profiler.record("flip", time.perf_counter() - tCapture)
+            self.frameSlot.put((frameId, tCapture, img))
+            frameId += 1
+            self.captured = frameId
+        self.frameSlot.close()
+
+    def _inferenceLoop(self):
+        detector = self.detector
+        while not self._stop.is_set():
+            item = self.frameSlot.get()
+            if item is None:
+                break  # Slot ditutup: capture sudah selesai
+            frameId, tCapture, img = item
+            img = detector.findHands(img, draw=self.draw)
+            start = time.perf_counter()
+            lmList, bbox = detector.findPosition(img, draw=self.draw)
+            # Salin landmark agar thread utama tidak melihat frame berikutnya menimpa data ini.
+            lmList = lmList.copy()
+            fingers = detector.fingersUp(0) if lmList else []
+            if self.profiler is not None:
+                self.profiler.record("findPosition", time.perf_counter() - start)
+            handedness = list(detector.handedness)
+            lmArray = detector.lmArray[:detector.numHands].copy() if detector.arrayMode else None
+            self.results.put(FrameResult(frameId, tCapture, time.perf_counter(),
+                                         img, lmList, bbox, fingers, handedness,
+                                         lmArray, list(detector.handScores)))
+            self.processed += 1
+        self.results.close()
+
+    def get(self, timeout=None):
+        # Mengambil hasil berikutnya untuk tahap aktuasi/UI. None berarti pipeline sudah berhenti.
+        # Buffer frame dari hasil sebelumnya dikembalikan ke pool di sini.
+        if self._current is not None:
+            self._releaseResult(self._current)
+            self._current = None
+        while True:
+            result = self.results.get(timeout)
+            if result is not None or self.results.closed or timeout is not None:
+                self._current = result
+                return result
+
+    def stop(self):
+        self._stop.set()
+        self.frameSlot.close()
+        for t in self._threads:
+            t.join(timeout=1.0)
+        self.results.close()
+        self.source.release()
+
+    @property
+    def dropped(self):
+        # Total frame basi yang dibuang di kedua antrean.
+        return self.frameSlot.dropped + self.results.dropped
@@ -0,0 +1,262 @@
+"""
+Prediction Module (Modul Prediksi Landmark)
+
+Menjalankan detektor MediaPipe hanya setiap N frame, dengan N dipilih dari gerakan tangan
+yang terukur dan anggaran CPU. Frame di antaranya diisi prediksi 21 landmark
+(kecepatan konstan atau Kalman), sehingga kursor tetap diperbarui setiap frame kamera.
+"""
+
+import math  # Library untuk operasi matematika
+import time  # Library untuk mengakses waktu
+
+import numpy as np  # Library untuk operasi array multidimensi
+
+import HandTrackingModule as htm  # Modul kustom untuk mendeteksi tangan
+import LazyImportModule as lim  # Modul kustom untuk memuat OpenCV saat pertama dipakai
+
+
+# Prediktor kecepatan konstan: ekstrapolasi linear dari dua observasi terakhir.
+class ConstantVelocityPredictor():
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.t = None
+        self.pos = None
+        self.vel = None
+
+    def update(self, t, lmArray):
+        # lmArray: koordinat piksel berbentuk (n_tangan, 21, 3).
+        lmArray = np.asarray(lmArray, dtype=np.float32)
+        if self.pos is not None and self.pos.shape == lmArray.shape and t > self.t:
+            self.vel = (lmArray - self.pos) / (t - self.t)
+        else:
+            self.vel = np.zeros_like(lmArray)
+        self.t = t
+        self.pos = lmArray.copy()
+
+    def predict(self, t):
+        if self.pos is None:
+            return None
+        return self.pos + self.vel * (t - self.t)
+
+    def speed(self):
+        # Kecepatan rata-rata landmark (piksel/detik) pada bidang gambar.
+        if self.vel is None:
+            return 0.0
+        return float(np.hypot(self.vel[..., 0], self.vel[..., 1]).mean())
+
+
+# Filter Kalman kecepatan konstan untuk semua koordinat landmark sekaligus.
+# Karena semua koordinat memakai model dan waktu yang sama, matriks kovarians 2x2 cukup dibagi bersama.
+class KalmanLandmarkPredictor():
+    def __init__(self, processNoise=5000.0, measurementNoise=4.0):
+        """
+        :param processNoise: Kerapatan derau akselerasi (piksel^2/detik^3); besar = lebih cepat mengikuti gerakan.
+        :param measurementNoise: Varians derau pengukuran landmark (piksel^2).
+        """
+        self.q = processNoise
+        self.r = measurementNoise
+        self.reset()
+
+    def reset(self):
+        self.t = None
+        self.pos = None
+        self.vel = None
+        self.P = None
+
+    def _propagate(self, dt):
+        # Kovarians setelah prediksi sejauh dt: P' = F P F^T + Q.
+        p00, p01, p11 = self.P
+        q = self.q
+        n00 = p00 + 2 * dt * p01 + dt * dt * p11 + q * dt ** 3 / 3
+        n01 = p01 + dt * p11 + q * dt ** 2 / 2
+        n11 = p11 + q * dt
+        return n00, n01, n11
+
+    def update(self, t, lmArray):
+        lmArray = np.asarray(lmArray, dtype=np.float32)
+        if self.pos is None or self.pos.shape != lmArray.shape or t <= self.t:
+            self.t = t
+            self.pos = lmArray.copy()
+            self.vel = np.zeros_like(lmArray)
+            self.P = (self.r, 0.0, 1e6)  # Kecepatan awal belum diketahui
+            return
+        dt = t - self.t
+        p00, p01, p11 = self._propagate(dt)
+        predicted = self.pos + self.vel * dt
+        # Gain Kalman untuk pengukuran posisi saja (H = [1, 0]).
+        s = p00 + self.r
+        k0, k1 = p00 / s, p01 / s
+        innovation = lmArray - predicted
+        self.pos = predicted + k0 * innovation
+        self.vel = self.vel + k1 * innovation
+        self.P = ((1 - k0) * p00, (1 - k0) * p01, p11 - k1 * p01)
+        self.t = t
+
+    def predict(self, t):
+        if self.pos is None:
+            return None
+        return self.pos + self.vel * (t - self.t)
+
+    def speed(self):
+        if self.vel is None:
+            return 0.0
+        return float(np.hypot(self.vel[..., 0], self.vel[..., 1]).mean())
+
+
+# Kelas AdaptiveScheduler menentukan interval deteksi N dari gerakan dan anggaran CPU.
+class AdaptiveScheduler():
+    def __init__(self, targetCpu=0.5, minInterval=1, maxInterval=6, slowSpeed=60.0, fastSpeed=600.0):
+        """
+        :param targetCpu: Porsi satu inti CPU yang boleh dipakai inferensi (misal 0.5 = 50%). Target, bukan
+                          batas: interval tidak pernah melebihi maxInterval meskipun anggaran terlewati.
+        :param minInterval: Interval deteksi terkecil (1 = setiap frame).
+        :param maxInterval: Interval deteksi terbesar, juga batas frame prediksi berturut-turut.
+        :param slowSpeed: Kecepatan landmark (piksel/detik) yang dianggap diam; interval = maxInterval.
+        :param fastSpeed: Kecepatan landmark (piksel/detik) yang dianggap cepat; interval = minInterval.
+        """
+        self.targetCpu = targetCpu
+        self.minInterval = minInterval
+        self.maxInterval = maxInterval
+        self.slowSpeed = slowSpeed
+        self.fastSpeed = fastSpeed
+        self.inferTime = None  # Rata-rata bergerak waktu inferensi (detik)
+        self.framePeriod = None  # Rata-rata bergerak jarak antar frame (detik)
+        self.interval = minInterval
+
+    def recordInference(self, seconds):
+        self.inferTime = seconds if self.inferTime is None else 0.9 * self.inferTime + 0.1 * seconds
+
+    def recordFrame(self, seconds):
+        if seconds > 0:
+            self.framePeriod = seconds if self.framePeriod is None else 0.9 * self.framePeriod + 0.1 * seconds
+
+    def update(self, speed):
+        # Interval dari anggaran CPU: inferensi setiap N frame memakai inferTime / (N * framePeriod) CPU.
+        nCpu = self.minInterval
+        if self.inferTime and self.framePeriod and self.targetCpu:
+            nCpu = math.ceil(self.inferTime / (self.targetCpu * self.framePeriod))
+        # Interval dari gerakan: tangan diam boleh jarang dideteksi, tangan cepat harus sering.
+        if speed <= self.slowSpeed:
+            nMotion = self.maxInterval
+        elif speed >= self.fastSpeed:
+            nMotion = self.minInterval
+        else:
+            ratio = (speed - self.slowSpeed) / (self.fastSpeed - self.slowSpeed)
+            nMotion = round(self.maxInterval - ratio * (self.maxInterval - self.minInterval))
+        # Gerakan hanya boleh menambah penghematan di atas anggaran CPU, tetapi maxInterval tetap menang:
+        # lebih dari maxInterval frame prediksi berturut-turut terlalu melenceng, jadi jika inferensi terlalu
+        # lambat, pemakaian CPU bisa melebihi targetCpu.
+        self.interval = int(min(max(nCpu, nMotion, self.minInterval), self.maxInterval))
+        return self.interval
+
+
+# Kelas AdaptiveHandTracker membungkus HandDetector (mode array) dengan API yang sama:
+# findHands, findPosition, fingersUp, findDistance, handedness dan lmList.
+class AdaptiveHandTracker():
+    arrayMode = True  # Landmark selalu tersedia di lmArray/lmPixels, seperti HandDetector(arrayMode=True)
+
+    def __init__(self, detector, predictor=None, scheduler=None, clock=time.perf_counter):
+        """
+        :param detector: HandDetector dengan arrayMode=True.
+        :param predictor: ConstantVelocityPredictor atau KalmanLandmarkPredictor (bawaan: Kalman).
+        :param scheduler: AdaptiveScheduler (bawaan: target CPU 50%).
+        :param clock: Fungsi waktu dalam detik.
+        """
+        if not detector.arrayMode:
+            raise ValueError("AdaptiveHandTracker membutuhkan HandDetector(arrayMode=True)")
+        self.detector = detector
+        self.predictor = predictor or KalmanLandmarkPredictor()
+        self.scheduler = scheduler or AdaptiveScheduler()
+        self.clock = clock
+        self.handedness = []
+        self.handScores = []
+        self.lmList = []
+        self.lmArray = np.zeros_like(detector.lmArray)
+        self.lmPixels = np.zeros_like(detector.lmPixels)
+        self.isRight = detector.isRight.copy()
+        self.numHands = 0
+        self.predicted = False  # True jika frame terakhir diisi prediksi, bukan deteksi
+        self._sinceDetection = None
+        self._lastFrame = None
+        self.detections = 0
+        self.predictions = 0
+
+    def findHands(self, img, draw=True):
+        t = self.clock()
+        if self._lastFrame is not None:
+            self.scheduler.recordFrame(t - self._lastFrame)
+        self._lastFrame = t
+
+        due = (self._sinceDetection is None or self.numHands == 0
+               or self._sinceDetection + 1 >= self.scheduler.interval)
+        if not due and self._predict(img, t):
+            self._sinceDetection += 1
+            self.predicted = True
+            self.predictions += 1
+            return img
+
+        detector = self.detector
+        start = self.clock()
+        img = detector.findHands(img, draw)
+        detector.findPosition(img, draw=False)
+        self.scheduler.recordInference(self.clock() - start)
+        self.detections += 1
+        self.predicted = False
+        self._sinceDetection = 0
+
+        n = self.numHands = detector.numHands
+        self.handedness = list(detector.handedness)
+        self.handScores = list(detector.handScores)
+        if n:
+            self.lmArray[:n] = detector.lmArray[:n]
+            self.lmPixels[:n] = detector.lmPixels[:n]
+            self.isRight[:n] = detector.isRight[:n]
+            self.predictor.update(t, detector.lmArray[:n])
+        else:
+            self.predictor.reset()
+        self.scheduler.update(self.predictor.speed())
+        return img
+
+    def _predict(self, img, t):
+        # Mengisi buffer landmark dengan prediksi; False jika prediksi keluar frame (paksa deteksi).
+        predicted = self.predictor.predict(t)
+        if predicted is None:
+            return False
+        h, w, c = img.shape
+        xy = predicted[..., :2]
+        if xy.min() < 0 or predicted[..., 0].max() >= w or predicted[..., 1].max() >= h:
+            return False
+        n = len(predicted)
+        self.lmArray[:n] = predicted
+        self.lmPixels[:n] = predicted
+        return True
+
+    def findPosition(self, img, handNo=0, draw=True):
+        self.lmList = []
+        bbox = []
+        if handNo < self.numHands:
+            rows = self.lmPixels[handNo, :, :2].tolist()
+            self.lmList = htm.LandmarkList(self.lmPixels[handNo], rows)
+            xmin, ymin, xmax, ymax = bbox = htm.bboxRows(rows)
+            if draw:
+                cv2 = lim.cv2()
+                # Landmark prediksi digambar dengan warna berbeda agar mudah dibedakan.
+                color = (255, 255, 0) if self.predicted else (255, 0, 255)
+                for cx, cy, cz in self.lmPixels[handNo].tolist():
+                    cv2.circle(img, (cx, cy), 5, color, cv2.FILLED)
+                cv2.rectangle(img, (xmin - 20, ymin - 20), (xmax + 20, ymax + 20), (0, 255, 0), 2)
+        return self.lmList, bbox
+
+    def fingersUpAll(self):
+        n = self.numHands
+        return htm.fingersUpArray(self.lmPixels[:n], self.isRight[:n])
+
+    def fingersUp(self, handNo=0):
+        if handNo >= self.numHands:
+            return []
+        return htm.fingersUpRows(self.lmPixels[handNo, :, :2].tolist(), self.isRight[handNo])
+
+    def findDistance(self, p1, p2, img, draw=True, r=15, t=3, lmList=None):
+        return self.detector.findDistance(p1, p2, img, draw, r, t, lmList if lmList is not None else self.lmList)
@@ -0,0 +1,152 @@
+"""
+Profiler Module (Modul Profiling Per Tahap)
+
+Mengukur waktu setiap tahap (capture, konversi warna, hands.process, findPosition, gestur,
+aktuasi, render) dan latensi ujung-ke-ujung dengan jam monotonik, menyimpan jendela bergulir
+per tahap untuk persentil p50/p95/p99, mengekspor ringkasan ke CSV/JSON, dan menggambar HUD.
+
+    profiler = StageProfiler()
+    with profiler.stage("render"):
+        ...
+    profiler.record("latency", seconds)
+    profiler.export("profil.json")
+"""
+
+import csv  # Library untuk menulis file CSV
+import json  # Library untuk menulis file JSON
+import platform  # Library untuk informasi mesin
+import threading  # Library untuk sinkronisasi antar thread
+import time  # Library untuk mengakses waktu
+
+import numpy as np  # Library untuk operasi array multidimensi
+
+import LazyImportModule as lim  # Modul kustom untuk memuat OpenCV saat pertama dipakai
+
+
+# Penyangga cincin berukuran tetap untuk sampel durasi satu tahap.
+class _StageWindow():
+    __slots__ = ("samples", "index", "count")
+
+    def __init__(self, window):
+        self.samples = np.zeros(window, dtype=np.float64)
+        self.index = 0
+        self.count = 0  # Total sampel sejak awal (bisa lebih besar dari ukuran jendela)
+
+    def add(self, seconds):
+        self.samples[self.index] = seconds
+        self.index = (self.index + 1) % len(self.samples)
+        self.count += 1
+
+    def values(self):
+        return self.samples[:min(self.count, len(self.samples))]
+
+
+# Konteks pengukur satu tahap; dibuat ulang per pemakaian agar aman dipakai dari banyak thread.
+class _StageTimer():
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, time.perf_counter() - self.start)
+
+
+# Kelas StageProfiler mengumpulkan durasi per tahap dalam jendela bergulir.
+class StageProfiler():
+    def __init__(self, window=300, enabled=True):
+        """
+        :param window: Jumlah sampel terakhir per tahap yang dipakai untuk persentil.
+        :param enabled: Jika False, record() tidak melakukan apa-apa (biaya hampir nol).
+        """
+        self.window = window
+        self.enabled = enabled
+        self.order = []  # Urutan tahap sesuai kemunculan pertama, untuk HUD dan ekspor
+        self._stages = {}
+        self._lock = threading.Lock()
+
+    def stage(self, name):
+        return _StageTimer(self, name)
+
+    def record(self, name, seconds):
+        if not self.enabled:
+            return
+        stage = self._stages.get(name)
+        if stage is None:
+            with self._lock:
+                stage = self._stages.get(name)
+                if stage is None:
+                    stage = self._stages[name] = _StageWindow(self.window)
+                    self.order.append(name)
+        stage.add(seconds)
+
+    def percentiles(self, name, q=(50, 95, 99)):
+        # Persentil durasi tahap dalam milidetik.
+        stage = self._stages.get(name)
+        if stage is None or stage.count == 0:
+            return [float("nan")] * len(q)
+        return (np.percentile(stage.values(), q) * 1000).tolist()
+
+    def summary(self):
+        # Dict tahap -> statistik (ms) dari jendela bergulir.
+        result = {}
+        for name in list(self.order):
+            stage = self._stages[name]
+            values = stage.values() * 1000
+            p50, p95, p99 = np.percentile(values, (50, 95, 99)).tolist()
+            result[name] = {"count": stage.count, "mean_ms": float(values.mean()), "p50_ms": p50,
+                            "p95_ms": p95, "p99_ms": p99, "max_ms": float(values.max())}
+        return result
+
+    def export(self, path):
+        # Menulis ringkasan ke CSV atau JSON berdasarkan ekstensi file.
+        summary = self.summary()
+        if path.endswith(".csv"):
+            with open(path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(["stage", "count", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"])
+                for name, stats in summary.items():
+                    writer.writerow([name] + [round(v, 3) if isinstance(v, float) else v for v in stats.values()])
+        else:
+            with open(path, "w") as f:
+                json.dump({"machine": {"node": platform.node(), "processor": platform.processor(),
+                                       "python": platform.python_version()},
+                           "window": self.window, "stages": summary}, f, indent=2)
+
+    def drawHud(self, img, origin=(10, 110), color=(0, 255, 255)):
+        # Menggambar tabel p50/p95/p99 per tahap di atas frame.
+        cv2 = lim.cv2()
+
+        x, y = origin
+        cv2.putText(img, "tahap      p50   p95   p99 ms", (x, y), cv2.FONT_HERSHEY_PLAIN, 1, color, 1)
+        for name in list(self.order):
+            y += 16
+            p50, p95, p99 = self.percentiles(name)
+            cv2.putText(img, f"{name[:10]:<10}{p50:6.1f}{p95:6.1f}{p99:6.1f}", (x, y),
+                        cv2.FONT_HERSHEY_PLAIN, 1, color, 1)
+        return img
+
+
+# Penghitung FPS dari rata-rata jarak antar frame; tidak pernah membagi dengan nol.
+class FpsCounter():
+    def __init__(self, window=30):
+        self.times = np.zeros(window, dtype=np.float64)
+        self.index = 0
+        self.count = 0
+
+    def tick(self, now=None):
+        now = time.perf_counter() if now is None else now
+        n = len(self.times)
+        self.times[self.index] = now
+        self.index = (self.index + 1) % n
+        self.count += 1
+        # Setelah penyangga penuh, slot berikutnya berisi stempel waktu tertua.
+        oldest = self.times[self.index] if self.count >= n else self.times[0]
+        frames = min(self.count, n) - 1
+        elapsed = now - oldest
+        return float(frames / elapsed) if frames > 0 and elapsed > 0 else 0.0
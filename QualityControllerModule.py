@@ -0,0 +1,148 @@
+"""
+Quality Controller Module (Modul Pengendali Kualitas Berbasis Anggaran Latensi)
+
+Pengendali loop tertutup yang memantau waktu proses per frame terhadap target (misal 33 ms)
+dan menaikkan/menurunkan tingkat kualitas saat berjalan. Setiap tingkat menentukan:
+
+- captureSize     : resolusi capture kamera (lebar, tinggi)
+- inputSize       : sisi terpanjang frame saat inferensi (None = ukuran asli)
+- modelComplexity : model landmark MediaPipe (0 = ringan, 1 = penuh)
+- detectInterval  : deteksi setiap N frame; frame di antaranya diisi prediksi (butuh AdaptiveHandTracker)
+
+Histeresis mencegah osilasi: turun kualitas cepat saat anggaran terlewati, naik kualitas lambat
+dan hanya jika ada ruang yang cukup; kenaikan yang langsung gagal membuat kenaikan berikutnya
+menunggu dua kali lebih lama.
+
+    quality = QualityController(targetMs=33, source=source, detector=detector)
+    quality.update(result.tInference - result.tCapture)   # sekali per frame
+"""
+
+import numpy as np  # Library untuk operasi array multidimensi
+
+# Tingkat kualitas dari tertinggi ke terendah. Tingkat 1 sama dengan pengaturan lama (640x480, model penuh).
+LEVELS = (
+    {"captureSize": (1280, 720), "inputSize": None, "modelComplexity": 1, "detectInterval": 1},
+    {"captureSize": (640, 480), "inputSize": None, "modelComplexity": 1, "detectInterval": 1},
+    {"captureSize": (640, 480), "inputSize": 320, "modelComplexity": 1, "detectInterval": 1},
+    {"captureSize": (640, 480), "inputSize": 320, "modelComplexity": 0, "detectInterval": 1},
+    {"captureSize": (640, 480), "inputSize": 320, "modelComplexity": 0, "detectInterval": 2},
+    {"captureSize": (320, 240), "inputSize": None, "modelComplexity": 0, "detectInterval": 3},
+)
+
+
+# Kelas QualityController memilih tingkat kualitas dari waktu proses per frame.
+class QualityController():
+    def __init__(self, targetMs=33.0, levels=LEVELS, startLevel=1, source=None, detector=None,
+                 window=30, degradeRatio=1.0, upgradeRatio=0.6, degradeAfter=10, upgradeAfter=90,
+                 maxUpgradeAfter=1800, onChange=None):
+        """
+        :param targetMs: Anggaran waktu proses per frame (milidetik).
+        :param levels: Daftar tingkat kualitas dari tertinggi ke terendah (lihat LEVELS).
+        :param startLevel: Indeks tingkat awal.
+        :param source: Sumber frame dengan requestResolution(w, h) (CameraSource/SyntheticSource), opsional.
+        :param detector: HandDetector, atau AdaptiveHandTracker yang membungkusnya, opsional.
+        :param window: Jumlah frame terakhir yang dipakai untuk mengukur waktu proses (p90).
+        :param degradeRatio: Turunkan kualitas jika p90 > targetMs * degradeRatio ...
+        :param upgradeRatio: ... naikkan kualitas jika p90 < targetMs * upgradeRatio.
+        :param degradeAfter: Jumlah frame berturut-turut di atas anggaran sebelum turun tingkat.
+        :param upgradeAfter: Jumlah frame berturut-turut dengan ruang cukup sebelum naik tingkat.
+        :param maxUpgradeAfter: Batas atas penantian naik tingkat setelah kenaikan yang gagal berulang kali.
+        :param onChange: Fungsi opsional onChange(level, settings) yang dipanggil setiap tingkat berubah.
+        """
+        self.target = targetMs / 1000.0
+        self.levels = [dict(level) for level in levels]
+        self.source = source
+        self.detector = detector
+        self.degradeRatio = degradeRatio
+        self.upgradeRatio = upgradeRatio
+        self.degradeAfter = degradeAfter
+        self.baseUpgradeAfter = upgradeAfter
+        self.upgradeAfter = upgradeAfter
+        self.maxUpgradeAfter = maxUpgradeAfter
+        self.onChange = onChange
+        self.samples = np.zeros(window, dtype=np.float64)
+        self.index = 0
+        self.count = 0  # Sampel sejak perubahan tingkat terakhir
+        self.over = 0  # Frame berturut-turut di atas anggaran
+        self.under = 0  # Frame berturut-turut dengan ruang cukup
+        self.frame = 0
+        self._lastUpgrade = None  # Frame saat kenaikan terakhir, untuk mendeteksi kenaikan yang gagal
+        self.changes = []  # Riwayat (frame, tingkat lama, tingkat baru, p90 ms)
+        self._baseMaxInterval = None  # maxInterval asli AdaptiveScheduler
+        self.level = None
+        self.setLevel(startLevel)
+
+    @property
+    def settings(self):
+        return self.levels[self.level]
+
+    def update(self, seconds):
+        """
+        :param seconds: Waktu proses frame terakhir (misal capture sampai inferensi selesai).
+        :return: Tingkat kualitas yang berlaku.
+        """
+        self.frame += 1
+        self.samples[self.index] = seconds
+        self.index = (self.index + 1) % len(self.samples)
+        self.count += 1
+        if self.count < len(self.samples):
+            return self.level  # Jendela belum terisi sejak perubahan terakhir: belum ada keputusan
+        p90 = float(np.percentile(self.samples, 90))
+
+        if p90 > self.target * self.degradeRatio:
+            self.over += 1
+            self.under = 0
+        elif p90 < self.target * self.upgradeRatio:
+            self.under += 1
+            self.over = 0
+        else:
+            self.over = self.under = 0  # Di dalam pita histeresis: pertahankan tingkat
+
+        if self.over >= self.degradeAfter and self.level < len(self.levels) - 1:
+            if self._lastUpgrade is not None and self.frame - self._lastUpgrade < 2 * self.upgradeAfter:
+                # Kenaikan terakhir langsung melewati anggaran: tunggu lebih lama sebelum mencoba lagi.
+                self.upgradeAfter = min(self.upgradeAfter * 2, self.maxUpgradeAfter)
+            self._change(self.level + 1, p90)
+        elif self.under >= self.upgradeAfter and self.level > 0:
+            self._lastUpgrade = self.frame
+            self._change(self.level - 1, p90)
+        elif self._lastUpgrade is not None and self.frame - self._lastUpgrade > 4 * self.upgradeAfter:
+            # Stabil cukup lama setelah kenaikan: kembalikan penantian ke nilai awal.
+            self.upgradeAfter = self.baseUpgradeAfter
+            self._lastUpgrade = None
+        return self.level
+
+    def _change(self, level, p90):
+        self.changes.append((self.frame, self.level, level, p90 * 1000))
+        self.setLevel(level)
+
+    def setLevel(self, level):
+        # Menerapkan tingkat ke sumber dan detektor; pengukuran dimulai ulang dengan pengaturan baru.
+        level = int(min(max(level, 0), len(self.levels) - 1))
+        previous = self.levels[self.level] if self.level is not None else {}
+        self.level = level
+        settings = self.levels[level]
+        self.count = self.over = self.under = 0
+
+        size = settings.get("captureSize")
+        if self.source is not None and size and size != previous.get("captureSize"):
+            self.source.requestResolution(*size)
+
+        detector = getattr(self.detector, "detector", self.detector)  # AdaptiveHandTracker -> HandDetector
+        if detector is not None:
+            changed = {key: settings[key] for key in ("inputSize", "modelComplexity")
+                       if key in settings and settings[key] != previous.get(key, getattr(detector, key, None))}
+            if changed:
+                detector.configure(**changed)
+
+        interval = settings.get("detectInterval")
+        scheduler = getattr(self.detector, "scheduler", None)
+        if scheduler is not None and interval:
+            # Interval tingkat ini menjadi batas bawah; prediksi gerak tetap boleh memperjarang deteksi.
+            if self._baseMaxInterval is None:
+                self._baseMaxInterval = scheduler.maxInterval
+            scheduler.minInterval = interval
+            scheduler.maxInterval = max(self._baseMaxInterval, interval)
+
+        if self.onChange is not None:
+            self.onChange(level, settings)
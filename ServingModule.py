@@ -0,0 +1,264 @@
+"""
+Serving Module (Modul Layanan Multi-Proses, Multi-Kamera)
+
+Menjalankan HandDetector di beberapa proses pekerja agar satu mesin bisa melayani beberapa
+kiosk/kamera sekaligus tanpa dibatasi GIL:
+
+- Setiap kamera punya cincin frame di shared memory; frame ditulis sekali oleh thread capture
+  dan dibaca langsung oleh pekerja (gambar tidak pernah di-pickle, hanya indeks slot).
+- Setiap pekerja memiliki detektornya sendiri. Bawaan: kamera dipetakan tetap ke satu pekerja
+  (kamera % jumlah pekerja) sehingga pelacakan mode video MediaPipe tetap konsisten, tetapi satu kamera
+  tidak pernah memakai lebih dari satu pekerja. Dengan roundRobin=True frame setiap kamera dibagi
+  bergiliran ke semua pekerja (detektor mode gambar statis), untuk kamera lebih sedikit dari pekerja.
+- Hasil (landmark kecil) dikembalikan per kamera dengan urutan frame terjaga; pada roundRobin hasil
+  yang datang lebih awal dari pekerja lain ditahan di heap sampai gilirannya.
+
+    server = HandServer([CameraSource(0), CameraSource(1)]).start()
+    while True:
+        result = server.get()   # ServedResult: camId, seq, lmArray, handedness, fingers, ...
+"""
+
+import heapq  # Antrean prioritas untuk mengurutkan ulang hasil per kamera
+import multiprocessing as mp  # Library untuk proses pekerja
+import os  # Library untuk informasi jumlah CPU
+import queue  # Pengecualian queue.Empty
+import threading  # Library untuk thread capture per kamera
+import time  # Library untuk mengakses waktu
+from multiprocessing import shared_memory  # Memori bersama antar proses
+
+import numpy as np  # Library untuk operasi array multidimensi
+
+
+# Cincin beberapa slot frame berukuran tetap di shared memory.
+class SharedFrameRing():
+    def __init__(self, shape, slots=3, name=None):
+        """
+        :param shape: Bentuk satu frame, misal (480, 640, 3).
+        :param slots: Jumlah slot; frame dibuang jika semua slot masih diproses pekerja.
+        :param name: Nama blok shared memory yang sudah ada (dipakai pekerja untuk menempel), None = buat baru.
+        """
+        self.shape = tuple(shape)
+        self.slots = slots
+        size = int(np.prod(self.shape)) * slots
+        self.owner = name is None
+        self.shm = shared_memory.SharedMemory(name=name, create=self.owner, size=size)
+        self.frames = np.ndarray((slots,) + self.shape, dtype=np.uint8, buffer=self.shm.buf)
+
+    @property
+    def spec(self):
+        # Informasi yang cukup untuk menempel ke cincin ini dari proses lain.
+        return self.shm.name, self.shape, self.slots
+
+    def buffer(self, slot):
+        return self.frames[slot]
+
+    def close(self):
+        self.frames = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def _workerMain(taskQueue, resultQueue, ringSpecs, detectorKwargs):
+    # Fungsi proses pekerja: satu detektor per kamera yang dilayani, frame dibaca langsung dari shared memory.
+    import HandTrackingModule as htm  # Diimpor di proses pekerja (MediaPipe dibangun di sini)
+
+    rings = {}
+    detectors = {}
+    try:
+        while True:
+            task = taskQueue.get()
+            if task is None:
+                break
+            camId, seq, slot, tCapture = task
+            if camId not in rings:
+                name, shape, slots = ringSpecs[camId]
+                rings[camId] = SharedFrameRing(shape, slots, name=name)
+                detectors[camId] = htm.HandDetector(arrayMode=True, **detectorKwargs)
+            detector = detectors[camId]
+            img = rings[camId].buffer(slot)
+            start = time.perf_counter()
+            detector.findHands(img, draw=False)
+            lmList, bbox = detector.findPosition(img, draw=False)
+            n = detector.numHands
+            resultQueue.put((camId, seq, slot, tCapture, time.perf_counter() - start,
+                             detector.lmArray[:n].copy(), list(detector.handedness),
+                             detector.fingersUpAll().tolist()))
+    finally:
+        for ring in rings.values():
+            ring.close()
+
+
+# Hasil satu frame dari satu kamera.
+class ServedResult():
+    __slots__ = ("camId", "seq", "tCapture", "inferTime", "lmArray", "handedness", "fingers")
+
+    def __init__(self, camId, seq, tCapture, inferTime, lmArray, handedness, fingers):
+        self.camId = camId
+        self.seq = seq  # Nomor urut frame yang dikirim ke pekerja untuk kamera ini
+        self.tCapture = tCapture
+        self.inferTime = inferTime  # Waktu findHands + findPosition di pekerja (detik)
+        self.lmArray = lmArray  # (n_tangan, 21, 3) piksel
+        self.handedness = handedness
+        self.fingers = fingers  # Status jari per tangan
+
+
+# Kelas HandServer membagikan frame dari banyak kamera ke kumpulan proses pekerja.
+class HandServer():
+    def __init__(self, sources, workers=None, slots=3, mirror=True, dropFrames=True, detectorKwargs=None,
+                 roundRobin=False):
+        """
+        :param sources: Daftar sumber frame (CameraSource/SyntheticSource dari PipelineModule), satu per kamera.
+        :param workers: Jumlah proses pekerja (bawaan: min(jumlah kamera, jumlah CPU)).
+        :param slots: Jumlah slot shared memory per kamera.
+        :param mirror: Jika True, landmark dicerminkan di detektor (pengganti cv2.flip, tanpa salinan frame).
+        :param dropFrames: True = frame dibuang jika semua slot sibuk (kamera langsung);
+                           False = capture menunggu slot bebas (file video, benchmark).
+        :param detectorKwargs: Argumen tambahan HandDetector, misal {"maxHands": 1, "detectionCon": 0.75}.
+        :param roundRobin: False = setiap kamera tetap di satu pekerja (pelacakan mode video);
+                           True = frame dibagi bergiliran ke semua pekerja. Setiap pekerja hanya melihat
+                           sebagian frame kamera, jadi detektor dipaksa ke mode gambar statis (mode=True).
+        """
+        self.sources = list(sources)
+        self.workers = workers or max(1, min(len(self.sources), os.cpu_count() or 1))
+        self.slots = slots
+        self.dropFrames = dropFrames
+        self.detectorKwargs = dict(detectorKwargs or {})
+        self.detectorKwargs.setdefault("mirror", mirror)
+        self.roundRobin = roundRobin
+        if roundRobin:
+            # Pelacakan mode video mengandaikan frame berurutan; pekerja roundRobin hanya menerima frame ke-k.
+            self.detectorKwargs["mode"] = True
+        self.rings = []
+        self.processes = []
+        self.taskQueues = []
+        self.resultQueue = None
+        self._threads = []
+        self._stop = threading.Event()
+        self._free = []  # Slot bebas per kamera
+        self._lock = threading.Condition()
+        self._pending = {}  # camId -> heap hasil yang datang lebih awal
+        self._nextSeq = []
+        self._ready = []
+        self._finished = 0
+        self._lastSeq = {}  # camId -> jumlah frame yang dikirim setelah sumber habis
+        self.dropped = [0] * len(self.sources)
+        self.served = [0] * len(self.sources)
+
+    def start(self):
+        ctx = mp.get_context("spawn")
+        firstFrames = []
+        for source in self.sources:
+            success, img = source.read()
+            if not success:
+                raise RuntimeError("Sumber frame tidak menghasilkan frame pertama")
+            firstFrames.append(img)
+            self.rings.append(SharedFrameRing(img.shape, self.slots))
+        specs = [ring.spec for ring in self.rings]
+        self._free = [list(range(self.slots)) for _ in self.sources]
+        self._nextSeq = [0] * len(self.sources)
+        self.resultQueue = ctx.Queue()
+        for w in range(self.workers):
+            taskQueue = ctx.Queue()
+            process = ctx.Process(target=_workerMain, args=(taskQueue, self.resultQueue, specs, self.detectorKwargs),
+                                  name=f"hand-worker-{w}", daemon=True)
+            process.start()
+            self.taskQueues.append(taskQueue)
+            self.processes.append(process)
+        for camId, img in enumerate(firstFrames):
+            t = threading.Thread(target=self._captureLoop, args=(camId, img), name=f"capture-{camId}", daemon=True)
+            t.start()
+            self._threads.append(t)
+        return self
+
+    def _captureLoop(self, camId, img):
+        source, ring = self.sources[camId], self.rings[camId]
+        taskQueue = self.taskQueues[camId % self.workers]
+        seq = 0
+        while not self._stop.is_set():
+            tCapture = time.perf_counter()
+            with self._lock:
+                if not self.dropFrames:
+                    self._lock.wait_for(lambda: self._free[camId] or self._stop.is_set())
+                slot = self._free[camId].pop() if self._free[camId] else None
+            if slot is None:
+                # Semua slot masih diproses: buang frame ini daripada menumpuk antrean.
+                self.dropped[camId] += 1
+            else:
+                np.copyto(ring.buffer(slot), img)
+                if self.roundRobin:
+                    # Pekerja awal digeser per kamera agar beban beberapa kamera tetap tersebar.
+                    taskQueue = self.taskQueues[(camId + seq) % self.workers]
+                taskQueue.put((camId, seq, slot, tCapture))
+                seq += 1
+            success, img = source.read()
+            if not success:
+                break
+        with self._lock:
+            self._finished += 1
+            self._lastSeq[camId] = seq
+
+    def get(self, timeout=None):
+        """
+        Mengambil hasil berikutnya (dari kamera mana pun), dengan urutan per kamera terjaga.
+
+        :return: ServedResult, atau None jika waktu tunggu habis atau semua sumber sudah selesai diproses.
+        """
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while True:
+            if self._ready:
+                return self._ready.pop(0)
+            if self._allDone():
+                return None
+            remaining = None if deadline is None else max(0.0, deadline - time.perf_counter())
+            try:
+                item = self.resultQueue.get(timeout=0.1 if remaining is None else min(remaining, 0.1))
+            except queue.Empty:
+                self._checkWorkers()
+                if deadline is not None and time.perf_counter() >= deadline:
+                    return None
+                continue
+            self._accept(item)
+
+    def _accept(self, item):
+        camId, seq, slot, tCapture, inferTime, lmArray, handedness, fingers = item
+        with self._lock:
+            self._free[camId].append(slot)
+            self._lock.notify_all()
+        heap = self._pending.setdefault(camId, [])
+        heapq.heappush(heap, (seq, ServedResult(camId, seq, tCapture, inferTime, lmArray, handedness, fingers)))
+        # Keluarkan semua hasil yang sudah berurutan untuk kamera ini.
+        while heap and heap[0][0] == self._nextSeq[camId]:
+            self._ready.append(heapq.heappop(heap)[1])
+            self._nextSeq[camId] += 1
+            self.served[camId] += 1
+
+    def _checkWorkers(self):
+        # Pekerja yang mati (misal gagal membangun detektor) tidak akan pernah mengirim hasil lagi.
+        for process in self.processes:
+            if process.exitcode not in (None, 0):
+                raise RuntimeError(f"Proses {process.name} berhenti dengan kode {process.exitcode}")
+
+    def _allDone(self):
+        with self._lock:
+            if self._finished < len(self.sources):
+                return False
+            lastSeq = dict(self._lastSeq)
+        return all(self._nextSeq[camId] >= lastSeq[camId] for camId in range(len(self.sources)))
+
+    def stop(self):
+        self._stop.set()
+        with self._lock:
+            self._lock.notify_all()
+        for t in self._threads:
+            t.join(timeout=1.0)
+        for taskQueue in self.taskQueues:
+            taskQueue.put(None)
+        for process in self.processes:
+            process.join(timeout=5.0)
+            if process.is_alive():
+                process.terminate()
+        for source in self.sources:
+            source.release()
+        for ring in self.rings:
+            ring.close()
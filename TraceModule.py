@@ -0,0 +1,360 @@
+"""
+Trace Module (Modul Rekam dan Putar Ulang Landmark)
+
+Merekam stempel waktu, landmark, jenis tangan, kepercayaan dan ukuran setiap frame ke file .npz
+berkolom (satu array per kolom, terkompresi), lalu memutar ulang rekaman tersebut (atau file
+video) melalui logika gestur dengan aktuator tiruan, lebih cepat dari waktu nyata.
+Tidak membutuhkan webcam maupun desktop, sehingga bisa dijalankan di mesin CI headless.
+
+    python TraceModule.py record sesi.npz              # rekam dari webcam (tekan 'q' untuk berhenti)
+    python TraceModule.py record sesi.npz --video a.mp4
+    python TraceModule.py replay sesi.npz              # putar ulang jejak melalui logika gestur
+    python TraceModule.py replay a.mp4                 # putar ulang video (butuh MediaPipe)
+"""
+
+import argparse  # Library untuk membaca argumen baris perintah
+import os  # Library untuk menghapus file sementara rekaman
+import time  # Library untuk mengakses waktu
+
+import numpy as np  # Library untuk operasi array multidimensi
+
+import ActuationModule as am  # Modul kustom untuk backend aktuasi tiruan
+import ClickSchedulerModule as csm  # Modul kustom untuk cooldown klik dan jam palsu
+import GestureControlModule as gcm  # Modul kustom untuk mesin state gestur
+import HandTrackingModule as htm  # Modul kustom untuk mendeteksi tangan
+import LazyImportModule as lim  # Modul kustom untuk memuat OpenCV saat pertama dipakai
+
+# Kode jenis tangan di file rekaman.
+HAND_NONE, HAND_LEFT, HAND_RIGHT = -1, 0, 1
+
+
+def npzPath(path):
+    # np.savez_compressed menambahkan ".npz" jika belum ada; path dinormalkan di awal agar file yang
+    # ditulis, file sementara, dan path yang dilaporkan selalu sama.
+    path = os.fspath(path)
+    return path if path.endswith(".npz") else path + ".npz"
+
+
+# Kelas TraceRecorder mengisi blok frame berukuran tetap dan menulis setiap blok penuh ke file sementara
+# (path + ".part"), sehingga memori tidak tumbuh sepanjang sesi. close() menyusun file .npz dari file sementara.
+class TraceRecorder():
+    def __init__(self, path, maxHands=1, frameSize=(640, 480), chunkSize=1024):
+        """
+        :param path: Path file keluaran (.npz; akhiran ditambahkan jika belum ada).
+        :param maxHands: Jumlah tangan maksimum per frame yang disimpan.
+        :param frameSize: Ukuran frame (lebar, tinggi) bawaan, dipakai record() jika frameSize tidak diberikan.
+        :param chunkSize: Jumlah frame per blok yang ditulis ke file sementara.
+        """
+        self.path = npzPath(path)
+        self.maxHands = maxHands
+        self.frameSize = frameSize
+        self.partPath = self.path + ".part"
+        # Satu record per frame; file sementara berisi record mentah berurutan, bisa dibaca dengan np.fromfile.
+        self.dtype = np.dtype([("t", np.float64), ("landmarks", np.float32, (maxHands, htm.NUM_LANDMARKS, 3)),
+                               ("handedness", np.int8, (maxHands,)), ("scores", np.float32, (maxHands,)),
+                               ("frameSize", np.int32, (2,))])
+        self._chunk = np.zeros(chunkSize, dtype=self.dtype)
+        self._fill = 0
+        self._count = 0
+        self._part = None
+        self._closed = False
+
+    def record(self, t, lmArray, handedness, scores=None, frameSize=None):
+        """
+        :param t: Waktu capture frame (detik).
+        :param lmArray: Koordinat piksel (n_tangan, 21, 3) atau None jika tidak ada tangan.
+        :param handedness: Daftar 'Left'/'Right' per tangan.
+        :param scores: Daftar kepercayaan kiri/kanan per tangan.
+        :param frameSize: Ukuran frame ini (lebar, tinggi); resolusi capture bisa berubah di tengah sesi
+                          (misal oleh QualityController). None = ukuran bawaan recorder.
+        """
+        row = self._chunk[self._fill]
+        row["t"] = t
+        row["frameSize"] = self.frameSize if frameSize is None else frameSize
+        row["landmarks"] = 0.0
+        row["handedness"] = HAND_NONE
+        row["scores"] = 0.0
+        n = 0 if lmArray is None else min(len(lmArray), self.maxHands)
+        if n:
+            row["landmarks"][:n] = lmArray[:n]
+            for i in range(n):
+                row["handedness"][i] = HAND_RIGHT if i >= len(handedness) or handedness[i] == "Right" else HAND_LEFT
+                if scores and i < len(scores):
+                    row["scores"][i] = scores[i]
+        self._fill += 1
+        self._count += 1
+        if self._fill == len(self._chunk):
+            self._flush()
+
+    def _flush(self):
+        if not self._fill:
+            return
+        if self._part is None:
+            self._part = open(self.partPath, "wb")
+        self._chunk[:self._fill].tofile(self._part)
+        self._part.flush()
+        self._fill = 0
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._flush()
+        if self._part is None:
+            data = np.zeros(0, dtype=self.dtype)
+        else:
+            self._part.close()
+            # Dibaca lewat memmap: numpy menulis kolom .npz per potongan tanpa memuat seluruh sesi ke memori.
+            data = np.memmap(self.partPath, dtype=self.dtype, mode="r")
+        np.savez_compressed(
+            self.path,
+            t=data["t"],
+            landmarks=data["landmarks"],
+            handedness=data["handedness"],
+            scores=data["scores"],
+            frameSizes=data["frameSize"],
+            frameSize=data["frameSize"][0] if len(data) else np.array(self.frameSize, dtype=np.int32),
+        )
+        if self._part is not None:
+            del data
+            os.remove(self.partPath)
+
+    def __len__(self):
+        return self._count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# Kelas Trace memuat rekaman sebagai array berkolom.
+class Trace():
+    def __init__(self, t, landmarks, handedness, scores, frameSize, frameSizes=None):
+        self.t = t  # (N,) detik
+        self.landmarks = landmarks  # (N, maxHands, 21, 3) piksel
+        self.handedness = handedness  # (N, maxHands) HAND_NONE/HAND_LEFT/HAND_RIGHT
+        self.scores = scores  # (N, maxHands)
+        self.frameSize = tuple(int(v) for v in frameSize)  # Ukuran frame pertama
+        # (N, 2) lebar, tinggi per frame; rekaman tanpa kolom ini memakai frameSize untuk semua frame.
+        if frameSizes is None:
+            frameSizes = np.tile(np.array(self.frameSize, dtype=np.int32), (len(t), 1))
+        self.frameSizes = frameSizes
+        self.counts = (handedness != HAND_NONE).sum(axis=1)  # Jumlah tangan per frame
+
+    @classmethod
+    def load(cls, path):
+        data = np.load(path)
+        frameSizes = data["frameSizes"] if "frameSizes" in data.files else None
+        return cls(data["t"], data["landmarks"], data["handedness"], data["scores"], data["frameSize"], frameSizes)
+
+    def __len__(self):
+        return len(self.t)
+
+    def cursorTrace(self, landmark=8, frameR=100, screenSize=(1920, 1080)):
+        # Jejak (t, x, y) layar dari satu landmark, seperti masukan filter kursor (lihat FilterModule).
+        # Area aktif diskalakan dengan ukuran tiap frame, seperti VirtualMouseController.setCamSize.
+        baseW, baseH = self.frameSize
+        valid = self.counts > 0
+        xy = self.landmarks[valid, 0, landmark, :2]
+        w, h = self.frameSizes[valid].T.astype(np.float64)
+        r = np.round(frameR * np.minimum(w / baseW, h / baseH))
+        x = np.clip((xy[:, 0] - r) / (w - 2 * r), 0.0, 1.0) * screenSize[0]
+        y = np.clip((xy[:, 1] - r) / (h - 2 * r), 0.0, 1.0) * screenSize[1]
+        return np.stack([self.t[valid], x, y], axis=1)
+
+
+# Detektor pengganti yang membaca landmark dari rekaman, dengan API HandDetector(arrayMode=True).
+class TraceDetector():
+    arrayMode = True
+
+    def __init__(self, trace):
+        self.trace = trace
+        self.index = -1
+        maxHands = trace.landmarks.shape[1]
+        self.lmArray = np.zeros((maxHands, htm.NUM_LANDMARKS, 3), dtype=np.float32)
+        self.lmPixels = np.zeros((maxHands, htm.NUM_LANDMARKS, 3), dtype=np.int32)
+        self.isRight = np.ones(maxHands, dtype=bool)
+        self.numHands = 0
+        self.handedness = []
+        self.handScores = []
+        self.lmList = []
+        self.t = None
+
+    def findHands(self, img=None, draw=False):
+        # Maju ke frame rekaman berikutnya. img diabaikan (boleh None).
+        self.index += 1
+        trace, i = self.trace, self.index
+        self.t = trace.t[i]
+        n = self.numHands = int(trace.counts[i])
+        self.lmArray[:n] = trace.landmarks[i, :n]
+        self.lmPixels[:n] = self.lmArray[:n]
+        self.isRight[:n] = trace.handedness[i, :n] == HAND_RIGHT
+        self.handedness = ["Right" if r else "Left" for r in self.isRight[:n]]
+        self.handScores = trace.scores[i, :n].tolist()
+        return img
+
+    def findPosition(self, img=None, handNo=0, draw=False):
+        self.lmList = []
+        bbox = []
+        if handNo < self.numHands:
+            rows = self.lmPixels[handNo, :, :2].tolist()
+            self.lmList = htm.LandmarkList(self.lmPixels[handNo], rows)
+            bbox = htm.bboxRows(rows)
+        return self.lmList, bbox
+
+    def fingersUpAll(self):
+        n = self.numHands
+        return htm.fingersUpArray(self.lmPixels[:n], self.isRight[:n])
+
+    def fingersUp(self, handNo=0):
+        if handNo >= self.numHands:
+            return []
+        return htm.fingersUpRows(self.lmPixels[handNo, :, :2].tolist(), self.isRight[handNo])
+
+    def findDistance(self, p1, p2, img, draw=True, r=15, t=3, lmList=None):
+        return htm.distanceInfo(self.lmList if lmList is None else lmList, p1, p2, img, draw, r, t)
+
+
+def makeReplayController(frameSize, screenSize=(1920, 1080), cursorFilter=None):
+    # Controller gestur dengan jam palsu dan aktuator tiruan; aksi dieksekusi sinkron agar deterministik.
+    clock = csm.FakeClock()
+    actuator = am.RecordingBackend(clock)
+    controller = gcm.VirtualMouseController(actuator, screenSize, camSize=frameSize, cursorFilter=cursorFilter,
+                                            dispatcher=csm.ActionDispatcher(threaded=False))
+    return controller, clock
+
+
+def replayTrace(trace, screenSize=(1920, 1080), cursorFilter=None):
+    """
+    Memutar ulang rekaman melalui logika gestur secepat mungkin.
+
+    :return: (RecordingBackend berisi semua aksi, dict statistik waktu eksekusi).
+    """
+    controller, clock = makeReplayController(trace.frameSize, screenSize, cursorFilter)
+    detector = TraceDetector(trace)
+    frameSizes = trace.frameSizes.tolist()
+    start = time.perf_counter()
+    for i in range(len(trace)):
+        detector.findHands()
+        camSize = tuple(frameSizes[i])
+        if camSize != (controller.wCam, controller.hCam):
+            # Resolusi capture berubah saat merekam: pemetaan kamera -> layar mengikuti, seperti di AiVirtualMouse.
+            controller.setCamSize(camSize)
+        lmList, bbox = detector.findPosition()
+        fingers = detector.fingersUp(0) if lmList else []
+        clock.now = detector.t
+        controller.process(None, lmList, fingers, detector.t)
+    elapsed = time.perf_counter() - start
+    duration = trace.t[-1] - trace.t[0] if len(trace) > 1 else 0.0
+    return controller.actuator, {"frames": len(trace), "elapsed": elapsed,
+                                 "speedup": duration / elapsed if elapsed else float("inf")}
+
+
+def replayVideo(path, screenSize=(1920, 1080), recordPath=None, flip=True):
+    # Memutar ulang file video melalui HandDetector dan logika gestur; opsional merekam jejaknya.
+    cv2 = lim.cv2()
+
+    cap = cv2.VideoCapture(path)
+    fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+    detector = htm.HandDetector(maxHands=1, detectionCon=0.75, trackCon=0.75, arrayMode=True)
+    controller = clock = recorder = None
+    frames = 0
+    start = time.perf_counter()
+    while True:
+        success, img = cap.read()
+        if not success:
+            break
+        if flip:
+            img = cv2.flip(img, 1)
+        h, w, c = img.shape
+        if controller is None:
+            controller, clock = makeReplayController((w, h), screenSize)
+            if recordPath:
+                recorder = TraceRecorder(recordPath, detector.maxHands, (w, h))
+        t = frames / fps  # Waktu video, bukan waktu dinding, agar hasil deterministik
+        detector.findHands(img, draw=False)
+        lmList, bbox = detector.findPosition(img, draw=False)
+        fingers = detector.fingersUp(0) if lmList else []
+        if recorder is not None:
+            recorder.record(t, detector.lmArray[:detector.numHands], detector.handedness, detector.handScores,
+                            (w, h))
+        clock.now = t
+        controller.process(None, lmList, fingers, t)
+        frames += 1
+    cap.release()
+    if recorder is not None:
+        recorder.close()
+    elapsed = time.perf_counter() - start
+    actuator = controller.actuator if controller else am.RecordingBackend()
+    return actuator, {"frames": frames, "elapsed": elapsed,
+                      "speedup": (frames / fps) / elapsed if elapsed else float("inf")}
+
+
+def record(path, source=0, flip=True, show=True):
+    # Merekam jejak landmark dari webcam atau file video sampai sumber habis atau tombol 'q' ditekan.
+    cv2 = lim.cv2()
+
+    cap = cv2.VideoCapture(source)
+    detector = htm.HandDetector(maxHands=1, detectionCon=0.75, trackCon=0.75, arrayMode=True)
+    recorder = None
+    try:
+        while True:
+            success, img = cap.read()
+            if not success:
+                break
+            t = time.perf_counter()
+            if flip:
+                img = cv2.flip(img, 1)
+            h, w, c = img.shape
+            if recorder is None:
+                recorder = TraceRecorder(path, detector.maxHands, (w, h))
+            img = detector.findHands(img, draw=show)
+            detector.findPosition(img, draw=show)
+            recorder.record(t, detector.lmArray[:detector.numHands], detector.handedness, detector.handScores,
+                            (w, h))
+            if show:
+                cv2.imshow("Record", img)
+                if cv2.waitKey(1) & 0xFF == ord('q'):
+                    break
+    finally:
+        # Rekaman tetap disimpan jika loop berhenti karena error atau Ctrl+C.
+        cap.release()
+        if show:
+            cv2.destroyAllWindows()
+        if recorder is not None:
+            recorder.close()
+    return len(recorder) if recorder else 0
+
+
+def printSummary(actuator, stats):
+    counts = {name: actuator.count(name) for name in ("move", "click", "doubleClick", "toggle", "scroll")}
+    print(f"{stats['frames']} frame dalam {stats['elapsed']:.3f} s ({stats['speedup']:.1f}x waktu nyata)")
+    print("Aksi mouse: " + ", ".join(f"{k}={v}" for k, v in counts.items()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+    rec = sub.add_parser("record", help="Rekam jejak landmark ke file .npz")
+    rec.add_argument("output", help="Path file .npz keluaran")
+    rec.add_argument("--video", help="File video sumber (bawaan: webcam 0)")
+    rec.add_argument("--no-show", action="store_true", help="Jangan tampilkan jendela pratinjau")
+    rep = sub.add_parser("replay", help="Putar ulang jejak .npz atau file video melalui logika gestur")
+    rep.add_argument("input", help="File .npz hasil rekaman atau file video")
+    rep.add_argument("--record", help="Saat memutar video, simpan juga jejaknya ke file .npz ini")
+    args = parser.parse_args()
+
+    if args.command == "record":
+        n = record(args.output, args.video if args.video else 0, show=not args.no_show)
+        print(f"{n} frame direkam ke {npzPath(args.output)}")
+    elif args.input.endswith(".npz"):
+        printSummary(*replayTrace(Trace.load(args.input)))
+    else:
+        printSummary(*replayVideo(args.input, recordPath=args.record))
+
+
+# Blok ini memastikan bahwa fungsi main() hanya dipanggil saat skrip dijalankan langsung.
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark: jumlah panggilan backend mouse per detik, aksi langsung vs CoalescingActuator.
+
+    python benchmarks/bench_actuation.py                    # kursor 120 fps + scroll, layar 60 Hz
+    python benchmarks/bench_actuation.py --fps 30 --rate 144
+
+Aksi dihasilkan dengan jam palsu (deterministik, tanpa desktop) dan dicatat oleh RecordingBackend.
+Gerak dirapatkan ke posisi terakhir per refresh layar, delta scroll pecahan diakumulasi, dan klik
+tidak pernah dibuang; total scroll yang terkirim harus sama dengan jumlah delta (dibulatkan ke nol).
+"""
+
+import argparse
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import ActuationModule as am  # noqa: E402
+import ClickSchedulerModule as csm  # noqa: E402
+
+
+def drive(actuator, clock, args):
+    # Kursor bergerak melingkar; setiap detik ketiga berisi scroll kecil, dan satu klik per detik.
+    rng = np.random.default_rng(0)
+    frames = int(args.fps * args.seconds)
+    scrollTotal = 0.0
+    for i in range(frames):
+        t = i / args.fps
+        clock.now = t
+        actuator.move(960 + 400 * np.cos(t), 540 + 300 * np.sin(t))
+        if int(t) % 3 == 2:
+            delta = rng.normal(0.6, 0.4)
+            actuator.scroll(delta if getattr(actuator, "fractionalScroll", False) else int(delta))
+            scrollTotal += delta
+        if i % args.fps == 0:
+            actuator.click("left")
+    return scrollTotal
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fps", type=int, default=120, help="Laju aksi dari controller (frame/detik)")
+    parser.add_argument("--rate", type=float, default=60, help="Refresh rate layar (batch/detik)")
+    parser.add_argument("--seconds", type=float, default=30, help="Durasi simulasi")
+    args = parser.parse_args()
+
+    clock = csm.FakeClock()
+    direct = am.RecordingBackend(clock)
+    directScroll = drive(direct, clock, args)
+
+    clock = csm.FakeClock()
+    recorded = am.RecordingBackend(clock)
+    coalesced = am.CoalescingActuator(recorded, rate=args.rate, threaded=False, clock=clock)
+    coalescedScroll = drive(coalesced, clock, args)
+    coalesced.stop()
+
+    for name, backend, scrollTotal in (("langsung", direct, directScroll), ("dirapatkan", recorded, coalescedScroll)):
+        sent = sum(call[2][0] for call in backend.calls if call[1] == "scroll")
+        print(f"{name:>10}: {len(backend.calls) / args.seconds:7.1f} panggilan/detik  "
+              f"move={backend.count('move')} click={backend.count('click')} scroll={backend.count('scroll')}  "
+              f"scroll terkirim {sent} dari delta {scrollTotal:.1f}  batch={backend.syncs}")
+    print(f"gerak diterima {coalesced.movesIn}, dikirim {coalesced.movesOut}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark: evaluasi offline per frame (findHands -> findPosition -> fingersUp/findDistance per tangan,
+dekode di thread yang sama) vs BatchModule.iterBatches (dekode prefetch + turunan vektor per chunk).
+
+    python benchmarks/bench_batch.py --video sesi.mp4    # klip berisi tangan (disarankan)
+    python benchmarks/bench_batch.py                     # frame sintetis
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import BatchModule as bm  # noqa: E402
+import HandTrackingModule as htm  # noqa: E402
+import PipelineModule as plm  # noqa: E402
+
+
+def frames(args):
+    if args.video:
+        return bm.videoFrames(args.video)[0]
+    source = plm.SyntheticSource(frames=args.frames, realtime=False)
+    return iter(lambda: source.read()[1], None)
+
+
+def perFrame(args):
+    detector = htm.HandDetector(maxHands=args.max_hands, arrayMode=True)
+    count = 0
+    for img in frames(args):
+        detector.findHands(img, draw=False)
+        for handNo in range(max(1, detector.numHands)):
+            lmList, bbox = detector.findPosition(img, handNo=handNo, draw=False)
+            if lmList:
+                detector.fingersUp(handNo)
+                detector.findDistance(4, 8, img, draw=False)
+                detector.findDistance(8, 12, img, draw=False)
+        count += 1
+    return count
+
+
+def batched(args):
+    return sum(len(batch) for batch in bm.iterBatches(frames(args), args.chunk, args.max_hands))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--video", help="Path file video (bawaan: sumber sintetis)")
+    parser.add_argument("--frames", type=int, default=300, help="Jumlah frame sintetis")
+    parser.add_argument("--chunk", type=int, default=256, help="Jumlah frame per chunk")
+    parser.add_argument("--max-hands", type=int, default=2, help="Jumlah tangan maksimum per frame")
+    args = parser.parse_args()
+
+    for name, fn in (("per frame", perFrame), ("batch", batched)):
+        start = time.perf_counter()
+        count = fn(args)
+        elapsed = time.perf_counter() - start
+        print(f"{name:>9}: {count} frame dalam {elapsed:6.2f} s ({count / elapsed:6.1f} frame/detik)")
+
+
+if __name__ == "__main__":
+    main()
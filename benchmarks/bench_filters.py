@@ -0,0 +1,75 @@
+"""
+Replay harness: menilai lag dan jitter filter kursor (FilterModule) pada jejak rekaman.
+
+    python benchmarks/bench_filters.py                       # jejak sintetis (diam, gerak sinus, lompatan)
+    python benchmarks/bench_filters.py jejak.csv             # kolom t,x,y (detik, piksel layar)
+    python benchmarks/bench_filters.py jejak.npz             # array t, x, y, atau rekaman TraceModule
+    python benchmarks/bench_filters.py --param oneeuro.beta=0.02 --param kalman.processNoise=1e6
+
+Lag yang lebih kecil pada jitter yang sama berarti kursor terasa lebih responsif.
+"""
+
+import argparse
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import FilterModule as fm  # noqa: E402
+import TraceModule as tm  # noqa: E402
+
+
+def syntheticTrace(fps=30, seconds=12, noise=3.0, seed=0):
+    # Diam (uji jitter), lalu gerak sinus lambat dan cepat, lalu lompatan (uji lag).
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(fps * seconds)) / fps
+    x = np.full_like(t, 960.0)
+    y = np.full_like(t, 540.0)
+    moving = (t >= 3) & (t < 9)
+    x[moving] += 500 * np.sin(2 * np.pi * 0.3 * (t[moving] - 3))
+    y[moving] += 250 * np.sin(2 * np.pi * 0.9 * (t[moving] - 3))
+    x[t >= 9] = 400.0
+    y[t >= 9] = 300.0
+    x += rng.normal(0, noise, len(t))
+    y += rng.normal(0, noise, len(t))
+    return np.stack([t, x, y], axis=1)
+
+
+def loadTrace(path):
+    if path.endswith(".npz"):
+        data = np.load(path)
+        if "landmarks" in data:
+            # Rekaman TraceModule: ujung telunjuk dipetakan ke layar seperti di AiVirtualMouse.py.
+            return tm.Trace.load(path).cursorTrace()
+        return np.stack([data["t"], data["x"], data["y"]], axis=1)
+    return np.loadtxt(path, delimiter=",", skiprows=1, usecols=(0, 1, 2))
+
+
+def parseParams(items):
+    # "oneeuro.beta=0.02" -> {"oneeuro": {"beta": 0.02}}
+    params = {}
+    for item in items:
+        key, value = item.split("=", 1)
+        name, field = key.split(".", 1)
+        params.setdefault(name, {})[field] = float(value)
+    return params
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("trace", nargs="?", help="Jejak .csv (t,x,y) atau .npz; bawaan: sintetis")
+    parser.add_argument("--param", action="append", default=[], help="Parameter filter, misal oneeuro.beta=0.02")
+    args = parser.parse_args()
+
+    trace = loadTrace(args.trace) if args.trace else syntheticTrace()
+    params = parseParams(args.param)
+    print(f"{len(trace)} sampel, {trace[-1, 0] - trace[0, 0]:.1f} detik")
+    for name in fm.FILTERS:
+        score = fm.scoreFilter(fm.createFilter(name, **params.get(name, {})), trace)
+        print(f"{name:>12}: lag {score['lag_ms']:6.1f} ms | jitter {score['jitter_px']:5.2f} px | "
+              f"error {score['error_px']:6.1f} px")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark: mode pratinjau (flip + semua gambar) vs mode headless (tanpa gambar, landmark dicerminkan).
+
+    python benchmarks/bench_headless.py                  # frame sintetis
+    python benchmarks/bench_headless.py --video a.mp4    # klip berisi tangan (disarankan)
+
+Waktu per frame mencakup flip, deteksi, findPosition, logika gestur dan teks FPS,
+tetapi tidak cv2.imshow (tidak tersedia tanpa layar), jadi penghematan sebenarnya lebih besar.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import ActuationModule as am  # noqa: E402
+import GestureControlModule as gcm  # noqa: E402
+import HandTrackingModule as htm  # noqa: E402
+import PipelineModule as plm  # noqa: E402
+
+
+def run(args, headless):
+    source = (plm.CameraSource(args.video, realtime=False) if args.video
+              else plm.SyntheticSource(frames=args.frames, realtime=False))
+    detector = htm.HandDetector(maxHands=1, detectionCon=0.75, trackCon=0.75, arrayMode=True, mirror=headless)
+    controller = gcm.VirtualMouseController(am.RecordingBackend(), (1920, 1080))
+    times = []
+    while len(times) < args.frames:
+        success, img = source.read()
+        if not success:
+            break
+        start = time.perf_counter()
+        if not headless:
+            img = cv2.flip(img, 1)
+        detector.findHands(img, draw=not headless)
+        lmList, bbox = detector.findPosition(img, draw=not headless)
+        fingers = detector.fingersUp(0) if lmList else []
+        controller.process(None if headless else img, lmList, fingers, start)
+        if not headless:
+            cv2.putText(img, "30", (20, 50), cv2.FONT_HERSHEY_PLAIN, 3, (255, 0, 255), 3)
+        times.append(time.perf_counter() - start)
+    source.release()
+    return np.array(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--video", help="Path file video (bawaan: sumber sintetis)")
+    parser.add_argument("--frames", type=int, default=300, help="Jumlah frame maksimum")
+    args = parser.parse_args()
+
+    preview = run(args, headless=False)
+    headless = run(args, headless=True)
+    for name, times in (("pratinjau", preview), ("headless", headless)):
+        print(f"{name:>9}: rata-rata {times.mean():6.2f} ms  p50 {np.percentile(times, 50):6.2f} ms  "
+              f"p95 {np.percentile(times, 95):6.2f} ms")
+    print(f"hemat {preview.mean() - headless.mean():.2f} ms per frame")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark: loop serial vs pipeline bertahap (PipelineModule).
+
+Dijalankan tanpa webcam dan tanpa jendela GUI:
+    python benchmarks/bench_pipeline.py                      # sumber sintetis 30 FPS
+    python benchmarks/bench_pipeline.py --video rekaman.mp4  # file video, diputar sesuai FPS aslinya
+
+Melaporkan FPS yang diproses dan latensi "kaca-ke-kursor" (frame diambil -> hasil siap diaktuasi).
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import HandTrackingModule as htm  # noqa: E402
+import PipelineModule as plm  # noqa: E402
+
+
+def makeSource(args):
+    if args.video:
+        return plm.CameraSource(args.video, realtime=not args.unpaced)
+    return plm.SyntheticSource(frames=args.frames, fps=args.fps, realtime=not args.unpaced)
+
+
+def runSerial(args):
+    # Meniru loop asli AiVirtualMouse.py: capture -> flip -> inferensi -> aktuasi secara berurutan.
+    source = makeSource(args)
+    detector = htm.HandDetector(maxHands=1, detectionCon=0.75, trackCon=0.75)
+    latencies = []
+    start = time.perf_counter()
+    while True:
+        success, img = source.read()
+        if not success:
+            break
+        tCapture = time.perf_counter()
+        img = cv2.flip(img, 1)
+        img = detector.findHands(img)
+        lmList, bbox = detector.findPosition(img)
+        if lmList:
+            detector.fingersUp(0)
+        latencies.append(time.perf_counter() - tCapture)
+    elapsed = time.perf_counter() - start
+    source.release()
+    return len(latencies), elapsed, latencies, 0
+
+
+def runPipeline(args):
+    source = makeSource(args)
+    detector = htm.HandDetector(maxHands=1, detectionCon=0.75, trackCon=0.75)
+    pipeline = plm.HandPipeline(source, detector, flip=True).start()
+    latencies = []
+    start = time.perf_counter()
+    while True:
+        result = pipeline.get()
+        if result is None:
+            break
+        latencies.append(time.perf_counter() - result.tCapture)
+    elapsed = time.perf_counter() - start
+    pipeline.stop()
+    return len(latencies), elapsed, latencies, pipeline.dropped
+
+
+def report(name, n, elapsed, latencies, dropped):
+    lat = np.array(latencies) * 1000 if latencies else np.zeros(1)
+    print(f"{name:>9}: {n:5d} frame dalam {elapsed:6.2f} s = {n / elapsed:6.1f} FPS | "
+          f"latensi p50 {np.percentile(lat, 50):6.1f} ms  p95 {np.percentile(lat, 95):6.1f} ms | "
+          f"dibuang {dropped}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--video", help="Path file video (bawaan: sumber sintetis)")
+    parser.add_argument("--frames", type=int, default=300, help="Jumlah frame sintetis")
+    parser.add_argument("--fps", type=float, default=30, help="FPS sumber sintetis")
+    parser.add_argument("--unpaced", action="store_true", help="Baca frame secepat mungkin, bukan sesuai ritme kamera")
+    args = parser.parse_args()
+
+    report("serial", *runSerial(args))
+    report("pipeline", *runPipeline(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Benchmark: perilaku QualityController saat beban CPU berubah (simulasi deterministik, tanpa kamera).
+
+    python benchmarks/bench_quality.py                  # target 33 ms, beban naik 2.5x di tengah sesi
+    python benchmarks/bench_quality.py --target 20 --load 4
+
+Waktu proses per frame dimodelkan dari pengaturan tingkat yang berlaku (jumlah piksel inferensi,
+model ringan/penuh, interval deteksi) dikali faktor beban dan noise. Dicetak lintasan tingkat,
+jumlah perpindahan, dan porsi frame yang melewati anggaran per fase, dibandingkan dengan
+pengaturan tetap (tingkat 1).
+"""
+
+import argparse
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import QualityControllerModule as qcm  # noqa: E402
+
+BASE_MS = 18.0  # Waktu proses tingkat 1 (640x480, model penuh) tanpa beban tambahan
+
+
+class SimulatedPipeline():
+    # Sumber dan detektor palsu: hanya mencatat pengaturan yang diminta QualityController.
+    def __init__(self):
+        self.captureSize = (640, 480)
+        self.inputSize = None
+        self.modelComplexity = 1
+        self.detectInterval = 1
+        self.frame = 0
+
+    def requestResolution(self, w, h):
+        self.captureSize = (w, h)
+
+    def configure(self, **settings):
+        for key, value in settings.items():
+            setattr(self, key, value)
+
+    def cost(self, load, rng):
+        # Waktu proses frame ini (detik) untuk pengaturan yang berlaku.
+        w, h = self.captureSize
+        if self.inputSize:
+            scale = self.inputSize / max(w, h)
+            w, h = w * scale, h * scale
+        ms = 3.0 + (BASE_MS - 3.0) * (w * h) / (640 * 480)
+        ms *= 1.0 if self.modelComplexity else 0.6
+        self.frame += 1
+        if self.frame % self.detectInterval:
+            ms = 2.0  # Frame prediksi: tanpa inferensi
+        return ms * load * rng.lognormal(0.0, 0.15) / 1000.0
+
+
+class _Scheduler():
+    # Pengganti AdaptiveScheduler agar detectInterval juga disimulasikan.
+    def __init__(self, pipeline):
+        self.pipeline = pipeline
+        self.maxInterval = 1
+
+    @property
+    def minInterval(self):
+        return self.pipeline.detectInterval
+
+    @minInterval.setter
+    def minInterval(self, value):
+        self.pipeline.detectInterval = value
+
+
+class _Tracker():
+    def __init__(self, pipeline):
+        self.detector = pipeline
+        self.scheduler = _Scheduler(pipeline)
+
+
+def run(args, adaptive):
+    rng = np.random.default_rng(0)
+    pipeline = SimulatedPipeline()
+    controller = None
+    if adaptive:
+        controller = qcm.QualityController(args.target, source=pipeline, detector=_Tracker(pipeline))
+    phases = ((args.frames, 1.0), (args.frames, args.load), (args.frames, 1.0))
+    rows = []
+    for name, (frames, load) in zip(("normal", "beban", "pulih"), phases):
+        over = 0
+        levels = []
+        for _ in range(frames):
+            seconds = pipeline.cost(load, rng)
+            over += seconds * 1000 > args.target
+            if controller is not None:
+                controller.update(seconds)
+                levels.append(controller.level)
+        rows.append((name, load, over / frames, levels))
+    return rows, controller
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", type=float, default=33, help="Anggaran waktu per frame (ms)")
+    parser.add_argument("--load", type=float, default=2.5, help="Faktor beban pada fase tengah")
+    parser.add_argument("--frames", type=int, default=1800, help="Jumlah frame per fase")
+    args = parser.parse_args()
+
+    fixed, _ = run(args, adaptive=False)
+    adaptive, controller = run(args, adaptive=True)
+    for (name, load, fixedOver, _), (_, _, over, levels) in zip(fixed, adaptive):
+        counts = np.bincount(levels, minlength=len(qcm.LEVELS))
+        print(f"{name:>6} (beban {load:.1f}x): lewat anggaran tetap {fixedOver:6.1%}  adaptif {over:6.1%}  "
+              f"frame per tingkat {counts.tolist()}")
+    print(f"perpindahan tingkat: {len(controller.changes)}")
+    for frame, old, new, p90 in controller.changes:
+        print(f"  frame {frame:5d}: {old} -> {new}  (p90 {p90:5.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark: inferensi frame penuh vs mode ROI (HandDetector(roiMode=True)).
+
+Membutuhkan klip rekaman yang berisi tangan (frame sintetis tidak memicu deteksi):
+    python benchmarks/bench_roi.py rekaman.mp4
+    python benchmarks/bench_roi.py rekaman.mp4 --roi-size 192
+
+Melaporkan waktu findHands per frame, tingkat deteksi, rasio ROI yang berhasil,
+dan selisih rata-rata posisi landmark terhadap mode frame penuh.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import HandTrackingModule as htm  # noqa: E402
+
+
+def run(path, maxFrames, **kwargs):
+    cap = cv2.VideoCapture(path)
+    detector = htm.HandDetector(maxHands=1, detectionCon=0.75, trackCon=0.75, arrayMode=True, **kwargs)
+    times, landmarks = [], []
+    while len(times) < maxFrames:
+        success, img = cap.read()
+        if not success:
+            break
+        img = cv2.flip(img, 1)
+        start = time.perf_counter()
+        detector.findHands(img, draw=False)
+        times.append(time.perf_counter() - start)
+        lmList, bbox = detector.findPosition(img, draw=False)
+        landmarks.append(detector.lmArray[0, :, :2].copy() if lmList else None)
+    cap.release()
+    return np.array(times) * 1000, landmarks, detector
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("video", help="Path klip rekaman")
+    parser.add_argument("--frames", type=int, default=1000, help="Jumlah frame maksimum")
+    parser.add_argument("--roi-size", type=int, default=256, help="Sisi potongan ROI persegi untuk inferensi (piksel)")
+    parser.add_argument("--roi-pad", type=float, default=0.35, help="Margin ROI relatif terhadap kotak tangan")
+    args = parser.parse_args()
+
+    fullTimes, fullLms, _ = run(args.video, args.frames)
+    roiTimes, roiLms, roiDetector = run(args.video, args.frames, roiMode=True,
+                                        roiSize=args.roi_size, roiPad=args.roi_pad)
+
+    for name, times, lms in (("penuh", fullTimes, fullLms), ("ROI", roiTimes, roiLms)):
+        detected = sum(lm is not None for lm in lms) / max(len(lms), 1)
+        print(f"{name:>6}: rata-rata {times.mean():6.2f} ms  p50 {np.percentile(times, 50):6.2f} ms  "
+              f"p95 {np.percentile(times, 95):6.2f} ms | terdeteksi {detected:6.1%}")
+
+    both = [np.linalg.norm(a - b, axis=1).mean() for a, b in zip(fullLms, roiLms) if a is not None and b is not None]
+    hits, misses = roiDetector.roiHits, roiDetector.roiMisses
+    print(f"ROI berhasil {hits}/{hits + misses} frame | selisih landmark rata-rata "
+          f"{np.mean(both) if both else float('nan'):.2f} px | percepatan {fullTimes.mean() / roiTimes.mean():.2f}x")
+
+
+if __name__ == "__main__":
+    main()
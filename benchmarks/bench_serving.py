@@ -0,0 +1,69 @@
+"""
+Benchmark: throughput agregat HandServer untuk N kamera dengan 1 pekerja vs N pekerja.
+
+    python benchmarks/bench_serving.py --cameras 4              # N sumber sintetis
+    python benchmarks/bench_serving.py --video a.mp4 --cameras 4  # N salinan klip yang sama
+
+Sumber dibaca secepat mungkin (tanpa ritme kamera), jadi angka FPS adalah kapasitas mesin,
+bukan laju kamera. Dengan satu pekerja per kamera dan inti CPU yang cukup, throughput
+diharapkan naik hampir linear terhadap jumlah kamera.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import PipelineModule as plm  # noqa: E402
+import ServingModule as svm  # noqa: E402
+
+
+def run(args, cameras, workers):
+    sources = [plm.CameraSource(args.video, realtime=False) if args.video
+               else plm.SyntheticSource(frames=args.frames, realtime=False, seed=i)
+               for i in range(cameras)]
+    server = svm.HandServer(sources, workers=workers, slots=args.slots, dropFrames=False,
+                            detectorKwargs={"maxHands": 1, "detectionCon": 0.75, "trackCon": 0.75})
+    server.start()
+    latencies = []
+    lastSeq = [-1] * cameras
+    start = None
+    count = 0
+    try:
+        while True:
+            result = server.get(timeout=30.0)
+            if result is None:
+                break
+            if start is None:
+                # Mulai menghitung setelah hasil pertama agar waktu start proses pekerja tidak ikut terukur.
+                start = time.perf_counter()
+            assert result.seq == lastSeq[result.camId] + 1, "urutan hasil per kamera tidak terjaga"
+            lastSeq[result.camId] = result.seq
+            latencies.append(time.perf_counter() - result.tCapture)
+            count += 1
+    finally:
+        server.stop()
+    elapsed = time.perf_counter() - start
+    return count / elapsed, np.array(latencies) * 1000, sum(server.dropped)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--video", help="Path file video (bawaan: sumber sintetis)")
+    parser.add_argument("--cameras", type=int, default=min(4, os.cpu_count() or 1), help="Jumlah kamera N")
+    parser.add_argument("--frames", type=int, default=200, help="Jumlah frame per kamera sintetis")
+    parser.add_argument("--slots", type=int, default=3, help="Slot shared memory per kamera")
+    args = parser.parse_args()
+
+    print(f"{args.cameras} kamera, {os.cpu_count()} CPU")
+    for workers in sorted({1, args.cameras}):
+        fps, latencies, dropped = run(args, args.cameras, workers)
+        print(f"{workers:>2} pekerja: {fps:7.1f} frame/detik total  latensi p50 {np.percentile(latencies, 50):6.1f} ms  "
+              f"p95 {np.percentile(latencies, 95):6.1f} ms  dibuang {dropped}")
+
+
+if __name__ == "__main__":
+    main()
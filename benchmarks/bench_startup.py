@@ -0,0 +1,96 @@
+"""
+Benchmark: waktu mulai dingin, setiap pengukuran di proses Python baru.
+
+    python benchmarks/bench_startup.py               # webcam 0
+    python benchmarks/bench_startup.py --source a.mp4
+    python benchmarks/bench_startup.py --repeat 5
+
+- impor: waktu `import HandTrackingModule` dan `import AiVirtualMouse` (mediapipe tidak boleh ikut termuat).
+- frame pertama: dari awal proses sampai landmark frame pertama tersedia, untuk urutan lama
+  (buka kamera -> bangun graf -> proses frame pertama) vs urutan baru (graf dibangun dan dipanaskan
+  di latar belakang sementara kamera dibuka).
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+print(json.dumps({{"seconds": time.perf_counter() - start, "mediapipe": "mediapipe" in sys.modules}}))
+"""
+
+FIRST_FRAME_SCRIPT = """
+import json, time
+start = time.perf_counter()
+from concurrent.futures import ThreadPoolExecutor
+import HandTrackingModule as htm
+import PipelineModule as plm
+source = {source!r}
+
+def build():
+    detector = htm.HandDetector(maxHands=1, detectionCon=0.75, trackCon=0.75, arrayMode=True)
+    return detector.warmup() if {overlap} else detector
+
+if {overlap}:
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        ready = executor.submit(build)
+        camera = plm.CameraSource(source, 640, 480)
+        detector = ready.result()
+else:
+    camera = plm.CameraSource(source, 640, 480)
+    detector = build()
+opened = time.perf_counter()
+success, img = camera.read()
+if success:
+    detector.findHands(img, draw=False)
+    detector.findPosition(img, draw=False)
+print(json.dumps({{"seconds": time.perf_counter() - start, "ready": opened - start, "frame": success}}))
+camera.release()
+"""
+
+
+def runScript(script):
+    output = subprocess.run([sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True)
+    if output.returncode != 0:
+        lines = output.stderr.strip().splitlines()
+        raise RuntimeError(lines[-1] if lines else f"kode keluar {output.returncode}")
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", default="0", help="Indeks webcam atau path file video")
+    parser.add_argument("--repeat", type=int, default=3, help="Jumlah pengulangan per pengukuran")
+    args = parser.parse_args()
+    source = int(args.source) if args.source.isdigit() else args.source
+
+    for module in ("HandTrackingModule", "AiVirtualMouse"):
+        runs = [runScript(IMPORT_SCRIPT.format(module=module)) for _ in range(args.repeat)]
+        seconds = np.array([r["seconds"] for r in runs]) * 1000
+        print(f"import {module:<18}: median {np.median(seconds):7.1f} ms  mediapipe dimuat: {runs[0]['mediapipe']}")
+
+    for name, overlap in (("berurutan", False), ("paralel", True)):
+        try:
+            runs = [runScript(FIRST_FRAME_SCRIPT.format(source=source, overlap=overlap)) for _ in range(args.repeat)]
+        except RuntimeError as e:
+            print(f"frame pertama {name:>9}: gagal ({e})")
+            continue
+        if not all(r["frame"] for r in runs):
+            print(f"{name}: sumber {source!r} tidak menghasilkan frame")
+            continue
+        total = np.array([r["seconds"] for r in runs]) * 1000
+        ready = np.array([r["ready"] for r in runs]) * 1000
+        print(f"frame pertama {name:>9}: median {np.median(total):7.1f} ms  (kamera+graf siap {np.median(ready):7.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,328 @@
+"""
+Benchmark suite: jalur panas pelacakan tangan dan gestur, tanpa webcam maupun layar.
+
+    python benchmarks/bench_suite.py                          # data sintetis bawaan
+    python benchmarks/bench_suite.py --save baseline.json     # simpan hasil sebagai baseline
+    python benchmarks/bench_suite.py --compare baseline.json  # bandingkan; kode keluar 1 jika ada regresi
+    python benchmarks/bench_suite.py --trace sesi.npz         # jejak rekaman TraceModule
+    python benchmarks/bench_suite.py --mediapipe              # juga findHands dengan model MediaPipe asli
+
+Data bawaan dibuat deterministik (seed tetap): jejak landmark satu tangan kanan yang memainkan
+skrip gestur (tangan hilang, reset, mulai tracking, gerak kursor, tap dan tahan jempol, klik kanan,
+scroll) dan frame yang digambar dari jejak itu. Tahap yang diukur per frame:
+
+- findHands                : toRgb ke buffer + penguraian hasil; graf MediaPipe diganti pemutar ulang
+                             hasil dari jejak agar angka tidak bergantung pada model
+- findPosition, fingersUp,
+  findDistance             : HandDetector mode array (rekaman, deteksi adaptif) dan mode daftar (":list",
+                             bawaan AiVirtualMouse)
+- gesture                  : VirtualMouseController.process (mode, filter kursor, scroll, tap dan cooldown klik)
+- mediapipe                : findHands dengan model asli (hanya dengan --mediapipe)
+
+Untuk setiap tahap dilaporkan throughput (panggilan/detik), p50/p95/p99, serta alokasi sementara
+rata-rata dan terburuk per panggilan (tracemalloc, pada putaran terpisah agar tidak memengaruhi waktu).
+Perbandingan dengan baseline menandai regresi jika salah satu angka itu naik lebih dari --tolerance;
+baseline hanya bermakna jika diukur di mesin yang sama.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import HandTrackingModule as htm  # noqa: E402
+import ProfilerModule as prm  # noqa: E402
+import TraceModule as tm  # noqa: E402
+
+# Skrip gestur data sintetis: (durasi detik, pola jari [jempol..kelingking] atau None = tanpa tangan, gerakan).
+SCRIPT = (
+    (0.5, None, "still"),
+    (0.5, "11111", "still"),  # Tangan terbuka: reset ke IDLE
+    (0.3, "01000", "still"),  # Telunjuk: mulai TRACKING
+    (2.0, "01000", "circle"),  # Gerak kursor
+    (0.2, "11000", "circle"),  # Tap jempol: klik kiri
+    (0.6, "01000", "circle"),
+    (0.2, "11000", "circle"),  # Dua tap berdekatan: double klik
+    (0.2, "01000", "circle"),
+    (0.2, "11000", "circle"),
+    (0.6, "01000", "circle"),
+    (1.3, "11000", "circle"),  # Jempol ditahan: tahan kiri, lalu lepas
+    (0.5, "01000", "circle"),
+    (0.4, "01001", "circle"),  # Kelingking: klik kanan
+    (0.5, "01000", "circle"),
+    (2.0, "01100", "vertical"),  # Telunjuk + tengah rapat: scroll
+    (0.5, "00000", "still"),  # Kepalan: reset
+)
+
+# Sambungan kerangka tangan (sama dengan HAND_CONNECTIONS MediaPipe) untuk menggambar frame sintetis.
+CONNECTIONS = ((0, 1), (1, 2), (2, 3), (3, 4), (0, 5), (5, 6), (6, 7), (7, 8), (5, 9), (9, 10), (10, 11),
+               (11, 12), (9, 13), (13, 14), (14, 15), (15, 16), (13, 17), (0, 17), (17, 18), (18, 19), (19, 20))
+
+# Urutan tahap di laporan, mengikuti urutan pemanggilan dalam satu frame.
+STAGES = ("mediapipe", "findHands", "findPosition", "fingersUp", "findDistance",
+          "findPosition:list", "fingersUp:list", "findDistance:list", "gesture")
+METRICS = ("p50_ms", "p95_ms", "alloc_kib", "peak_kib")
+
+
+def handLandmarks(cx, cy, code):
+    # Landmark piksel (21, 3) tangan kanan di frame yang sudah dicerminkan (jempol di kiri).
+    lm = np.zeros((htm.NUM_LANDMARKS, 3), dtype=np.float32)
+    lm[0, :2] = (cx, cy + 70)
+    if code[0] == "1":  # Jempol lurus ke kiri-atas: ujung di kiri sendi
+        lm[1:5, :2] = [(cx - 25, cy + 45), (cx - 45, cy + 30), (cx - 60, cy + 15), (cx - 75, cy)]
+    else:  # Jempol ditekuk ke telapak: ujung di kanan sendi
+        lm[1:5, :2] = [(cx - 25, cy + 45), (cx - 35, cy + 30), (cx - 25, cy + 20), (cx - 15, cy + 20)]
+    for finger, dx in zip(range(1, 5), (-24, -8, 8, 24)):
+        base = 4 * finger + 1
+        if code[finger] == "1":
+            joints = (0, -30, -50, -68)
+        else:
+            joints = (0, -22, -10, 2)  # Ujung di bawah sendi kedua = jari ditekuk
+        lm[base:base + 4, 0] = cx + dx
+        lm[base:base + 4, 1] = [cy + dy for dy in joints]
+    lm[:, 2] = -0.02 * np.arange(htm.NUM_LANDMARKS)
+    return lm
+
+
+def syntheticTrace(seconds=30.0, fps=30, frameSize=(640, 480), seed=0):
+    # Jejak TraceModule.Trace yang mengulang SCRIPT sampai durasi terpenuhi.
+    rng = np.random.default_rng(seed)
+    w, h = frameSize
+    frames = int(seconds * fps)
+    t = np.arange(frames) / fps
+    landmarks = np.zeros((frames, 1, htm.NUM_LANDMARKS, 3), dtype=np.float32)
+    handedness = np.full((frames, 1), tm.HAND_NONE, dtype=np.int8)
+    scores = np.zeros((frames, 1), dtype=np.float32)
+    bounds = np.cumsum([segment[0] for segment in SCRIPT])
+    for i, ti in enumerate(t):
+        _, code, motion = SCRIPT[int(np.searchsorted(bounds, ti % bounds[-1], side="right"))]
+        if code is None:
+            continue
+        cx, cy = w / 2, h / 2 + 20
+        if motion == "circle":
+            cx, cy = cx + w / 5 * np.cos(1.5 * ti), cy + h / 6 * np.sin(1.5 * ti)
+        elif motion == "vertical":
+            cy += h / 8 * np.sin(2.0 * ti)
+        lm = handLandmarks(cx, cy, code)
+        lm[:, :2] += rng.normal(0.0, 1.0, (htm.NUM_LANDMARKS, 2))
+        landmarks[i, 0] = lm
+        handedness[i, 0] = tm.HAND_RIGHT
+        scores[i, 0] = 0.98
+    return tm.Trace(t, landmarks, handedness, scores, frameSize)
+
+
+def renderFrame(trace, i, background, out):
+    # Menggambar kerangka tangan frame ke-i di atas latar belakang, ke buffer out (tanpa alokasi baru).
+    np.copyto(out, background)
+    for k in range(int(trace.counts[i])):
+        points = trace.landmarks[i, k, :, :2].astype(np.int32).tolist()
+        for a, b in CONNECTIONS:
+            cv2.line(out, points[a], points[b], (140, 170, 220), 12)
+        for point in points:
+            cv2.circle(out, point, 7, (120, 150, 205), cv2.FILLED)
+    return out
+
+
+def replayResults(trace):
+    # Hasil per frame berbentuk keluaran Hands.process (landmark ternormalisasi dan handedness).
+    w, h = trace.frameSize
+    results = []
+    for i in range(len(trace)):
+        n = int(trace.counts[i])
+        hands = [SimpleNamespace(landmark=[SimpleNamespace(x=x / w, y=y / h, z=z / w)
+                                           for x, y, z in trace.landmarks[i, k].tolist()]) for k in range(n)]
+        labels = [SimpleNamespace(classification=[SimpleNamespace(
+            label="Right" if trace.handedness[i, k] == tm.HAND_RIGHT else "Left", score=float(trace.scores[i, k]))])
+            for k in range(n)]
+        results.append(SimpleNamespace(multi_hand_landmarks=hands or None, multi_handedness=labels or None))
+    return results
+
+
+# Pengganti graf MediaPipe untuk HandDetector(hands=...): process() mengembalikan hasil rekaman berikutnya.
+class ReplayHands():
+    def __init__(self, results):
+        self.results = results
+        self.index = -1
+
+    def process(self, imgRGB):
+        self.index = (self.index + 1) % len(self.results)
+        return self.results[self.index]
+
+    def close(self):
+        pass
+
+
+class StageRunner():
+    # Menjalankan fungsi tahap sambil mencatat waktu (profiler) atau memori sementara per panggilan (memory:
+    # tahap -> daftar byte di atas memori yang sedang dipakai).
+    def __init__(self, profiler=None, memory=None):
+        self.profiler = profiler
+        self.memory = memory
+
+    def __call__(self, name, fn, *args):
+        if self.memory is not None:
+            current = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            result = fn(*args)
+            self.memory.setdefault(name, []).append(tracemalloc.get_traced_memory()[1] - current)
+            return result
+        if self.profiler is None:
+            return fn(*args)
+        start = time.perf_counter()
+        result = fn(*args)
+        self.profiler.record(name, time.perf_counter() - start)
+        return result
+
+
+def runPass(trace, results, run, mpDetector=None):
+    # Satu putaran penuh jejak dengan detektor dan controller baru; mengembalikan jumlah aksi per jenis.
+    w, h = trace.frameSize
+    background = np.random.default_rng(1).integers(0, 60, (h, w, 3), dtype=np.uint8)
+    img = np.empty_like(background)
+    detector = htm.HandDetector(maxHands=trace.landmarks.shape[1], arrayMode=True, hands=ReplayHands(results))
+    listDetector = htm.HandDetector(maxHands=trace.landmarks.shape[1], arrayMode=False, hands=ReplayHands(results))
+    controller, clock = tm.makeReplayController(trace.frameSize)
+    for i in range(len(trace)):
+        renderFrame(trace, i, background, img)
+        if mpDetector is not None:
+            run("mediapipe", mpDetector.findHands, img, False)
+
+        run("findHands", detector.findHands, img, False)
+        lmList, bbox = run("findPosition", detector.findPosition, img, 0, False)
+        fingers = []
+        if lmList:
+            fingers = run("fingersUp", detector.fingersUp, 0)
+            run("findDistance", detector.findDistance, 8, 12, img, False)
+
+        listDetector.findHands(img, False)
+        lmListOld, bbox = run("findPosition:list", listDetector.findPosition, img, 0, False)
+        if lmListOld:
+            run("fingersUp:list", listDetector.fingersUp, 0)
+            run("findDistance:list", listDetector.findDistance, 8, 12, img, False)
+
+        clock.now = trace.t[i]
+        run("gesture", controller.process, None, lmList, fingers, trace.t[i])
+    actuator = controller.actuator
+    return {method: actuator.count(method) for method in ("move", "click", "doubleClick", "toggle", "scroll")}
+
+
+def runSuite(trace, args):
+    results = replayResults(trace)
+    mpDetector = None
+    if args.mediapipe:
+        try:
+            mpDetector = htm.HandDetector(maxHands=1, detectionCon=0.75, trackCon=0.75, arrayMode=True).warmup()
+        except Exception as e:  # MediaPipe tidak terpasang atau tidak punya solutions.hands
+            print(f"tahap mediapipe dilewati: {e}")
+
+    runPass(trace, results, StageRunner(), mpDetector)  # Pemanasan: buffer, cache dan JIT library
+    profiler = prm.StageProfiler(window=len(trace) * args.repeat)
+    for _ in range(args.repeat):
+        actions = runPass(trace, results, StageRunner(profiler=profiler), mpDetector)
+
+    memory = {}
+    tracemalloc.start()
+    runPass(trace, results, StageRunner(memory=memory), mpDetector)
+    peakTotal = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    summary = profiler.summary()
+    stages = {}
+    for name in sorted(summary, key=lambda name: STAGES.index(name) if name in STAGES else len(STAGES)):
+        stats = stages[name] = summary[name]
+        stats["per_second"] = 1000.0 / stats["mean_ms"] if stats["mean_ms"] else float("inf")
+        # alloc: rata-rata alokasi sementara per panggilan (buffer yang tidak dipakai ulang terlihat di sini);
+        # peak: panggilan terburuk, termasuk alokasi buffer sekali di frame pertama.
+        transient = np.array(memory.get(name, [0]), dtype=np.float64) / 1024
+        stats["alloc_kib"] = float(transient.mean())
+        stats["peak_kib"] = float(transient.max())
+    return {"machine": {"node": platform.node(), "processor": platform.processor(),
+                        "python": platform.python_version(), "numpy": np.__version__, "opencv": cv2.__version__},
+            "config": {"source": args.trace or "synthetic", "frames": len(trace), "repeat": args.repeat},
+            "stages": stages, "actions": actions, "peak_total_kib": peakTotal / 1024}
+
+
+def compare(report, baseline, tolerance, floorMs, floorKib):
+    # Daftar (tahap, metrik, lama, baru) yang memburuk lebih dari toleransi dan lebih dari batas absolut.
+    regressions = []
+    for name, stats in report["stages"].items():
+        base = baseline["stages"].get(name)
+        if base is None:
+            continue
+        for metric in METRICS:
+            old, new = base.get(metric), stats.get(metric)
+            if old is None or new is None:
+                continue
+            floor = floorKib if metric.endswith("_kib") else floorMs
+            if new > old * (1 + tolerance) and new - old > floor:
+                regressions.append((name, metric, old, new))
+    return regressions
+
+
+def printReport(report, baseline=None):
+    print(f"{report['config']['frames']} frame x {report['config']['repeat']} putaran "
+          f"({report['config']['source']})")
+    print(f"{'tahap':<18}{'panggilan/detik':>16}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'alok KiB':>10}{'puncak KiB':>12}"
+          + ("   p50 vs baseline" if baseline else ""))
+    for name, stats in report["stages"].items():
+        line = (f"{name:<18}{stats['per_second']:16.0f}{stats['p50_ms']:9.4f}{stats['p95_ms']:9.4f}"
+                f"{stats['p99_ms']:9.4f}{stats['alloc_kib']:10.2f}{stats['peak_kib']:12.1f}")
+        base = baseline["stages"].get(name) if baseline else None
+        if base and base.get("p50_ms"):
+            line += f"   {stats['p50_ms'] / base['p50_ms'] - 1:+8.1%}"
+        print(line)
+    print("aksi per putaran: " + ", ".join(f"{k}={v}" for k, v in report["actions"].items())
+          + f"  puncak memori total {report['peak_total_kib']:.1f} KiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--trace", help="Jejak .npz dari TraceModule (bawaan: jejak sintetis)")
+    parser.add_argument("--seconds", type=float, default=30, help="Durasi jejak sintetis (detik, 30 fps)")
+    parser.add_argument("--repeat", type=int, default=3, help="Jumlah putaran yang diukur")
+    parser.add_argument("--mediapipe", action="store_true", help="Ukur juga findHands dengan model MediaPipe")
+    parser.add_argument("--save", help="Simpan hasil ke file JSON (baseline)")
+    parser.add_argument("--compare", help="File JSON baseline untuk dibandingkan")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Kenaikan relatif yang dianggap regresi")
+    parser.add_argument("--floor-ms", type=float, default=0.002, help="Kenaikan waktu absolut minimum (ms)")
+    parser.add_argument("--floor-kib", type=float, default=1.0, help="Kenaikan memori absolut minimum (KiB)")
+    args = parser.parse_args()
+
+    trace = tm.Trace.load(args.trace) if args.trace else syntheticTrace(args.seconds)
+    report = runSuite(trace, args)
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    printReport(report, baseline)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"hasil disimpan ke {args.save}")
+
+    if baseline is not None:
+        if baseline.get("machine") != report["machine"]:
+            print("peringatan: baseline diukur di mesin/versi library lain, perbandingan kurang andal")
+        if baseline.get("config") != report["config"]:
+            print(f"peringatan: konfigurasi baseline berbeda {baseline.get('config')}")
+        elif baseline.get("actions") != report["actions"]:
+            print(f"peringatan: aksi berbeda dari baseline {baseline.get('actions')} (perilaku gestur berubah?)")
+        regressions = compare(report, baseline, args.tolerance, args.floor_ms, args.floor_kib)
+        for name, metric, old, new in regressions:
+            print(f"REGRESI {name} {metric}: {old:.4f} -> {new:.4f} ({new / old - 1:+.1%})")
+        if regressions:
+            sys.exit(1)
+        print(f"tidak ada regresi (toleransi {args.tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Benchmark: alokasi memori jalur frame lama (read -> flip -> cvtColor, tiga array baru per frame)
+vs jalur buffer pakai-ulang (read(out) -> flip(dst=) -> toRgb ke buffer, tampilan baca-saja).
+
+    python benchmarks/bench_zerocopy.py                  # frame sintetis
+    python benchmarks/bench_zerocopy.py --video a.mp4    # file video
+    python benchmarks/bench_zerocopy.py --pipeline       # juga HandPipeline lengkap dengan MediaPipe
+
+Alokasi diukur dengan tracemalloc (NumPy melaporkan buffer array ke tracemalloc): "baru/frame"
+adalah puncak memori sementara di atas memori yang sedang dipakai pada setiap frame.
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import HandTrackingModule as htm  # noqa: E402
+import PipelineModule as plm  # noqa: E402
+
+
+def openSource(args):
+    return (plm.CameraSource(args.video, realtime=False) if args.video
+            else plm.SyntheticSource(frames=args.frames, realtime=False))
+
+
+def legacyFrame(source, state):
+    success, img = source.read()
+    if not success:
+        return False
+    img = cv2.flip(img, 1)
+    state["rgb"] = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+    return True
+
+
+def pooledFrame(source, state):
+    success, state["raw"] = source.read(state.get("raw"))
+    if not success:
+        return False
+    pool = state.setdefault("pool", plm.FramePool())
+    img = cv2.flip(state["raw"], 1, dst=pool.acquire(state["raw"].shape))
+    state["rgb"], view = htm.toRgb(img, state.get("rgb"))
+    pool.release(img)  # Di pipeline, buffer kembali setelah hasil frame selesai dipakai
+    return True
+
+
+def measure(args, frameFn):
+    source = openSource(args)
+    state = {}
+    frameFn(source, state)  # Frame pemanasan: buffer pertama dialokasikan di sini
+    tracemalloc.start()
+    transient, times = [], []
+    for _ in range(args.frames - 1):
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        start = time.perf_counter()
+        if not frameFn(source, state):
+            break
+        times.append(time.perf_counter() - start)
+        transient.append(tracemalloc.get_traced_memory()[1] - current)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    source.release()
+    return np.array(transient) / 1024, np.array(times) * 1000, peak / 1024
+
+
+def measurePipeline(args, reuseBuffers):
+    source = openSource(args)
+    detector = htm.HandDetector(maxHands=1, detectionCon=0.75, trackCon=0.75, arrayMode=True)
+    tracemalloc.start()
+    pipeline = plm.HandPipeline(source, detector, draw=False, reuseBuffers=reuseBuffers).start()
+    count = 0
+    while pipeline.get() is not None:
+        count += 1
+    pipeline.stop()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    allocated = pipeline.pool.allocated if pipeline.pool is not None else count
+    return count, peak / 1024, allocated
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--video", help="Path file video (bawaan: sumber sintetis)")
+    parser.add_argument("--frames", type=int, default=300, help="Jumlah frame")
+    parser.add_argument("--pipeline", action="store_true", help="Ukur juga HandPipeline lengkap (butuh MediaPipe)")
+    args = parser.parse_args()
+
+    for name, frameFn in (("lama", legacyFrame), ("buffer", pooledFrame)):
+        transient, times, peak = measure(args, frameFn)
+        print(f"{name:>7}: baru/frame rata-rata {transient.mean():8.1f} KiB  maks {transient.max():8.1f} KiB  "
+              f"puncak {peak:8.1f} KiB  waktu p50 {np.percentile(times, 50):5.2f} ms")
+    if args.pipeline:
+        for name, reuse in (("lama", False), ("buffer", True)):
+            count, peak, allocated = measurePipeline(args, reuse)
+            print(f"pipeline {name:>6}: {count} frame  puncak tracemalloc {peak:8.1f} KiB  buffer frame dibuat {allocated}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Modul proyek berada di akar repositori (tanpa paket), sama seperti skrip di benchmarks/.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
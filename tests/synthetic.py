@@ -0,0 +1,110 @@
+"""
+Data tangan sintetis untuk pengujian: jejak landmark deterministik satu tangan kanan yang memainkan
+skrip gestur, dan pemutar ulang hasil Hands.process dari jejak itu sebagai pengganti graf MediaPipe.
+
+benchmarks/bench_suite.py punya salinannya sendiri, agar baseline benchmark dan angka yang
+diharapkan pengujian bisa berubah secara terpisah.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+
+import HandTrackingModule as htm
+import TraceModule as tm
+
+# Skrip gestur data sintetis: (durasi detik, pola jari [jempol..kelingking] atau None = tanpa tangan, gerakan).
+SCRIPT = (
+    (0.5, None, "still"),
+    (0.5, "11111", "still"),  # Tangan terbuka: reset ke IDLE
+    (0.3, "01000", "still"),  # Telunjuk: mulai TRACKING
+    (2.0, "01000", "circle"),  # Gerak kursor
+    (0.2, "11000", "circle"),  # Tap jempol: klik kiri
+    (0.6, "01000", "circle"),
+    (0.2, "11000", "circle"),  # Dua tap berdekatan: double klik
+    (0.2, "01000", "circle"),
+    (0.2, "11000", "circle"),
+    (0.6, "01000", "circle"),
+    (1.3, "11000", "circle"),  # Jempol ditahan: tahan kiri, lalu lepas
+    (0.5, "01000", "circle"),
+    (0.4, "01001", "circle"),  # Kelingking: klik kanan
+    (0.5, "01000", "circle"),
+    (2.0, "01100", "vertical"),  # Telunjuk + tengah rapat: scroll
+    (0.5, "00000", "still"),  # Kepalan: reset
+)
+
+
+def handLandmarks(cx, cy, code):
+    # Landmark piksel (21, 3) tangan kanan di frame yang sudah dicerminkan (jempol di kiri).
+    lm = np.zeros((htm.NUM_LANDMARKS, 3), dtype=np.float32)
+    lm[0, :2] = (cx, cy + 70)
+    if code[0] == "1":  # Jempol lurus ke kiri-atas: ujung di kiri sendi
+        lm[1:5, :2] = [(cx - 25, cy + 45), (cx - 45, cy + 30), (cx - 60, cy + 15), (cx - 75, cy)]
+    else:  # Jempol ditekuk ke telapak: ujung di kanan sendi
+        lm[1:5, :2] = [(cx - 25, cy + 45), (cx - 35, cy + 30), (cx - 25, cy + 20), (cx - 15, cy + 20)]
+    for finger, dx in zip(range(1, 5), (-24, -8, 8, 24)):
+        base = 4 * finger + 1
+        if code[finger] == "1":
+            joints = (0, -30, -50, -68)
+        else:
+            joints = (0, -22, -10, 2)  # Ujung di bawah sendi kedua = jari ditekuk
+        lm[base:base + 4, 0] = cx + dx
+        lm[base:base + 4, 1] = [cy + dy for dy in joints]
+    lm[:, 2] = -0.02 * np.arange(htm.NUM_LANDMARKS)
+    return lm
+
+
+def syntheticTrace(seconds=30.0, fps=30, frameSize=(640, 480), seed=0):
+    # Jejak TraceModule.Trace yang mengulang SCRIPT sampai durasi terpenuhi.
+    rng = np.random.default_rng(seed)
+    w, h = frameSize
+    frames = int(seconds * fps)
+    t = np.arange(frames) / fps
+    landmarks = np.zeros((frames, 1, htm.NUM_LANDMARKS, 3), dtype=np.float32)
+    handedness = np.full((frames, 1), tm.HAND_NONE, dtype=np.int8)
+    scores = np.zeros((frames, 1), dtype=np.float32)
+    bounds = np.cumsum([segment[0] for segment in SCRIPT])
+    for i, ti in enumerate(t):
+        _, code, motion = SCRIPT[int(np.searchsorted(bounds, ti % bounds[-1], side="right"))]
+        if code is None:
+            continue
+        cx, cy = w / 2, h / 2 + 20
+        if motion == "circle":
+            cx, cy = cx + w / 5 * np.cos(1.5 * ti), cy + h / 6 * np.sin(1.5 * ti)
+        elif motion == "vertical":
+            cy += h / 8 * np.sin(2.0 * ti)
+        lm = handLandmarks(cx, cy, code)
+        lm[:, :2] += rng.normal(0.0, 1.0, (htm.NUM_LANDMARKS, 2))
+        landmarks[i, 0] = lm
+        handedness[i, 0] = tm.HAND_RIGHT
+        scores[i, 0] = 0.98
+    return tm.Trace(t, landmarks, handedness, scores, frameSize)
+
+
+def replayResults(trace):
+    # Hasil per frame berbentuk keluaran Hands.process (landmark ternormalisasi dan handedness).
+    w, h = trace.frameSize
+    results = []
+    for i in range(len(trace)):
+        n = int(trace.counts[i])
+        hands = [SimpleNamespace(landmark=[SimpleNamespace(x=x / w, y=y / h, z=z / w)
+                                           for x, y, z in trace.landmarks[i, k].tolist()]) for k in range(n)]
+        labels = [SimpleNamespace(classification=[SimpleNamespace(
+            label="Right" if trace.handedness[i, k] == tm.HAND_RIGHT else "Left", score=float(trace.scores[i, k]))])
+            for k in range(n)]
+        results.append(SimpleNamespace(multi_hand_landmarks=hands or None, multi_handedness=labels or None))
+    return results
+
+
+# Pengganti graf MediaPipe untuk HandDetector(hands=...): process() mengembalikan hasil rekaman berikutnya.
+class ReplayHands():
+    def __init__(self, results):
+        self.results = results
+        self.index = -1
+
+    def process(self, imgRGB):
+        self.index = (self.index + 1) % len(self.results)
+        return self.results[self.index]
+
+    def close(self):
+        pass
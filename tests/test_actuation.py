@@ -0,0 +1,75 @@
+import pytest
+
+import ActuationModule as am
+import ClickSchedulerModule as csm
+
+
+def test_unknown_backend_name():
+    with pytest.raises(ValueError):
+        am.createBackend("tidak-ada")
+
+
+def test_backend_constructor_errors_are_not_masked():
+    am.BACKENDS["rusak"] = lambda: {}["kunci"]
+    try:
+        with pytest.raises(KeyError):
+            am.createBackend("rusak")
+    finally:
+        del am.BACKENDS["rusak"]
+
+
+def makeActuator(rate=60.0, threaded=False):
+    clock = csm.FakeClock()
+    backend = am.RecordingBackend(clock)
+    return am.CoalescingActuator(backend, rate=rate, threaded=threaded, clock=clock), backend, clock
+
+
+def test_move_burst_collapses_to_last_position():
+    actuator, backend, clock = makeActuator(rate=60)
+    actuator.move(0, 0)  # Batch pertama langsung dikirim
+    for i in range(1, 6):
+        clock.advance(0.002)
+        actuator.move(i, i)
+    assert backend.calls == [(0.0, "move", (0, 0))]
+    clock.advance(1 / 60)
+    actuator.move(9, 9)
+    assert [call[1:] for call in backend.calls] == [("move", (0, 0)), ("move", (9, 9))]
+    assert (actuator.movesIn, actuator.movesOut) == (7, 2)
+
+
+def test_fractional_scroll_carries_over():
+    actuator, backend, clock = makeActuator(rate=0)
+    for _ in range(3):
+        actuator.scroll(0.5)
+    actuator.scroll(-0.25)
+    for _ in range(3):
+        actuator.scroll(0.75)
+    # 0.5 + 0.5 -> 1; 0.5 - 0.25 + 0.75 -> 1; 0.75 + 0.75 -> 1 dengan sisa 0.5
+    assert [call[1:] for call in backend.calls] == [("scroll", (1,))] * 3
+    actuator.scroll(-2.5)
+    assert backend.calls[-1][1:] == ("scroll", (-2,))
+
+
+def test_clicks_are_not_delayed_or_merged():
+    actuator, backend, clock = makeActuator(rate=60)
+    actuator.move(0, 0)
+    clock.advance(0.001)
+    actuator.move(5, 5)  # Belum jadwal refresh: gerakan tertunda
+    actuator.click()
+    actuator.click()
+    actuator.toggle(down=True)
+    assert [call[1:] for call in backend.calls] == [
+        ("move", (0, 0)), ("move", (5, 5)), ("click", ("left",)), ("click", ("left",)), ("toggle", ("left", True))]
+    assert all(call[0] == clock.now for call in backend.calls[1:])
+
+
+def test_stop_flushes_pending_actions():
+    actuator, backend, clock = makeActuator(rate=1, threaded=True)
+    actuator.move(0, 0)
+    actuator.move(7, 7)
+    actuator.scroll(1.5)
+    actuator.stop()
+    # Thread boleh sudah mengirim gerakan pertama; sisanya (jadwal berikutnya baru 1 detik lagi) dikirim oleh stop().
+    calls = [call[1:] for call in backend.calls]
+    assert [call for call in calls if call[0] == "move"][-1] == ("move", (7, 7))
+    assert calls[-1] == ("scroll", (1,))
@@ -0,0 +1,75 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+import BatchModule as bm
+import TraceModule as tm
+
+
+def readerThreads():
+    return [t for t in threading.enumerate() if t.name == "batch-reader"]
+
+
+def waitForReaders(timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while readerThreads() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return not readerThreads()
+
+
+def test_prefetch_forwards_decode_errors():
+    def frames():
+        yield 1
+        raise OSError("dekode gagal")
+
+    with pytest.raises(OSError):
+        list(bm._prefetch(frames(), 4))
+    assert waitForReaders()
+
+
+def test_prefetch_reader_exits_when_consumer_stops_before_error():
+    released = threading.Event()
+
+    def frames():
+        try:
+            yield 1
+            yield 2
+            raise OSError("dekode gagal")
+        finally:
+            released.set()  # Seperti cap.release() di videoFrames
+
+    it = bm._prefetch(frames(), 1)
+    assert next(it) == 1
+    time.sleep(0.05)  # Pembaca mengisi antrean lalu tertahan saat meneruskan error
+    it.close()
+    assert waitForReaders()
+    assert released.wait(1.0)
+
+
+def test_prefetch_releases_source_on_early_stop():
+    released = threading.Event()
+
+    def frames():
+        try:
+            for i in range(1000):
+                yield i
+        finally:
+            released.set()
+
+    it = bm._prefetch(frames(), 2)
+    assert [next(it) for _ in range(3)] == [0, 1, 2]
+    it.close()
+    assert released.wait(1.0)
+    assert waitForReaders()
+
+
+def test_save_batches_appends_npz_suffix(tmp_path):
+    n = 4
+    batch = bm.HandBatch(np.arange(n), np.arange(n) / 30.0, np.zeros((n, 1, 21, 3), dtype=np.float32),
+                         np.full((n, 1), tm.HAND_NONE, dtype=np.int8), np.zeros((n, 1), dtype=np.float32), (640, 480))
+    assert bm.saveBatches([batch, batch], str(tmp_path / "sesi")) == 2 * n
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["sesi.npz"]
+    trace = tm.Trace.load(str(tmp_path / "sesi.npz"))
+    assert len(trace) == 2 * n and trace.frameSize == (640, 480)
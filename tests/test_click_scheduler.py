@@ -0,0 +1,69 @@
+import threading
+
+import ClickSchedulerModule as csm
+
+
+def test_cooldown_suppresses_and_expires_per_group():
+    clock = csm.FakeClock()
+    scheduler = csm.CooldownScheduler({"left": 0.3, "right": 0.5}, clock=clock)
+    assert scheduler.trigger("left")
+    assert scheduler.trigger("right")  # Grup lain tidak terpengaruh cooldown "left"
+    clock.advance(0.2)
+    assert not scheduler.trigger("left")
+    assert not scheduler.trigger("right")
+    clock.advance(0.1)
+    assert scheduler.trigger("left")  # Jendela 0.3 detik lewat
+    assert not scheduler.trigger("right")
+    clock.advance(0.2)
+    assert scheduler.trigger("right")
+    assert not scheduler.trigger("left")  # Dipicu ulang di 0.3, jadi masih tertahan di 0.5
+    scheduler.reset("left")
+    assert scheduler.trigger("left")
+
+
+def test_unthreaded_dispatcher_runs_in_order():
+    calls = []
+    dispatcher = csm.ActionDispatcher(threaded=False)
+    dispatcher.submit(calls.append, 1)
+    dispatcher.submitCritical(calls.append, 2)
+    dispatcher.submit(calls.append, 3)
+    assert calls == [1, 2, 3]
+    assert dispatcher.dropped == 0
+
+
+def _blockedDispatcher(maxsize):
+    # Dispatcher berthread yang pekerjanya tertahan di aksi pertama sampai gate dibuka.
+    started, gate = threading.Event(), threading.Event()
+
+    def block():
+        started.set()
+        gate.wait(2.0)
+
+    dispatcher = csm.ActionDispatcher(threaded=True, maxsize=maxsize)
+    dispatcher.submit(block)
+    assert started.wait(2.0)
+    return dispatcher, gate
+
+
+def test_threaded_dispatcher_drops_moves_when_full():
+    calls = []
+    dispatcher, gate = _blockedDispatcher(maxsize=2)
+    for i in range(5):
+        dispatcher.submit(calls.append, i)
+    assert dispatcher.dropped == 3
+    gate.set()
+    dispatcher.stop()
+    assert calls == [0, 1]
+
+
+def test_threaded_dispatcher_keeps_clicks_behind_queued_moves():
+    calls = []
+    dispatcher, gate = _blockedDispatcher(maxsize=2)
+    for i in range(4):
+        dispatcher.submit(calls.append, ("move", i))
+    dispatcher.submitCritical(calls.append, ("click", "left"))
+    dispatcher.submit(calls.append, ("move", 4))
+    gate.set()
+    dispatcher.stop()
+    assert calls == [("move", 0), ("move", 1), ("click", "left")]
+    assert dispatcher.dropped == 3
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+import FilterModule as fm
+
+DT = 1 / 60
+
+
+@pytest.mark.parametrize("name", sorted(fm.FILTERS))
+def test_constant_input_converges(name):
+    filt = fm.createFilter(name)
+    filt.filter(0.0, 0.0, 0.0)
+    for i in range(1, 180):
+        x, y = filt.filter(i * DT, 400.0, 300.0)
+    tolerance = getattr(filt, "deadZone", 0.0) + 0.5  # Zona mati berhenti di tepinya, bukan di target
+    assert np.hypot(x - 400.0, y - 300.0) <= tolerance
+
+
+def test_deadzone_suppresses_small_jitter():
+    filt = fm.ExponentialDeadzoneFilter(alpha=0.5, deadZone=4.0)
+    assert filt.filter(0.0, 100.0, 100.0) == (100.0, 100.0)
+    for i, (dx, dy) in enumerate([(3, 0), (-3, 1), (0, -3.9), (2, 2)]):
+        assert filt.filter((i + 1) * DT, 100.0 + dx, 100.0 + dy) == (100.0, 100.0)
+    x, y = filt.filter(1.0, 110.0, 100.0)  # Hanya 6 piksel di luar zona mati yang diteruskan (alpha 0.5)
+    assert (x, y) == pytest.approx((103.0, 100.0))
+
+
+@pytest.mark.parametrize("name", ["oneeuro", "kalman"])
+def test_non_monotonic_time_resets(name):
+    filt = fm.createFilter(name)
+    for i in range(30):
+        filt.filter(i * DT, 10.0 * i, 0.0)
+    # Waktu mundur (misal jam rekaman dimulai ulang): masukan diteruskan apa adanya sebagai titik awal baru.
+    assert filt.filter(0.0, 500.0, 200.0) == (500.0, 200.0)
+    assert filt.filter(0.0, 600.0, 200.0) == (600.0, 200.0)  # Waktu sama juga tidak membagi dengan dt = 0
+    x, y = filt.filter(DT, 600.0, 200.0)
+    assert (x, y) == pytest.approx((600.0, 200.0))
+
+
+def test_create_filter_rejects_unknown_names():
+    with pytest.raises(ValueError, match="tidak dikenal"):
+        fm.createFilter("median")
+    assert fm.createFilter("divisor", smoothening=3).smoothening == 3
+
+
+class DelayFilter():
+    # Filter uji: keluaran = masukan `frames` frame sebelumnya.
+    def __init__(self, frames):
+        self.frames = frames
+        self.reset()
+
+    def reset(self):
+        self.history = []
+
+    def filter(self, t, x, y):
+        self.history.append((x, y))
+        return self.history[max(0, len(self.history) - 1 - self.frames)]
+
+
+def test_score_filter_lag_on_ramp():
+    t = np.arange(120) * DT
+    trace = np.stack([t, 100 + 600 * t, np.full_like(t, 300)], axis=1)  # Bergerak 600 px/detik
+    assert fm.scoreFilter(DelayFilter(0), trace)["lag_ms"] == 0.0
+    assert fm.scoreFilter(DelayFilter(3), trace)["lag_ms"] == pytest.approx(3 * DT * 1000)
+
+
+def test_score_filter_jitter_on_still_hand():
+    t = np.arange(200) * DT
+    x = 400 + np.where(np.arange(200) % 2, -1.0, 1.0)  # Diam dengan jitter +-1 piksel
+    trace = np.stack([t, x, np.full_like(t, 300)], axis=1)
+    raw = fm.scoreFilter(DelayFilter(0), trace)
+    # Rata-rata bergerak 5 frame dari +-1 berselang-seling adalah +-0.2, jadi sisa jitter 0.8 piksel.
+    assert raw["jitter_px"] == pytest.approx(0.8, rel=0.05)
+    assert raw["lag_ms"] == 0.0
+    assert fm.scoreFilter(fm.DivisorFilter(), trace)["jitter_px"] < 0.2 * raw["jitter_px"]
@@ -0,0 +1,77 @@
+import ActuationModule as am
+import ClickSchedulerModule as csm
+import GestureControlModule as gcm
+
+FPS = 30
+POINTER = [[i, 320, 240] for i in range(21)]  # Landmark cukup untuk gestur "move"
+INDEX = [0, 1, 0, 0, 0]  # Telunjuk saja: mulai tracking / gerak kursor
+THUMB = [1, 1, 0, 0, 0]  # Telunjuk + jempol: jempol terangkat
+
+
+def makeController(**kwargs):
+    clock = csm.FakeClock()
+    backend = am.RecordingBackend(clock)
+    controller = gcm.VirtualMouseController(backend, (1920, 1080), dispatcher=csm.ActionDispatcher(threaded=False),
+                                            **kwargs)
+    return controller, backend, clock
+
+
+def play(controller, clock, phases):
+    # phases: daftar (detik, fingers); satu frame setiap 1/FPS detik, melanjutkan pemanggilan sebelumnya.
+    for seconds, fingers in phases:
+        for _ in range(round(seconds * FPS)):
+            controller.process(None, POINTER, fingers, clock.now)
+            clock.advance(1 / FPS)
+
+
+def clicks(backend):
+    return [(name, args) for _, name, args in backend.calls if name in ("click", "doubleClick")]
+
+
+def test_single_tap_clicks_immediately():
+    controller, backend, clock = makeController()
+    play(controller, clock, [(0.2, INDEX), (0.1, THUMB), (1 / FPS, INDEX)])
+    assert clicks(backend) == [("click", ("left",))]  # Di frame pelepasan jempol, tanpa tundaan
+
+
+def test_fast_double_tap_sends_two_clicks():
+    controller, backend, clock = makeController()
+    play(controller, clock, [(0.2, INDEX), (0.1, THUMB), (0.1, INDEX), (0.1, THUMB), (1 / FPS, INDEX)])
+    # Klik kedua tidak ditelan cooldown; OS menggabungkan keduanya menjadi double klik.
+    assert clicks(backend) == [("click", ("left",)), ("click", ("left",))]
+    clickTimes = [t for t, name, _ in backend.calls if name == "click"]
+    assert clickTimes[1] - clickTimes[0] < 0.3
+
+
+def test_taps_far_apart_are_two_single_clicks():
+    controller, backend, clock = makeController()
+    play(controller, clock, [(0.2, INDEX), (0.1, THUMB), (0.6, INDEX), (0.1, THUMB), (0.6, INDEX)])
+    assert clicks(backend) == [("click", ("left",)), ("click", ("left",))]
+
+
+def test_deferred_double_tap_sends_one_double_click():
+    controller, backend, clock = makeController(deferDoubleClick=True)
+    play(controller, clock, [(0.2, INDEX), (0.2, THUMB), (0.2, INDEX), (0.2, THUMB), (1.0, INDEX)])
+    assert clicks(backend) == [("doubleClick", ("left",))]
+
+
+def test_deferred_single_tap_is_sent_after_double_tap_window():
+    controller, backend, clock = makeController(deferDoubleClick=True)
+    play(controller, clock, [(0.2, INDEX), (0.1, THUMB), (0.2, INDEX)])
+    assert clicks(backend) == []  # Masih di dalam jendela doubleTap
+    play(controller, clock, [(0.3, INDEX)])
+    assert clicks(backend) == [("click", ("left",))]
+
+
+def test_deferred_pending_tap_is_sent_when_gesture_ends():
+    controller, backend, clock = makeController(deferDoubleClick=True)
+    play(controller, clock, [(0.2, INDEX), (0.1, THUMB), (0.05, INDEX), (0.1, [0, 0, 0, 0, 0])])
+    assert clicks(backend) == [("click", ("left",))]
+
+
+def test_hold_still_presses_and_releases():
+    controller, backend, clock = makeController()
+    play(controller, clock, [(0.2, INDEX), (1.5, THUMB), (0.5, INDEX)])
+    toggles = [args for _, name, args in backend.calls if name == "toggle"]
+    assert toggles == [("left", True), ("left", False)]
+    assert clicks(backend) == []
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+import HandTrackingModule as htm
+import synthetic
+
+
+def test_array_mode_matches_list_mode():
+    trace = synthetic.syntheticTrace(seconds=12)
+    results = synthetic.replayResults(trace)
+    img = np.zeros((trace.frameSize[1], trace.frameSize[0], 3), dtype=np.uint8)
+    arrayDetector = htm.HandDetector(arrayMode=True, hands=synthetic.ReplayHands(results))
+    listDetector = htm.HandDetector(arrayMode=False, hands=synthetic.ReplayHands(results))
+    for _ in range(len(trace)):
+        arrayDetector.findHands(img, draw=False)
+        listDetector.findHands(img, draw=False)
+        lmArray, bboxArray = arrayDetector.findPosition(img, draw=False)
+        lmList, bboxList = listDetector.findPosition(img, draw=False)
+        assert list(lmArray) == lmList
+        assert tuple(bboxArray) == tuple(bboxList)
+        if lmList:
+            assert arrayDetector.fingersUp() == listDetector.fingersUp()
+            assert arrayDetector.fingersUpAll()[0].tolist() == listDetector.fingersUp()
+            assert arrayDetector.findDistance(8, 12, img, draw=False)[0] == listDetector.findDistance(8, 12, img, draw=False)[0]
+
+
+class CenterHands():
+    # Pengganti graf MediaPipe: selalu satu tangan di tengah gambar masukan (hasil baru setiap panggilan).
+    def __init__(self):
+        self.shapes = []
+
+    def process(self, imgRGB):
+        from types import SimpleNamespace
+        self.shapes.append(imgRGB.shape)
+        landmark = [SimpleNamespace(x=0.45 + 0.005 * i, y=0.45 + 0.005 * i, z=0.0) for i in range(htm.NUM_LANDMARKS)]
+        label = SimpleNamespace(classification=[SimpleNamespace(label="Right", score=0.9)])
+        return SimpleNamespace(multi_hand_landmarks=[SimpleNamespace(landmark=landmark)], multi_handedness=[label])
+
+
+def test_roi_is_reset_when_frame_size_changes():
+    hands = CenterHands()
+    detector = htm.HandDetector(arrayMode=True, roiMode=True, hands=hands)
+    large = np.zeros((720, 1280, 3), dtype=np.uint8)
+    for _ in range(3):
+        detector.findHands(large, draw=False)
+    x0, y0, x1, y1 = detector.roi
+    assert x1 > 640  # ROI di piksel frame besar, di luar frame kecil berikutnya
+
+    small = np.zeros((480, 640, 3), dtype=np.uint8)
+    detector.findHands(small, draw=False)
+    assert hands.shapes[-1] == small.shape  # Deteksi ulang pada frame penuh, bukan potongan ROI lama
+    lmList, bbox = detector.findPosition(small, draw=False)
+    assert 0 <= bbox[0] < bbox[2] < 640 and 0 <= bbox[1] < bbox[3] < 480
+    x0, y0, x1, y1 = detector.roi
+    assert 0 <= x0 < x1 <= 640 and 0 <= y0 < y1 <= 480
+
+
+def test_roi_crops_use_separate_graph():
+    fullHands, roiHands = CenterHands(), CenterHands()
+    detector = htm.HandDetector(roiMode=True, hands=fullHands)
+    detector.roiHands = roiHands
+    img = np.zeros((480, 640, 3), dtype=np.uint8)
+    for _ in range(4):
+        detector.findHands(img, draw=False)
+    assert fullHands.shapes == [img.shape]  # Hanya deteksi awal pada frame penuh
+    assert roiHands.shapes == [(256, 256, 3)] * 3  # Potongan berukuran tetap untuk graf mode video
+
+
+def test_roi_mode_is_single_hand():
+    with pytest.raises(ValueError):
+        htm.HandDetector(roiMode=True, maxHands=2, hands=CenterHands())
+
+
+def test_roi_crops_do_not_replace_full_frame_rgb_buffer():
+    fullHands, roiHands = CenterHands(), CenterHands()
+    detector = htm.HandDetector(roiMode=True, hands=fullHands)
+    detector.roiHands = roiHands
+    img = np.zeros((480, 640, 3), dtype=np.uint8)
+    detector.findHands(img, draw=False)
+    rgb = detector._rgb
+    for _ in range(3):
+        detector.findHands(img, draw=False)
+    assert detector._rgb is rgb and rgb.shape == img.shape
@@ -0,0 +1,22 @@
+import os
+import subprocess
+import sys
+
+import LazyImportModule as lim
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULES = ["AiVirtualMouse", "BatchModule", "GestureControlModule", "HandTrackingModule", "PipelineModule",
+           "PredictionModule", "ProfilerModule", "ServingModule", "TraceModule"]
+
+
+def test_importing_project_modules_does_not_load_cv2():
+    # Proses baru: di proses pytest cv2 mungkin sudah dimuat oleh pengujian lain.
+    code = f"import sys\nfor name in {MODULES!r}:\n    __import__(name)\nprint('cv2' in sys.modules)"
+    output = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert output.stdout.strip() == "False"
+
+
+def test_cv2_accessor_is_cached():
+    import cv2
+    assert lim.cv2() is cv2
+    assert lim.cv2() is lim.cv2()
@@ -0,0 +1,146 @@
+import threading
+
+import numpy as np
+
+import PipelineModule as plm
+
+
+def test_drop_oldest_queue_drops_and_counts():
+    dropped = []
+    q = plm.DropOldestQueue(maxsize=2, onDrop=dropped.append)
+    for item in (1, 2, 3, 4):
+        q.put(item)
+    assert (q.dropped, dropped) == (2, [1, 2])
+    assert [q.get(), q.get()] == [3, 4]
+    assert q.get(timeout=0.01) is None  # Kosong: waktu tunggu habis
+
+
+def test_latest_frame_slot_keeps_newest():
+    dropped = []
+    slot = plm.LatestFrameSlot(onDrop=dropped.append)
+    slot.put("a")
+    slot.put("b")
+    slot.put("c")
+    assert (slot.dropped, dropped) == (2, ["a", "b"])
+    assert slot.get() == "c"
+    assert slot.get(timeout=0.01) is None
+
+
+def test_closed_queues_do_not_block():
+    q, slot = plm.DropOldestQueue(), plm.LatestFrameSlot()
+    q.put(1)
+    q.close()
+    slot.close()
+    assert q.get() == 1  # Elemen yang tersisa masih bisa diambil
+    assert q.get() is None and slot.get() is None  # Tanpa timeout, tetapi tidak memblokir
+    assert q.closed
+
+
+class StubDetector():
+    # Pengganti HandDetector: satu tangan tetap, tanpa MediaPipe.
+    arrayMode = False
+    numHands = 1
+    handedness = ["Right"]
+    handScores = [0.9]
+
+    def __init__(self):
+        self.frames = 0
+
+    def findHands(self, img, draw=True):
+        self.frames += 1
+        return img
+
+    def findPosition(self, img, draw=True):
+        return [[i, 10 * i, 10 * i] for i in range(21)], (0, 0, 200, 200)
+
+    def fingersUp(self, handNo=0):
+        return [0, 1, 0, 0, 0]
+
+
+def runPipeline(source, flip):
+    pipeline = plm.HandPipeline(source, StubDetector(), flip=flip, draw=False).start()
+    results = []
+    while True:
+        result = pipeline.get()
+        if result is None:
+            break
+        results.append(result)
+    pipeline.stop()
+    return pipeline, results
+
+
+def test_pipeline_delivers_frames_in_order():
+    pipeline, results = runPipeline(plm.SyntheticSource(frames=40, realtime=False), flip=True)
+    ids = [result.frameId for result in results]
+    assert ids == sorted(ids) and ids[-1] == 39
+    assert pipeline.captured == 40
+    assert len(results) + pipeline.dropped == 40  # Setiap frame diproses atau dihitung sebagai dibuang
+    assert results[-1].fingers == [0, 1, 0, 0, 0] and results[-1].handedness == ["Right"]
+
+
+def test_pipeline_returns_pool_buffers():
+    for flip in (True, False):
+        pipeline, results = runPipeline(plm.SyntheticSource(frames=60, realtime=False), flip=flip)
+        pool = pipeline.pool
+        # Buffer dipakai ulang: hanya beberapa yang pernah dibuat, dan semuanya kembali ke pool di akhir.
+        assert pool.allocated <= 6
+        assert len(pool._free) >= pool.allocated
+        assert all(buffer.shape == (480, 640, 3) for buffer in pool._free)
+
+
+def test_get_after_stop_does_not_block():
+    pipeline = plm.HandPipeline(plm.SyntheticSource(frames=None, fps=30), StubDetector(), draw=False).start()
+    assert pipeline.get(timeout=2.0) is not None
+    pipeline.stop()
+    returned = []
+    thread = threading.Thread(target=lambda: returned.append(
+        [pipeline.get() for _ in range(4)]), daemon=True)  # Sisa hasil di antrean, lalu None
+    thread.start()
+    thread.join(2.0)
+    assert not thread.is_alive()
+    assert returned[0][-1] is None
+
+
+def test_frame_pool_reuses_and_resets_on_shape_change():
+    pool = plm.FramePool()
+    assert pool.acquire() is None  # Ukuran belum diketahui
+    a = pool.acquire((4, 4, 3))
+    pool.release(a)
+    assert pool.acquire() is a and pool.allocated == 1
+    pool.release(a)
+    pool.setShape((2, 2, 3))
+    assert pool.acquire().shape == (2, 2, 3) and pool.allocated == 2
+    pool.release(np.empty((4, 4, 3), dtype=np.uint8))  # Ukuran lama tidak diterima kembali
+    assert pool._free == []
+
+
+class RecordingSource(plm.SyntheticSource):
+    # SyntheticSource yang mencatat buffer tujuan setiap read() dan bisa berganti resolusi di tengah jalan.
+    def __init__(self, resizeAt=None, **kwargs):
+        super().__init__(realtime=False, **kwargs)
+        self.outs = []
+        self.resizeAt = resizeAt
+
+    def read(self, out=None):
+        self.outs.append(out)
+        if self.count == self.resizeAt:
+            self.requestResolution(320, 240)
+        return super().read(out)
+
+
+def test_failed_read_returns_buffer_to_pool():
+    source = RecordingSource(frames=30)
+    pipeline, results = runPipeline(source, flip=False)
+    lastOut = source.outs[-1]  # Buffer yang dipinjam untuk read() terakhir yang gagal
+    assert lastOut is not None
+    assert any(buffer is lastOut for buffer in pipeline.pool._free)
+
+
+def test_resolution_change_in_unflipped_pipeline():
+    source = RecordingSource(frames=40, resizeAt=20)
+    pipeline, results = runPipeline(source, flip=False)
+    pool = pipeline.pool
+    assert pool.shape == (240, 320, 3)
+    assert results[-1].img.shape == (240, 320, 3)
+    assert pool._free and all(buffer.shape == (240, 320, 3) for buffer in pool._free)
+    assert pool.allocated <= 10
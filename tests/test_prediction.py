@@ -0,0 +1,117 @@
+import numpy as np
+import pytest
+
+import ClickSchedulerModule as csm
+import PredictionModule as pm
+
+FPS = 30
+
+
+def handAt(t, velocity):
+    # Landmark (1, 21, 3) tangan yang bergerak lurus dengan kecepatan tetap (piksel/detik).
+    lm = np.zeros((1, 21, 3), dtype=np.float32)
+    lm[0, :, 0] = 100 + np.arange(21) + velocity[0] * t
+    lm[0, :, 1] = 200 + velocity[1] * t
+    return lm
+
+
+def test_constant_velocity_extrapolates():
+    predictor = pm.ConstantVelocityPredictor()
+    assert predictor.predict(0.0) is None and predictor.speed() == 0.0
+    predictor.update(0.0, handAt(0.0, (300, -150)))
+    np.testing.assert_allclose(predictor.predict(0.5), handAt(0.0, (300, -150)))  # Belum ada kecepatan
+    predictor.update(0.1, handAt(0.1, (300, -150)))
+    np.testing.assert_allclose(predictor.predict(0.2), handAt(0.2, (300, -150)), atol=1e-3)
+    assert predictor.speed() == pytest.approx(np.hypot(300, 150), rel=1e-4)
+
+
+def test_kalman_converges_to_linear_motion():
+    predictor = pm.KalmanLandmarkPredictor()
+    for i in range(30):
+        predictor.update(i / FPS, handAt(i / FPS, (300, 90)))
+    t = 32 / FPS
+    np.testing.assert_allclose(predictor.predict(t), handAt(t, (300, 90)), atol=1.0)
+    predictor.update(0.0, handAt(0.0, (0, 0)))  # Waktu mundur: mulai ulang tanpa kecepatan
+    assert predictor.speed() == 0.0
+
+
+def test_interval_follows_motion():
+    scheduler = pm.AdaptiveScheduler(targetCpu=None, minInterval=1, maxInterval=6, slowSpeed=60, fastSpeed=600)
+    assert scheduler.update(0) == 6  # Diam: deteksi jarang
+    assert scheduler.update(1000) == 1  # Cepat: deteksi setiap frame
+    assert scheduler.update(330) == 4  # Di tengah: interpolasi linear
+    intervals = [scheduler.update(speed) for speed in range(0, 800, 50)]
+    assert intervals == sorted(intervals, reverse=True)  # Makin cepat, makin sering
+    assert [scheduler.update(speed) for speed in (700, 30)] == [1, 6]  # Menyusut dan tumbuh kembali
+
+
+def test_interval_is_clamped_and_budget_capped_by_max_interval():
+    scheduler = pm.AdaptiveScheduler(targetCpu=0.5, minInterval=2, maxInterval=6)
+    assert scheduler.update(1000) == 2  # Tidak pernah di bawah minInterval
+    scheduler.recordFrame(1 / FPS)
+    scheduler.recordInference(0.02)
+    scheduler.minInterval = 1
+    assert scheduler.update(1000) == 2  # 20 ms per 33 ms frame dengan target 50% CPU: setiap 2 frame
+    for _ in range(60):
+        scheduler.recordInference(1.0)
+    assert scheduler.update(1000) == 6  # Anggaran tidak tercapai, tetapi maxInterval menang
+
+
+class MovingHandDetector():
+    # Pengganti HandDetector(arrayMode=True): satu tangan yang bergerak lurus, posisi dari jam palsu.
+    arrayMode = True
+
+    def __init__(self, clock, velocity):
+        self.clock = clock
+        self.velocity = velocity
+        self.lmArray = np.zeros((1, 21, 3), dtype=np.float32)
+        self.lmPixels = np.zeros((1, 21, 3), dtype=np.int32)
+        self.isRight = np.ones(1, dtype=bool)
+        self.numHands = 0
+        self.handedness = []
+        self.handScores = []
+        self.calls = []
+
+    def findHands(self, img, draw=True):
+        t = self.clock()
+        self.calls.append(round(t * FPS))
+        self.lmArray[:] = handAt(t, self.velocity)
+        self.lmPixels[:] = self.lmArray
+        self.numHands = 1
+        self.handedness = ["Right"]
+        self.handScores = [0.9]
+        return img
+
+    def findPosition(self, img, handNo=0, draw=True):
+        return [], []
+
+
+def runTracker(velocity, frames, interval=3):
+    clock = csm.FakeClock()
+    detector = MovingHandDetector(clock, velocity)
+    scheduler = pm.AdaptiveScheduler(targetCpu=None, minInterval=interval, maxInterval=interval)
+    tracker = pm.AdaptiveHandTracker(detector, pm.ConstantVelocityPredictor(), scheduler, clock=clock)
+    img = np.zeros((480, 640, 3), dtype=np.uint8)
+    predicted = {}
+    for i in range(frames):
+        clock.now = i / FPS
+        tracker.findHands(img, draw=False)
+        if tracker.predicted:
+            predicted[i] = tracker.lmArray[:1].copy()
+    return tracker, detector, predicted
+
+
+def test_tracker_predicts_between_detections():
+    tracker, detector, predicted = runTracker((150, 60), 9)
+    assert detector.calls == [0, 3, 6]
+    assert (tracker.detections, tracker.predictions) == (3, 6)
+    for i in (4, 5, 7, 8):  # Setelah dua deteksi kecepatan diketahui: ekstrapolasi tepat
+        np.testing.assert_allclose(predicted[i], handAt(i / FPS, (150, 60)), atol=1e-3)
+    lmList, bbox = tracker.findPosition(None, draw=False)
+    assert bbox[0] == int(handAt(8 / FPS, (150, 60))[0, 0, 0])
+
+
+def test_prediction_leaving_frame_forces_detection():
+    tracker, detector, predicted = runTracker((4000, 0), 5)
+    # Frame 4 diprediksi di luar lebar 640 piksel, jadi detektor dijalankan lebih awal.
+    assert detector.calls == [0, 3, 4]
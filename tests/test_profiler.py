@@ -0,0 +1,96 @@
+import csv
+import json
+import math
+
+import numpy as np
+import pytest
+
+import ProfilerModule as prm
+
+
+def makeProfiler(window=300):
+    # Tahap "process": 1..100 ms; tahap "render": selalu 5 ms.
+    profiler = prm.StageProfiler(window=window)
+    for ms in range(1, 101):
+        profiler.record("process", ms / 1000)
+        profiler.record("render", 0.005)
+    return profiler
+
+
+def test_percentiles_of_known_samples():
+    profiler = makeProfiler()
+    # Interpolasi linear numpy atas 1..100: p50 = 50.5, p95 = 95.05, p99 = 99.01.
+    assert profiler.percentiles("process") == pytest.approx([50.5, 95.05, 99.01])
+    assert profiler.percentiles("render") == pytest.approx([5.0, 5.0, 5.0])
+    assert all(math.isnan(v) for v in profiler.percentiles("capture"))
+
+
+def test_window_keeps_only_latest_samples():
+    profiler = makeProfiler(window=10)
+    # Hanya 91..100 ms yang tersisa di jendela; count tetap menghitung semua sampel.
+    stats = profiler.summary()["process"]
+    assert stats["count"] == 100
+    assert stats["mean_ms"] == pytest.approx(95.5)
+    assert (stats["p50_ms"], stats["max_ms"]) == pytest.approx((95.5, 100.0))
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = prm.StageProfiler(enabled=False)
+    profiler.record("process", 0.01)
+    with profiler.stage("render"):
+        pass
+    assert profiler.summary() == {} and profiler.order == []
+
+
+def test_stage_timer_records_elapsed_time():
+    profiler = prm.StageProfiler()
+    with profiler.stage("gesture"):
+        pass
+    stats = profiler.summary()["gesture"]
+    assert stats["count"] == 1 and 0.0 <= stats["max_ms"] < 100.0
+
+
+def test_export_csv(tmp_path):
+    path = str(tmp_path / "profil.csv")
+    makeProfiler().export(path)
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["stage"] for row in rows] == ["process", "render"]  # Urutan kemunculan pertama
+    assert list(rows[0]) == ["stage", "count", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"]
+    assert rows[0]["count"] == "100"
+    assert [float(rows[0][key]) for key in ("mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms")] == \
+        [50.5, 50.5, 95.05, 99.01, 100.0]
+
+
+def test_export_json(tmp_path):
+    path = str(tmp_path / "profil.json")
+    makeProfiler(window=200).export(path)
+    with open(path) as f:
+        data = json.load(f)
+    assert set(data) == {"machine", "window", "stages"}
+    assert set(data["machine"]) == {"node", "processor", "python"}
+    assert data["window"] == 200
+    assert list(data["stages"]) == ["process", "render"]
+    process = data["stages"]["process"]
+    assert set(process) == {"count", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"}
+    assert (process["p50_ms"], process["p95_ms"], process["p99_ms"]) == pytest.approx((50.5, 95.05, 99.01))
+    assert data["stages"]["render"]["max_ms"] == pytest.approx(5.0)
+
+
+def test_draw_hud_writes_on_frame():
+    img = np.zeros((200, 320, 3), dtype=np.uint8)
+    assert makeProfiler().drawHud(img) is img
+    assert img.any()
+
+
+def test_fps_counter():
+    counter = prm.FpsCounter(window=30)
+    assert counter.tick(0.0) == 0.0  # Satu frame: belum ada jarak antar frame
+    assert counter.tick(0.0) == 0.0  # Stempel waktu sama: tidak membagi dengan nol
+    counter = prm.FpsCounter(window=30)
+    fps = [counter.tick(i / 30) for i in range(100)]
+    assert fps[1:] == pytest.approx([30.0] * 99)
+    # Setelah penyangga penuh, hanya 30 frame terakhir yang dihitung: laju baru terbaca penuh setelah satu jendela.
+    fps = [counter.tick(100 / 30 + (i + 1) / 60) for i in range(60)]
+    assert 30.0 < fps[10] < 60.0
+    assert fps[-1] == pytest.approx(60.0)
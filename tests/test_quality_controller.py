@@ -0,0 +1,99 @@
+import QualityControllerModule as qcm
+
+OVER, UNDER, IN_BAND = 20.0, 1.0, 8.0  # Waktu proses (ms) terhadap target 10 ms: di atas, jauh di bawah, di pita
+
+
+def makeController(startLevel=1, **kwargs):
+    params = dict(targetMs=10, startLevel=startLevel, window=5, degradeAfter=3, upgradeAfter=4, maxUpgradeAfter=16)
+    params.update(kwargs)
+    return qcm.QualityController(**params)
+
+
+def feed(controller, ms, frames):
+    return [controller.update(ms / 1000.0) for _ in range(frames)]
+
+
+def test_degrades_after_window_and_degrade_after_frames():
+    controller = makeController()
+    # Keputusan pertama di frame ke-5 (jendela penuh), turun setelah 3 frame berturut-turut di atas anggaran.
+    assert feed(controller, OVER, 7) == [1] * 6 + [2]
+    assert controller.changes[-1][:3] == (7, 1, 2)
+
+
+def test_in_band_latency_keeps_level():
+    controller = makeController()
+    assert set(feed(controller, IN_BAND, 100)) == {1}
+    assert controller.changes == []
+
+
+def test_upgrades_after_upgrade_after_frames():
+    controller = makeController(startLevel=2)
+    assert feed(controller, UNDER, 8) == [2] * 7 + [1]
+
+
+def test_level_is_clamped_at_both_ends():
+    controller = makeController()
+    feed(controller, OVER, 200)
+    assert controller.level == len(qcm.LEVELS) - 1
+    feed(controller, UNDER, 1000)
+    assert controller.level == 0
+    controller.setLevel(99)
+    assert controller.level == len(qcm.LEVELS) - 1
+    controller.setLevel(-3)
+    assert controller.level == 0
+
+
+def test_failed_upgrade_doubles_wait_up_to_max():
+    controller = makeController(startLevel=2)
+    feed(controller, UNDER, 8)  # Naik ke tingkat 1
+    feed(controller, OVER, 7)  # Langsung turun lagi: kenaikan gagal
+    assert (controller.level, controller.upgradeAfter) == (2, 8)
+    # Kenaikan berikutnya butuh 4 frame pengisian jendela + 8 frame dengan ruang cukup.
+    assert feed(controller, UNDER, 12) == [2] * 11 + [1]
+    feed(controller, OVER, 7)
+    assert controller.upgradeAfter == 16
+    assert feed(controller, UNDER, 20)[-1] == 1
+    feed(controller, OVER, 7)
+    assert controller.upgradeAfter == 16  # Dibatasi maxUpgradeAfter
+
+
+def test_wait_resets_after_stable_period():
+    controller = makeController(startLevel=2)
+    feed(controller, UNDER, 8)
+    feed(controller, OVER, 7)
+    feed(controller, UNDER, 12)  # Naik lagi dengan penantian 8 frame
+    assert (controller.level, controller.upgradeAfter) == (1, 8)
+    feed(controller, IN_BAND, 4 * 8 + 1)  # Stabil lebih dari 4 x upgradeAfter frame setelah kenaikan
+    assert controller.upgradeAfter == 4
+
+
+class FakeSource():
+    def __init__(self):
+        self.requests = []
+
+    def requestResolution(self, w, h):
+        self.requests.append((w, h))
+
+
+class FakeDetector():
+    def __init__(self):
+        self.inputSize = None
+        self.modelComplexity = 1
+        self.configured = []
+
+    def configure(self, **settings):
+        self.configured.append(settings)
+        for key, value in settings.items():
+            setattr(self, key, value)
+
+
+def test_level_settings_are_applied_only_when_changed():
+    source, detector, seen = FakeSource(), FakeDetector(), []
+    controller = makeController(source=source, detector=detector, onChange=lambda level, settings: seen.append(level))
+    assert source.requests == [(640, 480)] and detector.configured == []
+    controller.setLevel(2)
+    assert source.requests == [(640, 480)]  # Resolusi sama: kamera tidak diminta ulang
+    assert detector.configured == [{"inputSize": 320}]
+    controller.setLevel(3)
+    assert detector.configured[-1] == {"modelComplexity": 0}
+    assert seen == [1, 2, 3]
@@ -0,0 +1,63 @@
+import numpy as np
+
+import ServingModule as svm
+
+
+class ListSource():
+    def __init__(self, frames):
+        self.frames = list(frames)
+
+    def read(self):
+        if not self.frames:
+            return False, None
+        return True, self.frames.pop(0)
+
+
+class ListQueue():
+    def __init__(self):
+        self.items = []
+
+    def put(self, item):
+        self.items.append(item)
+
+
+class FakeRing():
+    def __init__(self, shape):
+        self.frame = np.zeros(shape, dtype=np.uint8)
+
+    def buffer(self, slot):
+        return self.frame
+
+
+def runCapture(roundRobin, workers=3, frames=7):
+    # Menjalankan loop capture satu kamera tanpa proses pekerja; tugas dicatat per antrean pekerja.
+    images = [np.full((4, 4, 3), i, dtype=np.uint8) for i in range(frames)]
+    server = svm.HandServer([ListSource(images[1:])], workers=workers, dropFrames=True, roundRobin=roundRobin)
+    server.rings = [FakeRing(images[0].shape)]
+    server.taskQueues = [ListQueue() for _ in range(workers)]
+    server._free = [list(range(frames))]
+    server._captureLoop(0, images[0])
+    return server, [[task[1] for task in q.items] for q in server.taskQueues]
+
+
+def test_pinned_camera_uses_one_worker():
+    server, seqs = runCapture(roundRobin=False)
+    assert seqs == [list(range(7)), [], []]
+    assert "mode" not in server.detectorKwargs
+
+
+def test_round_robin_spreads_frames_over_workers():
+    server, seqs = runCapture(roundRobin=True)
+    assert seqs == [[0, 3, 6], [1, 4], [2, 5]]
+    assert server.detectorKwargs["mode"] is True  # Pekerja tidak melihat frame berurutan
+
+
+def test_results_are_reordered_per_camera():
+    server = svm.HandServer([ListSource([]), ListSource([])], workers=2, roundRobin=True)
+    server._free = [[], []]
+    server._nextSeq = [0, 0]
+    empty = np.zeros((0, 21, 3), dtype=np.float32)
+    for camId, seq in ((0, 1), (1, 0), (0, 2), (0, 0), (1, 1)):
+        server._accept((camId, seq, seq, 0.0, 0.0, empty, [], []))
+    assert [(r.camId, r.seq) for r in server._ready] == [(1, 0), (0, 0), (0, 1), (0, 2), (1, 1)]
+    assert server.served == [3, 2]
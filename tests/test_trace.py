@@ -0,0 +1,85 @@
+import os
+
+import numpy as np
+
+import TraceModule as tm
+import synthetic
+
+
+def test_replay_synthetic_trace_action_counts():
+    actuator, stats = tm.replayTrace(synthetic.syntheticTrace(seconds=30))
+    assert stats["frames"] == 900
+    counts = {name: actuator.count(name) for name in ("move", "click", "doubleClick", "toggle", "scroll")}
+    assert counts == {"move": 627, "click": 12, "doubleClick": 0, "toggle": 6, "scroll": 132}
+    toggles = [call[2] for call in actuator.calls if call[1] == "toggle"]
+    assert toggles == [("left", True), ("left", False)] * 3  # Setiap tombol yang ditekan dilepas lagi
+
+
+def test_recorder_round_trip_across_chunks(tmp_path):
+    trace = synthetic.syntheticTrace(seconds=3)
+    path = str(tmp_path / "sesi.npz")
+    with tm.TraceRecorder(path, 1, trace.frameSize, chunkSize=16) as recorder:
+        for i in range(len(trace)):
+            n = int(trace.counts[i])
+            recorder.record(trace.t[i], trace.landmarks[i, :n] if n else None, ["Right"] * n,
+                            trace.scores[i, :n].tolist())
+        assert len(recorder) == len(trace)
+        assert os.path.exists(recorder.partPath)  # Blok penuh sudah ditulis ke disk, tidak ditahan di memori
+    assert not os.path.exists(path + ".part")
+    loaded = tm.Trace.load(path)
+    assert loaded.frameSize == trace.frameSize
+    np.testing.assert_array_equal(loaded.t, trace.t)
+    np.testing.assert_array_equal(loaded.landmarks, trace.landmarks)
+    np.testing.assert_array_equal(loaded.handedness, trace.handedness)
+    np.testing.assert_array_equal(loaded.scores, trace.scores)
+
+
+def test_frame_size_is_recorded_per_frame(tmp_path):
+    # Resolusi capture turun ke setengah di tengah sesi (misal oleh QualityController).
+    trace = synthetic.syntheticTrace(seconds=30)
+    half = len(trace) // 2
+    landmarks = trace.landmarks.copy()
+    landmarks[half:, :, :, :2] *= 0.5
+    path = str(tmp_path / "sesi.npz")
+    with tm.TraceRecorder(path, 1, trace.frameSize) as recorder:
+        for i in range(len(trace)):
+            n = int(trace.counts[i])
+            recorder.record(trace.t[i], landmarks[i, :n] if n else None, ["Right"] * n,
+                            trace.scores[i, :n].tolist(), None if i < half else (320, 240))
+    loaded = tm.Trace.load(path)
+    assert loaded.frameSize == (640, 480)
+    assert loaded.frameSizes[:half].tolist() == [[640, 480]] * half
+    assert loaded.frameSizes[half:].tolist() == [[320, 240]] * (len(trace) - half)
+    # Pemetaan ke layar mengikuti ukuran tiap frame: posisi kursor sama dengan rekaman beresolusi penuh.
+    np.testing.assert_allclose(loaded.cursorTrace(), trace.cursorTrace(), atol=1e-3)
+    original, _ = tm.replayTrace(trace)
+    resized, _ = tm.replayTrace(loaded)
+    for name in ("click", "toggle"):
+        assert resized.count(name) == original.count(name)
+    moves = np.array([call[2] for call in resized.calls if call[1] == "move"])
+    expected = np.array([call[2] for call in original.calls if call[1] == "move"])
+    assert moves.shape == expected.shape
+    assert np.abs(moves - expected).max() < 10  # Selisih pembulatan piksel di frame setengah resolusi
+
+
+def test_trace_without_frame_sizes_uses_frame_size(tmp_path):
+    # Rekaman lama hanya punya satu frameSize untuk seluruh sesi.
+    trace = synthetic.syntheticTrace(seconds=1)
+    path = str(tmp_path / "lama.npz")
+    np.savez_compressed(path, t=trace.t, landmarks=trace.landmarks, handedness=trace.handedness,
+                        scores=trace.scores, frameSize=np.array(trace.frameSize, dtype=np.int32))
+    loaded = tm.Trace.load(path)
+    assert loaded.frameSizes.tolist() == [[640, 480]] * len(trace)
+
+
+def test_recorder_appends_npz_suffix_once(tmp_path):
+    # np.savez_compressed akan menambahkan ".npz" sendiri; path dinormalkan agar sesuai dengan file yang ditulis.
+    trace = synthetic.syntheticTrace(seconds=1)
+    with tm.TraceRecorder(str(tmp_path / "sesi"), 1, trace.frameSize, chunkSize=8) as recorder:
+        for i in range(len(trace)):
+            recorder.record(trace.t[i], None, [])
+        assert recorder.path == str(tmp_path / "sesi.npz")
+        assert recorder.partPath == str(tmp_path / "sesi.npz.part")
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["sesi.npz"]
+    assert len(tm.Trace.load(recorder.path)) == len(trace)
+    assert tm.npzPath(tmp_path / "a.npz") == str(tmp_path / "a.npz")